@@ -0,0 +1,77 @@
+"""
+Бенчмарк коллизий игрока с платформами: обход всех платформ (список)
+против выборки из SpatialGroup при росте карты от 600 до 100k клеток.
+
+Запуск:
+    python benchmarks/bench_collisions.py [--frames 300]
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+
+from game.platform import Platform
+from game.player import Player
+from game.spatial import SpatialGroup
+
+TILE = 128
+
+
+MAP_SIZES = ((30, 20), (100, 100), (400, 250))
+
+
+def make_platforms(columns, rows):
+    """Пол в пятом ряду и редкие блоки ниже него."""
+    platforms = []
+    for row in range(rows):
+        for column in range(columns):
+            if row == 4 or (row > 4 and (row * 7 + column * 13) % 5 == 0):
+                platforms.append(Platform(column * TILE, row * TILE, TILE, TILE))
+    return platforms
+
+
+def run(platforms, frames):
+    player = Player(TILE * 2, TILE * 2)
+    keys = {pygame.K_LEFT: 0, pygame.K_a: 0, pygame.K_RIGHT: 1, pygame.K_d: 0}
+    start = time.perf_counter()
+    for _ in range(frames):
+        player.handle_keys(keys, platforms)
+        player.update(platforms, [], 0)
+    return (time.perf_counter() - start) / frames * 1000.0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--frames", type=int, default=300)
+    args = parser.parse_args()
+
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+
+    print(f"{'клеток':>8} {'платформ':>9} {'список, ms':>11} {'индекс, ms':>11}")
+    with contextlib.redirect_stdout(io.StringIO()) as log:
+        rows = []
+        for columns, map_rows in MAP_SIZES:
+            cells = columns * map_rows
+            platforms = make_platforms(columns, map_rows)
+            list_ms = run(platforms, args.frames)
+            grid_ms = run(SpatialGroup(*platforms), args.frames)
+            rows.append((cells, len(platforms), list_ms, grid_ms))
+    del log
+    for cells, count, list_ms, grid_ms in rows:
+        print(f"{cells:>8} {count:>9} {list_ms:>11.3f} {grid_ms:>11.3f}")
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+Бенчмарк декодирования слоя TMX: прежний поэлементный цикл int.from_bytes
+против decode_layer_data (memoryview над распакованным буфером).
+
+Запуск:
+    python benchmarks/bench_decode_layer.py [--size 1000] [--repeat 5]
+"""
+
+import argparse
+import base64
+import os
+import random
+import statistics
+import sys
+import time
+import zlib
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from game.levels.tmx_loader import (
+    FLIPPED_HORIZONTALLY_FLAG,
+    GID_MASK,
+    TmxLayer,
+    decode_layer_data,
+)
+
+
+def legacy_decode(encoded_data):
+    """Алгоритм Level.decode_layer_data до перехода на tmx_loader."""
+    decoded = base64.b64decode(encoded_data)
+    decompressed = zlib.decompress(decoded)
+    tile_data = []
+    for i in range(0, len(decompressed), 4):
+        tile_data.append(int.from_bytes(decompressed[i:i + 4], "little") & GID_MASK)
+    return tile_data
+
+
+def make_layer(size, density=0.3, seed=1):
+    rng = random.Random(seed)
+    gids = bytearray()
+    for _ in range(size * size):
+        gid = rng.randint(1, 600) if rng.random() < density else 0
+        if gid and rng.random() < 0.1:
+            gid |= FLIPPED_HORIZONTALLY_FLAG
+        gids += gid.to_bytes(4, "little")
+    return base64.b64encode(zlib.compress(bytes(gids))).decode()
+
+
+def _median_ms(func, repeat):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples) * 1000.0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    encoded = make_layer(args.size)
+    assert list(decode_layer_data(encoded, "base64", "zlib")) == legacy_decode(encoded)
+
+    layer = TmxLayer(
+        "ground", args.size, args.size, decode_layer_data(encoded, "base64", "zlib")
+    )
+
+    print(f"Слой {args.size}x{args.size}")
+    print(f"legacy decode:       {_median_ms(lambda: legacy_decode(encoded), args.repeat):9.2f} ms")
+    print(f"decode_layer_data:   {_median_ms(lambda: decode_layer_data(encoded, 'base64', 'zlib'), args.repeat):9.2f} ms")
+    print(f"nonzero_indices:     {_median_ms(lambda: sum(1 for _ in layer.nonzero_indices()), args.repeat):9.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+Бенчмарк отрисовки спрайтов, смотрящих влево: pygame.transform.flip на
+каждый кадр (как было) против общего кэша AssetLoader.get_flipped.
+
+Считаются новые поверхности от flip за кадр и время отрисовки всех врагов
+level1 и игрока. "Без кэша" моделируется кэшем, который ничего не хранит.
+
+Запуск:
+    python benchmarks/bench_flip_cache.py [--frames 300]
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from game.simulation import init_headless
+
+init_headless(stub_pixels=False)
+
+import pygame
+
+from game.asset_loader import asset_loader
+from game.camera import Camera
+from game.levels.level1 import Level
+from game.player import Player
+
+
+class _NoCache(dict):
+    """Кэш, который ничего не запоминает: каждый get_flipped вызывает flip"""
+
+    def __setitem__(self, key, value):
+        pass
+
+
+def run(sprites, screen, camera, frames):
+    """Возвращает (поверхностей от flip за кадр, мс на кадр)"""
+    flip = pygame.transform.flip
+    calls = 0
+
+    def counting_flip(*args, **kwargs):
+        nonlocal calls
+        calls += 1
+        return flip(*args, **kwargs)
+
+    pygame.transform.flip = counting_flip
+    try:
+        start = time.perf_counter()
+        for _ in range(frames):
+            for sprite in sprites:
+                sprite.draw(screen, camera)
+        elapsed = time.perf_counter() - start
+    finally:
+        pygame.transform.flip = flip
+    return calls / frames, elapsed / frames * 1000.0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--frames", type=int, default=300)
+    args = parser.parse_args()
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        level = Level("level1")
+        player = Player(*level.player_spawn_point)
+    screen = pygame.Surface((1400, 800))
+    camera = Camera(player, screen.get_size())
+
+    # Все смотрят в "отражённую" сторону: игрок и слайм — влево, улитка и муха — вправо
+    player.facing_right = False
+    sprites = [player]
+    for enemy in level.enemies:
+        enemy.facing_right = type(enemy).__name__ in ("Snail", "Fly")
+        sprites.append(enemy)
+
+    cache = asset_loader.flip_cache
+    asset_loader.flip_cache = _NoCache()
+    before = run(sprites, screen, camera, args.frames)
+    asset_loader.flip_cache = cache
+    run(sprites, screen, camera, 1)  # прогрев: копии создаются один раз
+    after = run(sprites, screen, camera, args.frames)
+
+    print(f"спрайтов: {len(sprites)}, кадров: {args.frames}")
+    print(f"{'':10} {'flip за кадр':>13} {'мс на кадр':>11}")
+    print(f"{'без кэша':10} {before[0]:>13.1f} {before[1]:>11.3f}")
+    print(f"{'с кэшем':10} {after[0]:>13.1f} {after[1]:>11.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+Бенчмарк безголовых сессий: сколько шагов симуляции и сессий level1 в
+минуту выдаёт GameSession без окна и декодирования пикселей.
+
+Запуск:
+    python benchmarks/bench_headless.py [--sessions 20] [--frames 1800]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from game.simulation import FrameInput, GameSession
+
+
+def random_inputs(seed, frames):
+    """Случайный, но воспроизводимый ввод: удержание направления и прыжки"""
+    rng = random.Random(seed)
+    inputs = []
+    direction = FrameInput(right=True)
+    for _ in range(frames):
+        if rng.random() < 0.02:
+            direction = rng.choice(
+                (FrameInput(), FrameInput(left=True), FrameInput(right=True))
+            )
+        inputs.append(
+            FrameInput(
+                left=direction.left,
+                right=direction.right,
+                jump=rng.random() < 0.03,
+            )
+        )
+    return inputs
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sessions", type=int, default=20)
+    parser.add_argument("--frames", type=int, default=1800)
+    parser.add_argument("--level", default="level1")
+    args = parser.parse_args()
+
+    steps = 0
+    completed = 0
+    start = time.perf_counter()
+    for seed in range(args.sessions):
+        session = GameSession(args.level)
+        steps += session.run(random_inputs(seed, args.frames))
+        completed += session.completed
+    elapsed = time.perf_counter() - start
+
+    print(f"Сессий: {args.sessions}, шагов: {steps}, пройдено: {completed}")
+    print(f"Время: {elapsed:.2f} с")
+    print(f"Шагов в секунду: {steps / elapsed:,.0f}")
+    print(f"Сессий в минуту ({args.frames} шагов): {args.sessions / elapsed * 60:,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Бенчмарк простоя в главном меню: процессорное время и число перерисовок за
+несколько секунд без ввода — цикл на 60 FPS (idle_wait_ms = 0, как было)
+против ожидания события в pygame.event.wait.
+
+Процессорное время процесса — косвенная оценка энергопотребления: пока
+процесс спит в event.wait, ядро может уйти в состояние простоя.
+
+Запуск:
+    python benchmarks/bench_idle_menu.py [--seconds 5]
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+from main import RPGPlatformer
+
+
+def run(game, idle_wait_ms, seconds):
+    """Возвращает (доля загрузки CPU, перерисовок в секунду)"""
+    game.idle_wait_ms = idle_wait_ms
+    game.idle_drawn_state = None
+    draws = 0
+    draw = game.draw
+
+    def counting_draw():
+        nonlocal draws
+        draws += 1
+        draw()
+
+    game.draw = counting_draw
+    try:
+        game.clock.tick()
+        cpu_start = time.process_time()
+        start = time.perf_counter()
+        while time.perf_counter() - start < seconds:
+            game.run_frame()
+        wall = time.perf_counter() - start
+        cpu = time.process_time() - cpu_start
+    finally:
+        game.draw = draw
+    return cpu / wall, draws / wall
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--seconds", type=float, default=5.0)
+    args = parser.parse_args()
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        game = RPGPlatformer()
+    idle_wait_ms = game.idle_wait_ms or 500
+
+    before = run(game, 0, args.seconds)
+    after = run(game, idle_wait_ms, args.seconds)
+
+    print(f"меню без ввода, {args.seconds:.0f} с")
+    print(f"{'':22} {'CPU, %':>8} {'кадров/с':>9}")
+    print(f"{'каждый кадр (60 FPS)':22} {before[0] * 100:>8.1f} {before[1]:>9.1f}")
+    print(f"{'ожидание события':22} {after[0] * 100:>8.1f} {after[1]:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+Бенчмарк загрузки уровня: холодный старт (разбор TMX + компиляция кэша)
+против тёплого (mmap готового .lvlc).
+
+Запуск:
+    python benchmarks/bench_level_cache.py [--repeat 20] [--level level1]
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+
+from game.path_utils import resource_path
+from game.levels import level_cache
+
+
+def _median_ms(samples):
+    return statistics.median(samples) * 1000.0
+
+
+def bench_map_load(tmx_path, repeat):
+    """Только данные карты: без спрайтов и поверхностей."""
+    cache_dir = tempfile.mkdtemp(prefix="lvlc_bench_")
+    cold, warm = [], []
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            for _ in range(repeat):
+                shutil.rmtree(cache_dir, ignore_errors=True)
+                start = time.perf_counter()
+                level_cache.load_map(tmx_path, cache_dir=cache_dir)
+                cold.append(time.perf_counter() - start)
+
+                start = time.perf_counter()
+                level_cache.load_map(tmx_path, cache_dir=cache_dir)
+                warm.append(time.perf_counter() - start)
+    finally:
+        shutil.rmtree(cache_dir, ignore_errors=True)
+    return _median_ms(cold), _median_ms(warm)
+
+
+def bench_level_init(level_name, tmx_path, repeat):
+    """Полный Level.__init__ (включая спрайты) с пустым и заполненным кэшем."""
+    from game.levels.level1 import Level
+
+    cache_path = level_cache.get_cache_path(tmx_path)
+    cold, warm = [], []
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(repeat):
+            if os.path.exists(cache_path):
+                os.remove(cache_path)
+            start = time.perf_counter()
+            Level(level_name)
+            cold.append(time.perf_counter() - start)
+
+            start = time.perf_counter()
+            Level(level_name)
+            warm.append(time.perf_counter() - start)
+    return _median_ms(cold), _median_ms(warm)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--level", default="level1")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    tmx_path = resource_path("game", "assets", "levels", f"{args.level}.tmx")
+
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+
+    cold, warm = bench_map_load(tmx_path, args.repeat)
+    print(f"map load   cold: {cold:8.3f} ms   warm: {warm:8.3f} ms   x{cold / warm:.1f}")
+
+    try:
+        cold, warm = bench_level_init(args.level, tmx_path, args.repeat)
+    except FileNotFoundError as e:
+        print(f"Level()    пропущено: {e}")
+    else:
+        print(f"Level()    cold: {cold:8.3f} ms   warm: {warm:8.3f} ms   x{cold / warm:.1f}")
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+Бенчмарк пакетной загрузки изображений: последовательные load_image (как при
+первом обращении посреди игры) против AssetLoader.preload, который декодирует
+файлы в пуле потоков и доводит их convert_alpha в главном потоке.
+
+Набор изображений: манифесты уровня и HUD (game/asset_manifest.py) и
+tilesets карты.
+
+Кэш AssetLoader сбрасывается перед каждым прогоном («холодный старт» в
+процессе; страничный кэш ОС при этом остаётся тёплым).
+
+Запуск:
+    python benchmarks/bench_preload.py [--repeat 10] [--workers N]
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import statistics
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+
+from game.asset_loader import asset_loader
+from game.asset_manifest import MANIFESTS, map_images, resolve
+from game.levels.level_cache import load_map
+from game.path_utils import resource_path
+
+
+def build_manifest(level_name):
+    tmx_map = load_map(resource_path("game", "assets", "levels", f"{level_name}.tmx"))
+    return resolve(MANIFESTS["level"] + MANIFESTS["hud"] + tuple(map_images(tmx_map)))
+
+
+def _sequential(manifest, workers):
+    for name, scale in manifest:
+        asset_loader.load_image(name, scale)
+
+
+def _parallel(manifest, workers):
+    asset_loader.preload(manifest, workers=workers)
+
+
+def bench(load, manifest, repeat, workers):
+    samples = []
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(repeat):
+            asset_loader.assets.clear()
+            start = time.perf_counter()
+            load(manifest, workers)
+            samples.append(time.perf_counter() - start)
+    return statistics.median(samples) * 1000.0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--level", default="level1")
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+
+    manifest = build_manifest(args.level)
+    count = len({name for name, _scale in manifest})
+
+    sequential = bench(_sequential, manifest, args.repeat, args.workers)
+    parallel = bench(_parallel, manifest, args.repeat, args.workers)
+    print(f"изображений: {count}, CPU: {os.cpu_count()}")
+    print(f"последовательно: {sequential:8.2f} ms")
+    print(f"preload:         {parallel:8.2f} ms   x{sequential / parallel:.2f}")
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,388 @@
+"""
+Набор бенчмарков горячих путей: Level.__init__, Player.update по группе
+платформ, AssetLoader.get_tile_image и Level.draw на синтетических картах
+1x, 10x и 100x от level1 (level1, повторённый сеткой). Запускается без окна.
+
+Каждый замер сначала выполняется один раз без учёта (прогрев кэшей ресурсов
+и карт), затем печатаются операции в секунду (медиана повторов), разброс
+повторов и пик памяти Python-объектов по tracemalloc (пиксели поверхностей
+SDL он не видит). Результаты сравниваются с benchmarks/baseline.json.
+
+Пик памяти детерминирован, и его рост больше --tolerance завершает запуск с
+кодом 1. Скорость между запусками на одной машине плавает, поэтому у неё две
+границы. Падение больше допуска (не меньше SPREAD_FACTOR разбросов — своего и
+baseline) печатается как предупреждение, с --strict-speed — ошибка.
+Грубое замедление — в GROSS_SLOWDOWN раз или в 1 + SPREAD_FACTOR * разброс,
+если это больше, — всегда завершает запуск с кодом 1.
+
+Baseline записывается по --rounds прогонам набора: медиана по прогонам, а
+разброс учитывает и расхождение между прогонами, а не только между повторами.
+
+Запуск:
+    python benchmarks/run_benchmarks.py                     # сравнить с baseline
+    python benchmarks/run_benchmarks.py --update-baseline   # записать baseline
+    python benchmarks/run_benchmarks.py --strict-speed      # скорость тоже гейт
+    python benchmarks/run_benchmarks.py --scales 1x,10x --repeat 3
+"""
+
+import argparse
+import contextlib
+import copy
+import io
+import json
+import os
+import platform
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from game.simulation import init_headless
+
+init_headless(stub_pixels=False)
+
+import pygame
+
+from game.asset_loader import asset_loader
+from game.camera import Camera
+from game.levels.level1 import Level
+from game.levels.level_cache import load_map
+from game.levels.tmx_loader import TmxLayer, TmxObject, TmxObjectGroup, write_tmx
+from game.path_utils import resource_path
+from game.player import Player
+from game.simulation import KeyState
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+LEVEL1_PATH = resource_path("game", "assets", "levels", "level1.tmx")
+
+# Масштаб -> (повторов по горизонтали, по вертикали)
+SCALES = {"1x": (1, 1), "10x": (5, 2), "100x": (10, 10)}
+SCREEN_SIZE = (1400, 800)
+PLAYER_FRAMES = 600
+# Допуск по скорости — не меньше стольких относительных разбросов повторов
+SPREAD_FACTOR = 3
+# Замедление во столько раз — регрессия при любом шуме (на одной машине
+# скорость между запусками плавает до двух с лишним раз)
+GROSS_SLOWDOWN = 3.0
+DRAW_FRAMES = 120
+TILE_IMAGE_CALLS = 100_000
+
+
+def tile_map(base_map, repeat_x, repeat_y):
+    """Карта из base_map, повторённой сеткой repeat_x x repeat_y (игрок — один)"""
+    tiled = copy.copy(base_map)
+    tiled.width = base_map.width * repeat_x
+    tiled.height = base_map.height * repeat_y
+    tiled.layers = []
+    for layer in base_map.layers:
+        rows = []
+        data = list(layer.data)
+        for _ in range(repeat_y):
+            for y in range(layer.height):
+                row = data[y * layer.width : (y + 1) * layer.width]
+                rows.extend(row * repeat_x)
+        tiled.layers.append(
+            TmxLayer(layer.name, layer.width * repeat_x, layer.height * repeat_y, rows)
+        )
+
+    tiled.objectgroups = []
+    next_id = 1
+    for group in base_map.objectgroups:
+        objects = []
+        for ty in range(repeat_y):
+            for tx in range(repeat_x):
+                dx = tx * base_map.pixel_width
+                dy = ty * base_map.pixel_height
+                for obj in group.objects:
+                    if obj.type == "player" and (tx or ty):
+                        continue
+                    objects.append(
+                        TmxObject(
+                            id=next_id,
+                            name=obj.name,
+                            type=obj.type,
+                            x=obj.x + dx,
+                            y=obj.y + dy,
+                            width=obj.width,
+                            height=obj.height,
+                            gid=obj.gid,
+                            properties=dict(obj.properties),
+                        )
+                    )
+                    next_id += 1
+        tiled.objectgroups.append(TmxObjectGroup(group.name, objects))
+    return tiled
+
+
+def write_scaled_maps(directory, scales):
+    base_map = load_map(LEVEL1_PATH)
+    paths = {}
+    for scale in scales:
+        path = os.path.join(directory, f"bench_{scale}.tmx")
+        write_tmx(tile_map(base_map, *SCALES[scale]), path)
+        paths[scale] = path
+    return paths
+
+
+def measure(run, repeat):
+    """
+    run() выполняет замер и возвращает число операций.
+    Возвращает (медиана операций в секунду, относительный разброс повторов,
+    пик памяти в КиБ). Разброс — (max - min) / (2 * медиана).
+    """
+    # Прогрев: первый вызов загружает ресурсы и заполняет кэши, которые в
+    # игре уже прогреты; иначе порядок замеров менял бы результат
+    run()
+
+    rates = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        ops = run()
+        rates.append(ops / (time.perf_counter() - start))
+    median = statistics.median(rates)
+    spread = (max(rates) - min(rates)) / (2 * median)
+
+    # Память отдельно: tracemalloc заметно замедляет код
+    tracemalloc.start()
+    run()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return median, spread, peak / 1024.0
+
+
+def bench_level_init(name, path):
+    def run():
+        Level(name, path)
+        return 1
+
+    return run
+
+
+def bench_player_update(level):
+    """Бег вправо с прыжками по платформам уровня"""
+    spawn = level.player_spawn_point
+    keys = KeyState((pygame.K_RIGHT,))
+    jump = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_SPACE)
+
+    def run():
+        player = Player(*spawn)
+        for frame in range(PLAYER_FRAMES):
+            if frame % 40 == 0:
+                player.handle_event(jump)
+            player.handle_keys(keys, level.platforms)
+            player.update(level.platforms, level.enemies, frame / 60, level.traps)
+        return PLAYER_FRAMES
+
+    return run
+
+
+def bench_tile_image(level, cold):
+    """get_tile_image для всех платформ уровня: из кэша или с масштабированием"""
+    platforms = level.platforms.sprites()
+    # Несколько проходов, чтобы замер не тонул в шуме таймера
+    passes = max(1, TILE_IMAGE_CALLS // max(len(platforms), 1))
+
+    def run():
+        for _ in range(passes):
+            if cold:
+                asset_loader.tile_cache.clear()
+            for platform in platforms:
+                platform.get_tile_image(platform.platform_type, platform.rect.size)
+        return passes * len(platforms)
+
+    return run
+
+
+def bench_level_draw(level, screen):
+    """Камера проходит карту по диагонали"""
+    target = Player(*level.player_spawn_point)
+    camera = Camera(target, SCREEN_SIZE)
+    max_x = max(level.width - SCREEN_SIZE[0], 1)
+    max_y = max(level.height - SCREEN_SIZE[1], 1)
+
+    def run():
+        for frame in range(DRAW_FRAMES):
+            t = frame / (DRAW_FRAMES - 1)
+            camera.offset.update(int(max_x * t), int(max_y * t))
+            level.draw(screen, camera)
+        return DRAW_FRAMES
+
+    return run
+
+
+def run_suite(scales, repeat):
+    screen = pygame.Surface(SCREEN_SIZE)
+    results = {}
+    tmp = tempfile.mkdtemp(prefix="bench_levels_")
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            paths = write_scaled_maps(tmp, scales)
+        for scale in scales:
+            name = f"bench_{scale}"
+            with contextlib.redirect_stdout(io.StringIO()):
+                level = Level(name, paths[scale])  # заодно компилирует .lvlc
+                benches = {
+                    "level_init": bench_level_init(name, paths[scale]),
+                    "player_update": bench_player_update(level),
+                    "tile_image_cached": bench_tile_image(level, cold=False),
+                    "tile_image_cold": bench_tile_image(level, cold=True),
+                    "level_draw": bench_level_draw(level, screen),
+                }
+                for bench, run in benches.items():
+                    ops, spread, peak_kib = measure(run, repeat)
+                    results[f"{bench}[{scale}]"] = {
+                        "ops_per_sec": round(ops, 2),
+                        "spread": round(spread, 3),
+                        "peak_kib": round(peak_kib, 1),
+                    }
+            for bench in benches:
+                key = f"{bench}[{scale}]"
+                print(
+                    f"{key:28} {results[key]['ops_per_sec']:>14,.1f} ops/s"
+                    f" ±{results[key]['spread']:>5.0%}"
+                    f" {results[key]['peak_kib']:>12,.1f} KiB"
+                )
+            del level
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+    return results
+
+
+def merge_rounds(rounds):
+    """
+    Сводит результаты нескольких прогонов набора: медианы скорости и памяти,
+    разброс — наибольший из разбросов повторов и расхождения между прогонами.
+    """
+    merged = {}
+    for key in rounds[0]:
+        rates = [results[key]["ops_per_sec"] for results in rounds]
+        median = statistics.median(rates)
+        spread = max(
+            [results[key]["spread"] for results in rounds]
+            + [(max(rates) - min(rates)) / (2 * median)]
+        )
+        merged[key] = {
+            "ops_per_sec": round(median, 2),
+            "spread": round(spread, 3),
+            "peak_kib": round(
+                statistics.median(results[key]["peak_kib"] for results in rounds), 1
+            ),
+        }
+    return merged
+
+
+def speed_tolerance(current, reference, tolerance):
+    """Допуск по скорости: не меньше tolerance и SPREAD_FACTOR разбросов"""
+    spread = max(current.get("spread", 0.0), reference.get("spread", 0.0))
+    return min(max(tolerance, SPREAD_FACTOR * spread), 0.9)
+
+
+def gross_slowdown(current, reference):
+    """Во сколько раз должна упасть скорость, чтобы это было ошибкой всегда"""
+    spread = max(current.get("spread", 0.0), reference.get("spread", 0.0))
+    return max(GROSS_SLOWDOWN, 1 + SPREAD_FACTOR * spread)
+
+
+def compare(results, baseline, tolerance):
+    """
+    Сравнение с baseline (допуск — доля, например 0.25).
+    Возвращает (регрессии: память и грубые замедления, замедления в полосе шума).
+    """
+    regressions = []
+    slowdowns = []
+    for key, current in results.items():
+        reference = baseline.get(key)
+        if reference is None:
+            continue
+        speed_limit = speed_tolerance(current, reference, tolerance)
+        gross_limit = gross_slowdown(current, reference)
+        if current["ops_per_sec"] * gross_limit < reference["ops_per_sec"]:
+            regressions.append(
+                f"{key}: {current['ops_per_sec']:,.1f} ops/s "
+                f"(baseline {reference['ops_per_sec']:,.1f}, "
+                f"медленнее больше чем в {gross_limit:.1f} раза)"
+            )
+        elif current["ops_per_sec"] < reference["ops_per_sec"] * (1 - speed_limit):
+            slowdowns.append(
+                f"{key}: {current['ops_per_sec']:,.1f} ops/s "
+                f"(baseline {reference['ops_per_sec']:,.1f}, допуск {speed_limit:.0%})"
+            )
+        # Память меньше 64 КиБ — шум аллокатора, не сравниваем
+        if reference["peak_kib"] >= 64 and current["peak_kib"] > reference[
+            "peak_kib"
+        ] * (1 + tolerance):
+            regressions.append(
+                f"{key}: {current['peak_kib']:,.1f} KiB "
+                f"(baseline {reference['peak_kib']:,.1f})"
+            )
+    return regressions, slowdowns
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--scales", default=",".join(SCALES))
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument("--tolerance", type=float, default=0.3)
+    parser.add_argument("--update-baseline", action="store_true")
+    parser.add_argument(
+        "--rounds", type=int, default=3, help="прогонов набора для --update-baseline"
+    )
+    parser.add_argument("--strict-speed", action="store_true")
+    args = parser.parse_args()
+
+    scales = [scale.strip() for scale in args.scales.split(",") if scale.strip()]
+    unknown = [scale for scale in scales if scale not in SCALES]
+    if unknown:
+        parser.error(f"неизвестные масштабы: {', '.join(unknown)}")
+
+    if args.update_baseline:
+        rounds = []
+        for index in range(max(args.rounds, 1)):
+            print(f"— прогон {index + 1}/{max(args.rounds, 1)}")
+            rounds.append(run_suite(scales, args.repeat))
+        results = merge_rounds(rounds)
+        data = {
+            "machine": {
+                "python": platform.python_version(),
+                "pygame": pygame.version.ver,
+                "platform": platform.platform(),
+            },
+            "results": results,
+        }
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2, sort_keys=True)
+            f.write("\n")
+        print(f"📌 Baseline сохранён: {args.baseline}")
+        return 0
+
+    results = run_suite(scales, args.repeat)
+
+    if not os.path.exists(args.baseline):
+        print(f"⚠️ Baseline не найден: {args.baseline} (запустите --update-baseline)")
+        return 0
+
+    with open(args.baseline, encoding="utf-8") as f:
+        baseline = json.load(f)["results"]
+    regressions, slowdowns = compare(results, baseline, args.tolerance)
+    if args.strict_speed:
+        regressions += slowdowns
+    elif slowdowns:
+        print("⚠️ Замедления (не ошибка без --strict-speed):")
+        for line in slowdowns:
+            print(f"  - {line}")
+    if regressions:
+        print("❌ Регрессии больше допуска:")
+        for line in regressions:
+            print(f"  - {line}")
+        return 1
+    print("✅ Регрессий относительно baseline нет")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -17,6 +17,15 @@ if errorlevel 1 (
     exit /b 1
 )
 
+REM Check that every image in the asset manifest exists with exact casing
+python -m game.asset_manifest
+if errorlevel 1 (
+    echo ERROR: Asset manifest check failed! Fix the paths listed above.
+    echo.
+    pause
+    exit /b 1
+)
+
 echo Using PyInstaller to build the executable...
 echo.
 
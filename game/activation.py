@@ -0,0 +1,83 @@
+# game/activation.py
+"""
+Активация объектов по секторам карты.
+
+ActivationGroup — SpatialGroup, который дополнительно раскладывает спрайты по
+крупным секторам SECTOR_SIZE x SECTOR_SIZE. Каждый тик обновляются только
+спрайты из секторов, пересекающих активную область вокруг игрока; остальные
+спят и не стоят ничего: их даже не перебирают.
+
+Проснувшийся спрайт догоняет пропущенные тики — они прогоняются через тот же
+шаг, что и обычный апдейт (не больше max_catchup за раз). Поэтому состояние
+после пробуждения зависит только от числа тиков, а не от того, где бродил
+игрок, и прогоны с одинаковым вводом совпадают.
+"""
+
+from .spatial import SpatialGroup, SpatialHash
+
+
+SECTOR_SIZE = 1024
+
+
+class ActivationGroup(SpatialGroup):
+    def __init__(self, *sprites, sector_size=SECTOR_SIZE, **kwargs):
+        self.sectors = SpatialHash(sector_size)
+        self.tick = 0
+        self._last_tick = {}  # sprite -> последний тик, на котором он обновлён
+        super().__init__(*sprites, **kwargs)
+
+    def add_internal(self, sprite, layer=None):
+        super().add_internal(sprite, layer)
+        self.sectors.insert(sprite, sprite.rect)
+        # Новый спрайт не догоняет время, прошедшее до его появления
+        self._last_tick[sprite] = self.tick
+
+    def remove_internal(self, sprite):
+        super().remove_internal(sprite)
+        self.sectors.remove(sprite)
+        self._last_tick.pop(sprite, None)
+
+    def refresh(self, sprite=None):
+        super().refresh(sprite)
+        if sprite is not None:
+            if sprite in self.sectors:
+                self.sectors.move(sprite, sprite.rect)
+            return
+        for member in self.sprites():
+            self.sectors.move(member, member.rect)
+
+    def active(self, rect):
+        """Спрайты из секторов, пересекающих rect, в порядке добавления в группу."""
+        return self.sectors.query(rect)
+
+    def update_active(self, rect, dt, step, max_catchup, step_many=None):
+        """
+        Продвигает группу на один тик: step(sprite, dt) вызывается для спрайтов
+        активных секторов, а проснувшиеся сначала догоняют пропущенные тики.
+        Если задан step_many(sprites, dt), текущий тик всех активных спрайтов
+        выполняется им одним вызовом (пакетная физика). Возвращает число
+        обновлённых спрайтов.
+        """
+        self.tick += 1
+        tick = self.tick
+        last_tick = self._last_tick
+        current = []
+        for sprite in self.active(rect):
+            for _ in range(min(tick - last_tick[sprite] - 1, max_catchup)):
+                step(sprite, dt)
+                if sprite not in last_tick:  # убит во время шага
+                    break
+            else:
+                current.append(sprite)
+
+        if step_many is not None:
+            step_many(current, dt)
+        else:
+            for sprite in current:
+                step(sprite, dt)
+
+        for sprite in current:
+            if sprite in last_tick:
+                last_tick[sprite] = tick
+                self.refresh(sprite)
+        return len(current)
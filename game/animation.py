@@ -0,0 +1,176 @@
+# game/animation.py
+"""
+Анимации по времени: клипы кадров и проигрыватель.
+
+AnimationClip — неизменяемый набор кадров с частотой fps; кадр выбирается по
+прошедшему времени, поэтому скорость анимации не зависит от частоты тиков.
+Отражённые кадры (спрайт смотрит в другую сторону) готовятся вместе с
+клипом. Animator хранит текущий клип и время внутри него.
+
+Наборы клипов описаны в CLIP_SETS и загружаются один раз (preload_clips при
+создании уровня): кадры удара и смерти не читаются с диска посреди игры.
+"""
+
+from dataclasses import dataclass, field
+
+from .asset_loader import asset_loader
+
+# Погрешность при переводе времени в номер кадра: 5 тиков по 1/60 с должны
+# давать ровно кадр клипа 12 fps, хотя сумма float чуть меньше 5/60
+_EPSILON = 1e-9
+
+# name -> (масштаб, {клип: (пути кадров, fps, зацикленный)})
+CLIP_SETS = {
+    "player": (
+        0.6,
+        {
+            "idle": (("player/alienPink_front.png",), 0, True),
+            "run": (
+                (
+                    "player/alienPink_stand.png",
+                    "player/alienPink_walk1.png",
+                    "player/alienPink_walk2.png",
+                ),
+                12,
+                True,
+            ),
+            "jump": (("player/alienPink_jump.png",), 0, True),
+            # Приземление — один короткий кадр, затем idle
+            "land": (("player/alienPink_duck.png",), 60, False),
+        },
+    ),
+    "slime": (
+        0.6,
+        {
+            "idle": (("enemies/slimePurple.png",), 0, True),
+            # Пульсация при движении: стоит/движется по очереди
+            "move": (("enemies/slimePurple.png", "enemies/slimePurple_move.png"), 8, True),
+            "hurt": (("enemies/slimePurple_hit.png",), 0, True),
+            "dead": (("enemies/slimePurple_dead.png",), 0, True),
+        },
+    ),
+    "snail": (
+        0.6,
+        {
+            "idle": (("enemies/snail.png",), 0, True),
+            "dead": (("enemies/snail_shell.png",), 0, True),
+        },
+    ),
+    "fly": (
+        0.6,
+        {
+            "fly": (("enemies/fly.png", "enemies/fly_move1.png"), 12, True),
+            "dead": (("enemies/fly_dead.png",), 0, True),
+        },
+    ),
+    "saw": (
+        1,
+        {
+            "spin": (("enemies/sawHalf.png", "enemies/sawHalf_move.png"), 10, True),
+        },
+    ),
+}
+
+
+@dataclass(frozen=True)
+class AnimationClip:
+    frames: tuple
+    fps: float = 0  # 0 — статичный кадр
+    loop: bool = True
+    # Те же кадры, отражённые по горизонтали (общие копии из AssetLoader)
+    mirrored_frames: tuple = field(default=(), compare=False)
+
+    @classmethod
+    def from_frames(cls, frames, fps=0, loop=True):
+        frames = tuple(frames)
+        mirrored = tuple(asset_loader.get_flipped(frame) for frame in frames)
+        return cls(frames, fps, loop, mirrored)
+
+    @property
+    def duration(self):
+        """Длительность одного проигрывания в секундах (0 для статичного кадра)"""
+        return len(self.frames) / self.fps if self.fps else 0.0
+
+    def frame_index(self, time):
+        if not self.fps or len(self.frames) == 1:
+            return 0
+        index = int(time * self.fps + _EPSILON)
+        if self.loop:
+            return index % len(self.frames)
+        return min(index, len(self.frames) - 1)
+
+    def is_finished(self, time):
+        """Незацикленный клип доиграл до конца"""
+        return not self.loop and time * self.fps + _EPSILON >= len(self.frames)
+
+    def frame(self, time, mirrored=False):
+        frames = self.mirrored_frames if mirrored else self.frames
+        return frames[self.frame_index(time)]
+
+
+class Animator:
+    """Текущий клип сущности и время, прошедшее с его начала"""
+
+    def __init__(self, clips, state):
+        self.clips = clips
+        self.state = state
+        self.time = 0.0
+
+    @property
+    def clip(self):
+        return self.clips[self.state]
+
+    @property
+    def finished(self):
+        return self.clip.is_finished(self.time)
+
+    def play(self, state):
+        """Переключает клип; повторный вызов с тем же клипом его не сбрасывает"""
+        if state != self.state:
+            self.state = state
+            self.time = 0.0
+
+    def update(self, dt):
+        self.time += dt
+
+    def image(self, mirrored=False):
+        return self.clip.frame(self.time, mirrored)
+
+
+def load_clips(name):
+    """
+    Клипы набора name из CLIP_SETS. Загружаются один раз и разделяются между
+    всеми сущностями (кэш AssetLoader сбрасывается при смене stub_pixels).
+    """
+    clips = asset_loader.clip_sets.get(name)
+    if clips is None:
+        scale, specs = CLIP_SETS[name]
+        clips = {
+            state: AnimationClip.from_frames(
+                (asset_loader.load_image(path, scale) for path in paths), fps, loop
+            )
+            for state, (paths, fps, loop) in specs.items()
+        }
+        asset_loader.clip_sets[name] = clips
+    return clips
+
+
+def clip_manifest(names=None):
+    """Пары (путь кадра, масштаб) наборов клипов для AssetLoader.preload"""
+    manifest = []
+    for name in names or CLIP_SETS:
+        scale, specs = CLIP_SETS[name]
+        for paths, _fps, _loop in specs.values():
+            manifest.extend((path, scale) for path in paths)
+    return manifest
+
+
+def preload_clips(names=None):
+    """Загружает наборы клипов заранее (по умолчанию все из CLIP_SETS)"""
+    names = [name for name in names or CLIP_SETS if name not in asset_loader.clip_sets]
+    if not names:
+        return
+    # Кадры декодируются параллельно, затем собираются в клипы
+    asset_loader.preload(clip_manifest(names))
+    for name in names:
+        load_clips(name)
@@ -1,20 +1,130 @@
 # game/asset_loader.py
 import os
+import struct
+import weakref
+from concurrent.futures import ThreadPoolExecutor
 
 import pygame
 
 from game.path_utils import resource_path
 
+# Потоков декодирования по умолчанию: по одному на ядро, не больше 8
+DECODE_WORKERS = min(8, os.cpu_count() or 1)
+
 
 class AssetLoader:
     def __init__(self):
         self.assets = {}
         self.tilesets = {}  # храним tilesets
+        # Атлас тайлов: GID -> (имя tileset, прямоугольник тайла в изображении)
+        self.tile_index = {}
+        # Общие поверхности тайлов по ключу (gid, size)
+        self.tile_cache = {}
+        # Отражённые по горизонтали копии: исходная поверхность -> копия
+        # (слабые ключи: копия живёт, пока жив оригинал)
+        self.flip_cache = weakref.WeakKeyDictionary()
+        # Наборы клипов анимации по имени (game/animation.py)
+        self.clip_sets = {}
+        # Безголовый режим: пиксели не декодируются, вместо изображений
+        # создаются пустые поверхности того же размера
+        self.stub_pixels = False
         # PyInstaller-совместимый базовый путь к ресурсам
         self.base_path = resource_path("game", "assets")
         print(f"🔄 AssetLoader base path: {self.base_path}")
 
-    def load_image(self, name, scale=1):
+    def set_stub_pixels(self, enabled):
+        """
+        Включает или выключает безголовый режим загрузки. При смене режима
+        кэши сбрасываются, чтобы пустые поверхности не смешивались с реальными.
+        """
+        enabled = bool(enabled)
+        if enabled == self.stub_pixels:
+            return
+        self.stub_pixels = enabled
+        self.assets.clear()
+        self.tilesets.clear()
+        self.tile_index.clear()
+        self.tile_cache.clear()
+        self.flip_cache.clear()
+        self.clip_sets.clear()
+
+    def decode_image(self, name):
+        """
+        Чтение и декодирование изображения без convert_alpha. Окно для этого
+        не нужно, поэтому метод можно вызывать из рабочего потока; результат
+        передаётся в load_image/load_tileset (decoded=...) в главном потоке.
+        """
+        path = os.path.join(self.base_path, name)
+        if self.stub_pixels:
+            return pygame.Surface(read_image_size(path), pygame.SRCALPHA)
+        return pygame.image.load(path)
+
+    def decode_images(self, names, workers=None):
+        """
+        Параллельное декодирование нескольких изображений: имя -> поверхность.
+        pygame.image.load отпускает GIL на чтении файла и распаковке zlib,
+        поэтому потоки работают одновременно. Файлы с ошибкой пропускаются —
+        о них сообщит обычная загрузка в главном потоке.
+        """
+        names = list(dict.fromkeys(names))
+        workers = min(workers or DECODE_WORKERS, len(names))
+        decoded = {}
+        if workers <= 1:
+            # Одно ядро: потоки только добавили бы накладные расходы
+            for name in names:
+                try:
+                    decoded[name] = self.decode_image(name)
+                except (pygame.error, FileNotFoundError):
+                    pass
+            return decoded
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = [(name, pool.submit(self.decode_image, name)) for name in names]
+        for name, future in futures:
+            try:
+                decoded[name] = future.result()
+            except (pygame.error, FileNotFoundError):
+                pass
+        return decoded
+
+    def preload(self, manifest, workers=None, decoded=None):
+        """
+        Загрузка списка изображений заранее, одним пакетом. manifest — имена
+        или пары (имя, масштаб). Файлы декодируются в пуле потоков, а
+        convert_alpha и масштабирование выполняются здесь, в главном потоке.
+        decoded — уже декодированные изображения (имя -> поверхность).
+        Возвращает число загруженных изображений.
+        """
+        pending = {}
+        for entry in manifest:
+            name, scale = (entry, 1) if isinstance(entry, str) else entry
+            if name not in self.assets:
+                pending.setdefault(name, scale)
+        if not pending:
+            return 0
+
+        decoded = dict(decoded or {})
+        decoded.update(
+            self.decode_images([name for name in pending if name not in decoded], workers)
+        )
+        for name, scale in pending.items():
+            self.load_image(name, scale, decoded=decoded.get(name))
+        return len(pending)
+
+    def _load_surface(self, path, decoded=None):
+        """
+        Загрузка изображения с диска (или пустой поверхности в режиме stub_pixels).
+        decoded — то же изображение, уже декодированное decode_image.
+        """
+        if self.stub_pixels:
+            if decoded is not None:
+                return decoded
+            return pygame.Surface(read_image_size(path), pygame.SRCALPHA)
+        if decoded is None:
+            decoded = pygame.image.load(path)
+        return decoded.convert_alpha()
+
+    def load_image(self, name, scale=1, decoded=None):
         if name in self.assets:
             return self.assets[name]
 
@@ -22,7 +132,7 @@ class AssetLoader:
         print(f"🔄 Loading image: {path}")
 
         try:
-            image = pygame.image.load(path).convert_alpha()
+            image = self._load_surface(path, decoded)
             if scale != 1:
                 new_size = (
                     int(image.get_width() * scale),
@@ -32,68 +142,133 @@ class AssetLoader:
             self.assets[name] = image
             print(f"✅ Successfully loaded: {name}")
             return image
-        except pygame.error as e:
+        except (pygame.error, FileNotFoundError) as e:
+            # pygame 2 сообщает об отсутствующем файле через FileNotFoundError
             print(f"❌ Failed to load image: {path}")
             print(f"❌ Error: {e}")
             stub_surface = pygame.Surface((50, 50), pygame.SRCALPHA)
             pygame.draw.rect(stub_surface, (255, 0, 255), (0, 0, 50, 50))
             return stub_surface
 
-    def load_tileset(self, name, firstgid, tilewidth, tileheight):
-        """Загрузка tileset и создание mapping для GID."""
-        if name in self.tilesets:
-            return self.tilesets[name]
+    def load_tileset(
+        self, name, firstgid, tilewidth, tileheight, margin=0, spacing=0, decoded=None
+    ):
+        """
+        Загрузка tileset и регистрация его тайлов в таблице GID.
+        Изображение загружается один раз; повторный вызов с другим firstgid
+        (другая карта) лишь добавляет новый диапазон GID. decoded — изображение,
+        заранее декодированное decode_image (например, в фоновом потоке).
+        """
+        tileset_data = self.tilesets.get(name)
+        if tileset_data is None:
+            path = os.path.join(self.base_path, name)
+            print(f"🔄 Loading tileset: {path}")
 
-        path = os.path.join(self.base_path, name)
-        print(f"🔄 Loading tileset: {path}")
+            try:
+                tileset_image = self._load_surface(path, decoded)
+            except (pygame.error, FileNotFoundError) as e:
+                print(f"❌ Failed to load tileset: {path}")
+                print(f"❌ Error: {e}")
+                return None
 
-        try:
-            tileset_image = pygame.image.load(path).convert_alpha()
-            self.tilesets[name] = {
+            step_x = tilewidth + spacing
+            step_y = tileheight + spacing
+            tileset_data = {
                 "image": tileset_image,
                 "firstgid": firstgid,
                 "tilewidth": tilewidth,
                 "tileheight": tileheight,
-                "columns": tileset_image.get_width() // tilewidth,
-                "rows": tileset_image.get_height() // tileheight,
+                "margin": margin,
+                "spacing": spacing,
+                "columns": (tileset_image.get_width() - 2 * margin + spacing) // step_x,
+                "rows": (tileset_image.get_height() - 2 * margin + spacing) // step_y,
             }
+            self.tilesets[name] = tileset_data
             print(f"✅ Tileset loaded: {name} (firstgid: {firstgid})")
-            return self.tilesets[name]
-        except pygame.error as e:
-            print(f"❌ Failed to load tileset: {path}")
-            print(f"❌ Error: {e}")
-            return None
-
-    def get_tile_image(self, gid):
-        """Получение тайла по GID."""
-        for tileset_name, tileset_data in self.tilesets.items():
-            firstgid = tileset_data["firstgid"]
-            tilewidth = tileset_data["tilewidth"]
-            tileheight = tileset_data["tileheight"]
-            columns = tileset_data["columns"]
-            rows = tileset_data["rows"]
-
-            if firstgid <= gid < firstgid + (columns * rows):
-                # Вычисляем позицию тайла в tileset
-                local_id = gid - firstgid
-                x = (local_id % columns) * tilewidth
-                y = (local_id // columns) * tileheight
-
-                # Вырезаем тайл
-                tile_surface = pygame.Surface((tilewidth, tileheight), pygame.SRCALPHA)
-                tile_surface.blit(
-                    tileset_data["image"],
-                    (0, 0),
-                    (x, y, tilewidth, tileheight),
-                )
-                return tile_surface
-
-        print(f"⚠️ Tile with GID {gid} not found in any tileset")
-        # Заглушка фиксированного размера, чтобы избежать обращения к несуществующему tilewidth
-        stub_size = 128
-        stub_surface = pygame.Surface((stub_size, stub_size), pygame.SRCALPHA)
-        stub_surface.fill((255, 0, 255))  # Фиолетовый цвет для отладки
-        return stub_surface
+
+        self._register_tiles(name, tileset_data, firstgid)
+        return tileset_data
+
+    def _register_tiles(self, name, tileset_data, firstgid):
+        """Заполняет таблицу GID -> (tileset, rect) для диапазона tileset."""
+        tilewidth = tileset_data["tilewidth"]
+        tileheight = tileset_data["tileheight"]
+        margin = tileset_data["margin"]
+        spacing = tileset_data["spacing"]
+        columns = tileset_data["columns"]
+
+        for local_id in range(columns * tileset_data["rows"]):
+            gid = firstgid + local_id
+            row, column = divmod(local_id, columns)
+            rect = pygame.Rect(
+                margin + column * (tilewidth + spacing),
+                margin + row * (tileheight + spacing),
+                tilewidth,
+                tileheight,
+            )
+            if self.tile_index.get(gid) != (name, rect):
+                self.tile_index[gid] = (name, rect)
+                # GID переназначен — старые поверхности больше не актуальны
+                for key in [key for key in self.tile_cache if key[0] == gid]:
+                    del self.tile_cache[key]
+
+    def get_flipped(self, surface):
+        """
+        Горизонтально отражённая копия surface (спрайт, смотрящий в другую
+        сторону). Копия создаётся при первом запросе и разделяется между всеми
+        спрайтами, поэтому изменять её нельзя.
+        """
+        flipped = self.flip_cache.get(surface)
+        if flipped is None:
+            flipped = pygame.transform.flip(surface, True, False)
+            self.flip_cache[surface] = flipped
+        return flipped
+
+    def get_tile_image(self, gid, size=None):
+        """
+        Получение тайла по GID.
+        Возвращает общую поверхность: subsurface изображения tileset или, если
+        задан size, одну масштабированную копию на пару (gid, size). Поверхность
+        разделяется между спрайтами, поэтому изменять её нельзя.
+        """
+        key = (gid, tuple(size) if size else None)
+        tile_surface = self.tile_cache.get(key)
+        if tile_surface is not None:
+            return tile_surface
+
+        entry = self.tile_index.get(gid)
+        if entry is None:
+            print(f"⚠️ Tile with GID {gid} not found in any tileset")
+            # Заглушка фиксированного размера, чтобы избежать обращения к несуществующему tilewidth
+            stub_size = 128
+            tile_surface = pygame.Surface((stub_size, stub_size), pygame.SRCALPHA)
+            tile_surface.fill((255, 0, 255))  # Фиолетовый цвет для отладки
+            if size and tuple(size) != tile_surface.get_size():
+                tile_surface = pygame.transform.scale(tile_surface, size)
+            # Заглушку не кэшируем: tileset может быть загружен позже
+            return tile_surface
+
+        tileset_name, rect = entry
+        tile_surface = self.tilesets[tileset_name]["image"].subsurface(rect)
+        if size and tuple(size) != rect.size:
+            tile_surface = pygame.transform.scale(tile_surface, size)
+        self.tile_cache[key] = tile_surface
+        return tile_surface
+
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+
+def read_image_size(path):
+    """
+    Размер изображения без декодирования пикселей: для PNG читается заголовок
+    IHDR, остальные форматы загружаются pygame.
+    """
+    with open(path, "rb") as f:
+        header = f.read(24)
+    if header[:8] == PNG_SIGNATURE and header[12:16] == b"IHDR":
+        return struct.unpack(">II", header[16:24])
+    return pygame.image.load(path).get_size()
 
 
 asset_loader = AssetLoader()
@@ -0,0 +1,153 @@
+# game/asset_manifest.py
+"""
+Манифест изображений: какие файлы нужны уровню и каждому экрану.
+
+Пути (относительно game/assets) записаны только здесь и в CLIP_SETS
+(game/animation.py). resolve() проверяет, что каждый файл существует с точно
+таким регистром букв: на Linux "hud/" и "Hud/" — разные каталоги, а на
+Windows и macOS ошибка была бы незаметна. preload_manifest() загружает набор
+одним пакетом (AssetLoader.preload) при создании уровня или экрана, поэтому в
+игровом цикле изображения уже не читаются с диска.
+
+Проверка всех манифестов и tilesets карт (перед сборкой):
+    python -m game.asset_manifest
+"""
+
+import glob
+import os
+from functools import lru_cache
+
+from .animation import clip_manifest
+from .asset_loader import asset_loader
+from .path_utils import resource_path
+
+LEVEL_BACKGROUND = "Backgrounds/colored_grass.png"
+MENU_BACKGROUND = "Backgrounds/colored_land.png"
+
+HUD_HEART_FULL = "Hud/hudHeart_full.png"
+HUD_HEART_HALF = "Hud/hudHeart_half.png"
+HUD_HEART_EMPTY = "Hud/hudHeart_empty.png"
+HUD_KEY = "Hud/hudKey_yellow.png"
+HUD_COIN = "Hud/hudCoin.png"
+
+# Тип предмета -> изображение (game/items/items.py)
+ITEM_IMAGES = {
+    "coin": HUD_COIN,
+    "key_yellow": HUD_KEY,
+    "jewel_blue": "Hud/hudJewel_blue.png",
+}
+SPIKES_IMAGE = "tiles/spikes.png"
+
+# Экран или уровень -> записи: путь или (путь, масштаб)
+MANIFESTS = {
+    "menu": (MENU_BACKGROUND,),
+    "hud": (HUD_HEART_FULL, HUD_HEART_HALF, HUD_HEART_EMPTY, HUD_KEY, HUD_COIN),
+    # Общее для всех уровней; tilesets берутся из самой карты (map_images)
+    "level": (
+        LEVEL_BACKGROUND,
+        SPIKES_IMAGE,
+        *ITEM_IMAGES.values(),
+        *clip_manifest(),
+    ),
+}
+
+
+@lru_cache(maxsize=None)
+def _dir_entries(path):
+    """Имена в каталоге (набор ресурсов во время игры не меняется)"""
+    try:
+        return frozenset(os.listdir(path))
+    except OSError:
+        return frozenset()
+
+
+def find_case_exact(name, base_path=None):
+    """
+    Проверяет путь name по компонентам с точным регистром. Возвращает None,
+    если файл найден, иначе текст ошибки (с подсказкой правильного регистра).
+    """
+    path = base_path or asset_loader.base_path
+    for part in name.split("/"):
+        entries = _dir_entries(path)
+        if part not in entries:
+            matches = [entry for entry in entries if entry.lower() == part.lower()]
+            if matches:
+                return f"{name}: регистр не совпадает, на диске '{matches[0]}'"
+            return f"{name}: файл не найден"
+        path = os.path.join(path, part)
+    if not os.path.isfile(path):
+        return f"{name}: это не файл"
+    return None
+
+
+def resolve(entries, base_path=None):
+    """
+    Нормализует записи манифеста в пары (путь, масштаб) и проверяет, что все
+    файлы существуют с точным регистром. При ошибках — ValueError со списком.
+    """
+    resolved = []
+    errors = []
+    for entry in entries:
+        name, scale = (entry, 1) if isinstance(entry, str) else entry
+        error = find_case_exact(name, base_path)
+        if error:
+            errors.append(error)
+        resolved.append((name, scale))
+    if errors:
+        raise ValueError("Ошибки манифеста ресурсов:\n  " + "\n  ".join(errors))
+    return resolved
+
+
+def map_images(tmx_map):
+    """Изображения tilesets карты"""
+    return [
+        tileset.image_source for tileset in tmx_map.tilesets if tileset.image_source
+    ]
+
+
+def preload_manifest(name, decoded=None):
+    """
+    Загружает все изображения манифеста name одним пакетом. decoded —
+    изображения, уже декодированные в фоне (LevelLoader). Ошибки манифеста
+    печатаются, но игра продолжается: вместо отсутствующих файлов load_image
+    вернёт заглушки (строгая проверка — python -m game.asset_manifest).
+    """
+    entries = MANIFESTS[name]
+    try:
+        entries = resolve(entries)
+    except ValueError as e:
+        print(f"❌ {e}")
+    return asset_loader.preload(entries, decoded=decoded)
+
+
+def validate_all(levels_dir=None):
+    """Список ошибок всех манифестов и tilesets всех карт (пустой — всё в порядке)"""
+    from .levels.level_cache import load_map
+
+    errors = []
+    for manifest, entries in MANIFESTS.items():
+        for entry in entries:
+            error = find_case_exact(entry if isinstance(entry, str) else entry[0])
+            if error:
+                errors.append(f"{manifest}: {error}")
+    levels_dir = levels_dir or resource_path("game", "assets", "levels")
+    for tmx_path in sorted(glob.glob(os.path.join(levels_dir, "*.tmx"))):
+        for image in map_images(load_map(tmx_path, use_cache=False)):
+            error = find_case_exact(image)
+            if error:
+                errors.append(f"{os.path.basename(tmx_path)}: {error}")
+    return list(dict.fromkeys(errors))
+
+
+def main():
+    errors = validate_all()
+    for error in errors:
+        print(f"❌ {error}")
+    if errors:
+        return 1
+    print(f"✅ Манифест ресурсов в порядке: {', '.join(MANIFESTS)} и карты уровней")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -33,6 +33,11 @@ class Camera:
         """Применение смещения камеры к прямоугольнику"""
         return rect.move(-self.offset.x, -self.offset.y)
     
+    def get_view_rect(self, margin=0):
+        """Видимая область мира (с запасом margin со всех сторон)"""
+        view = pygame.Rect(self.offset.x, self.offset.y, *self.screen_size)
+        return view.inflate(2 * margin, 2 * margin)
+
     def apply_point(self, point):
         """Применение смещения камеры к точке"""
         return (point[0] - self.offset.x, point[1] - self.offset.y)
\ No newline at end of file
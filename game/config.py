@@ -1,4 +1,4 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import List, Optional, Optional
 import json
 import os
@@ -36,12 +36,40 @@ class InputConfig:
     escape_to_menu: str = "ESCAPE"
 
 
+@dataclass
+class SimulationConfig:
+    # Частота шагов физики; скорости игрока заданы в пикселях за шаг 60 Гц и
+    # масштабируются по длительности шага, так что движение от неё не зависит
+    tick_rate: int = 60
+    # Ограничение FPS отрисовки (0 — без ограничения)
+    render_fps: int = 60
+    # Интерполяция позиций между двумя последними шагами симуляции
+    interpolate: bool = True
+    # Не больше стольких шагов за кадр; лишнее время отбрасывается
+    max_steps_per_frame: int = 5
+    # В меню и титрах ждать ввода до стольких мс и перерисовывать экран только
+    # после событий (0 — рисовать каждый кадр, как в игре)
+    idle_wait_ms: int = 500
+
+
+@dataclass
+class ProfilerConfig:
+    # Замер подсистем кадра; включается также вместе с ui.debug_overlay
+    enabled: bool = False
+    # Сколько последних кадров учитывать в p50/p95/p99
+    window: int = 300
+    # Куда сохранить историю кадров при выходе (.csv или .json); "" — не сохранять
+    dump_path: str = ""
+
+
 @dataclass
 class GameConfig:
     video: VideoConfig
     audio: AudioConfig
     input: InputConfig
     ui: UIConfig
+    simulation: SimulationConfig = field(default_factory=SimulationConfig)
+    profiler: ProfilerConfig = field(default_factory=ProfilerConfig)
 
 
 def load_config() -> GameConfig:
@@ -56,6 +84,8 @@ def load_config() -> GameConfig:
             audio=AudioConfig(),
             input=InputConfig(left=["LEFT", "A"], right=["RIGHT", "D"]),
             ui=UIConfig(),
+            simulation=SimulationConfig(),
+            profiler=ProfilerConfig(),
         )
 
     with open(CONFIG_PATH, "r", encoding="utf-8") as f:
@@ -65,6 +95,8 @@ def load_config() -> GameConfig:
     a = raw.get("audio", {})
     i = raw.get("input", {})
     u = raw.get("ui", {})
+    s = raw.get("simulation", {})
+    p = raw.get("profiler", {})
 
     return GameConfig(
         video=VideoConfig(
@@ -88,4 +120,16 @@ def load_config() -> GameConfig:
             animations=u.get("animations", False),
             language=u.get("language", "ru"),
         ),
+        simulation=SimulationConfig(
+            tick_rate=s.get("tick_rate", 60),
+            render_fps=s.get("render_fps", 60),
+            interpolate=s.get("interpolate", True),
+            max_steps_per_frame=s.get("max_steps_per_frame", 5),
+            idle_wait_ms=s.get("idle_wait_ms", 500),
+        ),
+        profiler=ProfilerConfig(
+            enabled=p.get("enabled", False),
+            window=p.get("window", 300),
+            dump_path=p.get("dump_path", ""),
+        ),
     )
@@ -10,10 +10,9 @@ class Decoration(pygame.sprite.Sprite):
         self.has_collision = False  # 🔥 ДЕКОРАЦИИ НЕ ИМЕЮТ КОЛЛИЗИЙ
         
         # 🔥 ИСПОЛЬЗУЕМ TILESET ДЛЯ ПОЛУЧЕНИЯ ИЗОБРАЖЕНИЯ
-        self.image = self.get_tile_image(decoration_type)
-        if self.image:
-            self.image = pygame.transform.scale(self.image, (width, height))
-        else:
+        # Поверхность общая для всех декораций этого типа и размера
+        self.image = self.get_tile_image(decoration_type, (width, height))
+        if not self.image:
             # Заглушка если тайл не найден
             self.image = pygame.Surface((width, height))
             if decoration_type == "mushroom":
@@ -25,7 +24,7 @@ class Decoration(pygame.sprite.Sprite):
         
         self.rect = self.image.get_rect(topleft=(x, y))
     
-    def get_tile_image(self, decoration_type):
+    def get_tile_image(self, decoration_type, size=None):
         """🔥 ПОЛУЧАЕМ ТАЙЛ ИЗ TILESET ПО ТИПУ"""
         type_to_gid = {
             "dec1": 347,
@@ -38,7 +37,7 @@ class Decoration(pygame.sprite.Sprite):
         }
         
         gid = type_to_gid.get(decoration_type, 341)  # По умолчанию box
-        return asset_loader.get_tile_image(gid)
+        return asset_loader.get_tile_image(gid, size)
     
     def draw(self, screen, camera):
         screen.blit(self.image, camera.apply(self.rect))
@@ -0,0 +1,203 @@
+# game/enemies/batch.py
+"""
+Пакетная физика патрульных врагов.
+
+В обычном состоянии (не ранен, не умирает) слайм, улитка и муха только
+патрулируют: гравитация, шаг по X, ограничение патруля и разворот. EnemyBatch
+собирает это состояние всех активных врагов одного вида в непрерывные массивы
+numpy (структура массивов), продвигает их одним векторным шагом и записывает
+результат обратно в rect и velocity. Таймеры, анимация и столкновения с
+платформами остаются у самих врагов.
+
+numpy не обязателен: без него (или если врагов вида меньше min_size) каждый
+враг двигается своим move(). Результат в обоих случаях одинаковый вплоть до
+округления координат pygame.Rect.
+"""
+
+from operator import attrgetter
+
+from .fly import Fly
+from .slime import Slime
+from .snail import Snail
+
+try:
+    import numpy as np
+except ImportError:  # numpy нужен только для пакетного шага
+    np = None
+
+
+BATCH_AVAILABLE = np is not None
+# Сбор и запись состояния стоят почти как сам скалярный move(): пакет
+# выигрывает только на сотнях врагов одного вида
+BATCH_MIN_SIZE = 256
+
+# Виды патрулирования
+WALKER = "walker"  # гравитация и патруль вокруг старта (слайм)
+EDGE_WALKER = "edge_walker"  # то же плюс разворот у краёв уровня (улитка)
+FLYER = "flyer"  # полёт в пределах move_range (муха)
+
+BATCH_KINDS = {Slime: WALKER, Snail: EDGE_WALKER, Fly: FLYER}
+
+# Отступ от краёв уровня, у которого улитка разворачивается
+LEVEL_EDGE_MARGIN = 50
+# Падение ниже старта, после которого враг возвращается на стартовую высоту
+FALL_LIMIT = 2000
+
+
+# Неизменные параметры врагов: хранятся по строке на врага между тиками
+_WALKER_CONSTANTS = attrgetter(
+    "speed", "gravity", "patrol_left", "patrol_right", "start_y", "rect.width"
+)
+_FLYER_CONSTANTS = attrgetter("speed", "start_x", "move_range")
+# Строк больше, чем врагов в пакете во столько раз, — таблица пересобирается
+_MAX_STALE_ROWS = 4
+
+
+def _round_rect(values):
+    """Округление как у pygame.Rect: половина — от нуля"""
+    whole = np.trunc(values)
+    return whole + np.where(np.abs(values - whole) >= 0.5, np.sign(values), 0.0)
+
+
+def _column(enemies, attr):
+    """Атрибут (можно через точку) всех врагов одним массивом float64"""
+    return np.fromiter(map(attrgetter(attr), enemies), float, len(enemies))
+
+
+class _ConstantTable:
+    """Неизменные параметры врагов одного вида: столбец на параметр, строка на врага"""
+
+    def __init__(self, getter):
+        self.getter = getter
+        self.rows = {}  # enemy -> номер строки
+        self.values = []
+        self.array = None
+
+    def take(self, enemies):
+        if len(self.rows) > _MAX_STALE_ROWS * max(len(enemies), 256):
+            # Убитые и давно спящие враги занимают строки; начинаем заново
+            self.rows.clear()
+            self.values.clear()
+            self.array = None
+        rows = self.rows
+        if not all(map(rows.__contains__, enemies)):
+            for enemy in enemies:
+                if enemy not in rows:
+                    rows[enemy] = len(self.values)
+                    self.values.append(self.getter(enemy))
+            self.array = None
+        if self.array is None:
+            self.array = np.array(self.values, dtype=float).T.copy()
+        index = np.fromiter(map(rows.__getitem__, enemies), np.intp, len(enemies))
+        return self.array[:, index]
+
+
+class EnemyBatch:
+    def __init__(self, min_size=BATCH_MIN_SIZE):
+        self.enabled = BATCH_AVAILABLE
+        self.min_size = min_size
+        self._constants = {}  # вид -> _ConstantTable
+
+    def update(self, enemies, dt, level):
+        """
+        Аналог enemy.update(dt, level) для списка врагов: таймеры и эффекты
+        по отдельности, движение — одним шагом на вид. Враги других видов
+        обновляются как обычно.
+        """
+        groups = {}
+        for enemy in enemies:
+            kind = BATCH_KINDS.get(type(enemy)) if self.enabled else None
+            if kind is None:
+                enemy.update(dt, level)
+            elif enemy.update_timers(dt):
+                groups.setdefault(kind, []).append(enemy)
+
+        for kind, group in groups.items():
+            if len(group) < self.min_size:
+                for enemy in group:
+                    enemy.move(dt, level)
+            elif kind == FLYER:
+                self._move_flyers(group, dt)
+            else:
+                self._move_walkers(group, dt, level, kind)
+            for enemy in group:
+                enemy.update_effects(dt)
+
+    def _table(self, kind, getter):
+        table = self._constants.get(kind)
+        if table is None:
+            table = self._constants[kind] = _ConstantTable(getter)
+        return table
+
+    def _move_walkers(self, enemies, dt, level, kind):
+        speed, gravity, patrol_left, patrol_right, start_y, width = self._table(
+            kind, _WALKER_CONSTANTS
+        ).take(enemies)
+        x = _column(enemies, "rect.x")
+        y = _column(enemies, "rect.y")
+        vy = _column(enemies, "velocity.y")
+        direction = _column(enemies, "direction")
+
+        vy = vy + gravity * dt
+        vx = speed * direction
+        x = _round_rect(x + vx * dt)
+        y = _round_rect(y + vy * dt)
+
+        # Ограничиваем патруль по X
+        left = x < patrol_left
+        right = ~left & (x > patrol_right)
+        x = np.where(left, _round_rect(patrol_left), x)
+        x = np.where(right, _round_rect(patrol_right), x)
+        new_direction = np.where(left, 1.0, np.where(right, -1.0, direction))
+
+        # Защита от бесконечного падения
+        fallen = y > start_y + FALL_LIMIT
+        y = np.where(fallen, _round_rect(start_y), y)
+        vy = np.where(fallen, 0.0, vy)
+
+        if kind == EDGE_WALKER:
+            outside = (x + width > level.width - LEVEL_EDGE_MARGIN) | (
+                x < LEVEL_EDGE_MARGIN
+            )
+            new_direction = np.where(outside, -new_direction, new_direction)
+
+        rows = zip(enemies, x.astype(int).tolist(), y.astype(int).tolist(), vy.tolist())
+        for enemy, ex, ey, evy in rows:
+            enemy.rect.topleft = (ex, ey)
+            enemy.velocity.y = evy
+        self._write_direction(enemies, vx, direction, new_direction)
+        for index in np.flatnonzero(fallen).tolist():
+            name = type(enemies[index]).__name__
+            print(f"⚠️ {name} position clamped to prevent flying/falling away")
+
+    def _move_flyers(self, enemies, dt):
+        speed, start_x, move_range = self._table(FLYER, _FLYER_CONSTANTS).take(enemies)
+        x = _column(enemies, "rect.x")
+        direction = _column(enemies, "direction")
+
+        vx = speed * direction
+        x = _round_rect(x + vx * dt)
+        outside = (x > start_x + move_range) | (x < start_x)
+        new_direction = np.where(outside, -direction, direction)
+
+        for enemy, ex in zip(enemies, x.astype(int).tolist()):
+            enemy.rect.x = ex
+        self._write_direction(enemies, vx, direction, new_direction)
+
+    def _write_direction(self, enemies, vx, direction, new_direction):
+        """
+        velocity.x = speed * direction и взгляд по нему. Записываются только
+        изменившиеся строки: обычно враг много тиков идёт в одну сторону.
+        """
+        changed = np.flatnonzero(
+            (vx != _column(enemies, "velocity.x")) | (new_direction != direction)
+        )
+        for index in changed.tolist():
+            enemy = enemies[index]
+            evx = float(vx[index])
+            enemy.velocity.x = evx
+            enemy.direction = int(new_direction[index])
+            if evx > 0:
+                enemy.facing_right = True
+            elif evx < 0:
+                enemy.facing_right = False
@@ -1,5 +1,6 @@
 # game/enemies/fly.py
 import pygame
+from ..animation import AnimationClip, Animator, load_clips
 from ..asset_loader import asset_loader
 from ..health import HealthComponent
 
@@ -10,16 +11,14 @@ class Fly(pygame.sprite.Sprite):
 
         # Загрузка спрайтов анимации полета
         try:
-            self.fly_frames = [
-                asset_loader.load_image("enemies/fly.png", 0.6),
-                asset_loader.load_image("enemies/fly_move1.png", 0.6),
-            ]
-            self.image = self.fly_frames[0]
+            self.animator = Animator(load_clips("fly"), "fly")
+            self.image = self.animator.image()
         except FileNotFoundError:
             # Заглушка если спрайты не загрузились
-            self.fly_frames = []
             self.image = pygame.Surface((40, 30))
             self.image.fill((200, 100, 200))  # Фиолетовый цвет
+            placeholder = AnimationClip.from_frames((self.image,))
+            self.animator = Animator({"fly": placeholder, "dead": placeholder}, "fly")
 
         self.rect = self.image.get_rect(topleft=(x, y))
 
@@ -44,11 +43,6 @@ class Fly(pygame.sprite.Sprite):
         self.hurt_timer = 0
         self.hurt_duration = 0.3
 
-        # Анимация полета
-        self.animation_timer = 0.0
-        self.animation_speed = 12.0  # кадров в секунду для маха крыльями
-        self.animation_frame = 0
-
         # Хитбокс
         self.hitbox = pygame.Rect(0, 0, 30, 25)
         self.show_hitbox = True
@@ -57,17 +51,23 @@ class Fly(pygame.sprite.Sprite):
 
     def update(self, dt, level):
         """Обновление мухи"""
+        if self.update_timers(dt):
+            self.move(dt, level)
+            self.update_effects(dt)
+
+    def update_timers(self, dt):
+        """Таймеры состояний; возвращает True, если в этом тике муха патрулирует"""
         if self.is_dead:
             # Во время смерти просто ждем таймер с уже установленным спрайтом смерти
             self.death_timer -= dt
             if self.death_timer <= 0:
                 self.kill()
-            return
+            return False
 
         if self.will_die_after_hurt and not self.is_hurt:
             self.die()
             self.will_die_after_hurt = False
-            return
+            return False
 
         if self.is_invincible:
             self.invincibility_timer -= dt
@@ -81,8 +81,12 @@ class Fly(pygame.sprite.Sprite):
                 if self.will_die_after_hurt:
                     self.die()
                     self.will_die_after_hurt = False
-                    return
+                    return False
 
+        return True
+
+    def move(self, dt, level):
+        """Полёт туда-обратно в пределах move_range от стартовой точки"""
         # Движение по горизонтали
         self.velocity.x = self.speed * self.direction
 
@@ -99,13 +103,12 @@ class Fly(pygame.sprite.Sprite):
         if self.rect.x > self.start_x + self.move_range or self.rect.x < self.start_x:
             self.direction *= -1
 
-        # Анимация машущих крыльев, только если не смерть и есть кадры
-        if not self.is_dead and self.fly_frames:
-            self.animation_timer += dt * self.animation_speed
-            if self.animation_timer >= 1.0:
-                self.animation_timer = 0.0
-                self.animation_frame = (self.animation_frame + 1) % len(self.fly_frames)
-            self.image = self.fly_frames[self.animation_frame]
+    def update_effects(self, dt):
+        """Анимация после движения"""
+        # Анимация машущих крыльев (12 кадров в секунду), только если не смерть
+        if not self.is_dead:
+            self.animator.update(dt)
+            self.image = self.animator.image()
 
     def take_damage(self, amount):
         """Получение урона с анимацией и неуязвимостью"""
@@ -134,12 +137,9 @@ class Fly(pygame.sprite.Sprite):
         self.death_timer = self.death_duration
         self.velocity.x = 0
 
-        # Загрузка спрайта смерти
-        try:
-            self.image = asset_loader.load_image("enemies/fly_dead.png", 0.6)
-        except FileNotFoundError:
-            # Если спрайт не найден, останется текущий
-            pass
+        # Спрайт смерти загружен заранее вместе с остальными клипами
+        self.animator.play("dead")
+        self.image = self.animator.image()
 
     def draw(self, screen, camera):
         """Отрисовка мухи"""
@@ -147,7 +147,7 @@ class Fly(pygame.sprite.Sprite):
 
         # Отрисовка спрайта
         if self.facing_right:
-            flipped_sprite = pygame.transform.flip(self.image, True, False)
+            flipped_sprite = asset_loader.get_flipped(self.image)
             screen.blit(flipped_sprite, screen_rect)
         else:
             screen.blit(self.image, screen_rect)
@@ -1,5 +1,6 @@
 import pygame
 from ..health import HealthComponent
+from ..animation import AnimationClip, Animator, load_clips
 from ..asset_loader import asset_loader
 
 
@@ -28,9 +29,6 @@ class Slime(pygame.sprite.Sprite):
 
         # Анимационные переменные
         self.current_state = "idle"  # idle, move, hurt, dead
-        self.animation_frame = 0
-        self.animation_speed = 0.15
-        self.animation_timer = 0
 
         # Состояния
         self.is_hurt = False
@@ -89,19 +87,13 @@ class Slime(pygame.sprite.Sprite):
     def load_sprites(self):
         """Загружает 4 спрайта для анимаций слайма"""
         try:
-            # 🎨 4 ОСНОВНЫХ СПРАЙТА
-            self.idle_sprite = asset_loader.load_image(
-                "enemies/slimePurple.png", 0.6
-            )  # стоит
-            self.move_sprite = asset_loader.load_image(
-                "enemies/slimePurple_move.png", 0.6
-            )  # движется
-            self.hurt_sprite = asset_loader.load_image(
-                "enemies/slimePurple_hit.png", 0.6
-            )  # получил урон
-            self.dead_sprite = asset_loader.load_image(
-                "enemies/slimePurple_dead.png", 0.6
-            )  # умер
+            # 🎨 Клипы общие для всех слаймов (загружены заранее)
+            clips = load_clips("slime")
+            self.animator = Animator(clips, "idle")
+            self.idle_sprite = clips["idle"].frames[0]  # стоит
+            self.move_sprite = clips["move"].frames[1]  # движется
+            self.hurt_sprite = clips["hurt"].frames[0]  # получил урон
+            self.dead_sprite = clips["dead"].frames[0]  # умер
 
             print("🎨 4 спрайта слайма загружены успешно!")
 
@@ -127,6 +119,17 @@ class Slime(pygame.sprite.Sprite):
             (255, 100, 100)
         )  # Красный - получил урон
         self.dead_sprite = self.create_colored_surface((50, 50, 50))  # Темный - умер
+        self.animator = Animator(
+            {
+                "idle": AnimationClip.from_frames((self.idle_sprite,)),
+                "move": AnimationClip.from_frames(
+                    (self.idle_sprite, self.move_sprite), 8
+                ),
+                "hurt": AnimationClip.from_frames((self.hurt_sprite,)),
+                "dead": AnimationClip.from_frames((self.dead_sprite,)),
+            },
+            "idle",
+        )
         self.current_sprite = self.idle_sprite
         self.image = self.current_sprite  # ✅ ВАЖНО!
 
@@ -152,40 +155,28 @@ class Slime(pygame.sprite.Sprite):
         else:
             self.current_state = "idle"
 
-        # Если состояние изменилось, сбрасываем анимацию
         if previous_state != self.current_state:
-            self.animation_frame = 0
-            self.animation_timer = 0
             print(
                 f"🔄 Смена состояния слайма: {previous_state} -> {self.current_state}"
             )
 
-        # 🎨 ПРОСТАЯ СИСТЕМА АНИМАЦИЙ - меняем спрайты по состоянию
-        if self.current_state == "idle":
-            self.current_sprite = self.idle_sprite
-
-        elif self.current_state == "move":
-            # 🔥 ПРОСТАЯ ПУЛЬСАЦИЯ для движения (без дополнительных кадров)
-            self.animation_timer += self.animation_speed
-            if self.animation_timer >= 1:
-                # Чередуем между idle и move спрайтом для эффекта движения
-                if self.current_sprite == self.idle_sprite:
-                    self.current_sprite = self.move_sprite
-                else:
-                    self.current_sprite = self.idle_sprite
-                self.animation_timer = 0
-
-        elif self.current_state == "hurt":
-            self.current_sprite = self.hurt_sprite
-
-        elif self.current_state == "dead":
-            self.current_sprite = self.dead_sprite
+        # 🎨 Клип по состоянию; при смене состояния он начинается сначала.
+        # Пульсация при движении идёт по времени, а не по числу тиков
+        self.animator.play(self.current_state)
+        self.animator.update(dt)
+        self.current_sprite = self.animator.image()
 
         # Обновляем основное изображение
         self.image = self.current_sprite
 
     def update(self, dt, level):
         """Обновление слайма с анимациями"""
+        if self.update_timers(dt):
+            self.move(dt, level)
+            self.update_effects(dt)
+
+    def update_timers(self, dt):
+        """Таймеры состояний; возвращает True, если в этом тике слайм патрулирует"""
         # 💀 Если слайм мертв, обрабатываем анимацию смерти
         if self.is_dead:
             self.death_timer -= dt
@@ -194,14 +185,14 @@ class Slime(pygame.sprite.Sprite):
                 print("💀 Слайм умер и удален!")
             else:
                 self.update_animation(dt)
-            return
+            return False
 
         # 🔥 ПРОВЕРЯЕМ НУЖНО ЛИ ЗАПУСТИТЬ СМЕРТЬ ПОСЛЕ АНИМАЦИИ УДАРА
         if self.will_die_after_hurt and not self.is_hurt:
             print("💀 Запускаем смерть после завершения анимации удара")
             self.die()
             self.will_die_after_hurt = False
-            return
+            return False
 
         # ⚔️ Обновляем таймер неуязвимости
         if self.is_invincible:
@@ -222,8 +213,12 @@ class Slime(pygame.sprite.Sprite):
                     )
                     self.die()
                     self.will_die_after_hurt = False
-                    return
+                    return False
+
+        return True
 
+    def move(self, dt, level):
+        """Патрулирование: гравитация, шаг по X и ограничение патруля"""
         # Применяем гравитацию
         self.velocity.y += self.gravity * dt
 
@@ -257,6 +252,8 @@ class Slime(pygame.sprite.Sprite):
         elif self.velocity.x < 0:
             self.facing_right = False
 
+    def update_effects(self, dt):
+        """Здоровье и анимация после движения"""
         # Обновление здоровья
         self.health_component.update(dt)
 
@@ -289,8 +286,7 @@ class Slime(pygame.sprite.Sprite):
 
             # Сбрасываем анимацию для принудительного показа hurt спрайта
             self.current_state = "hurt"
-            self.animation_frame = 0
-            self.animation_timer = 0
+            self.animator.play("hurt")
 
             # 💀 ПРОВЕРКА СМЕРТИ - но НЕ запускаем смерть сразу
             if self.health_component.is_dead():
@@ -321,7 +317,7 @@ class Slime(pygame.sprite.Sprite):
         # Отрисовка спрайта
         if self.current_sprite:
             if not self.facing_right:
-                flipped_sprite = pygame.transform.flip(self.current_sprite, True, False)
+                flipped_sprite = asset_loader.get_flipped(self.current_sprite)
                 screen.blit(flipped_sprite, (screen_x, screen_y))
             else:
                 screen.blit(self.current_sprite, (screen_x, screen_y))
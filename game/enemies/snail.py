@@ -1,5 +1,6 @@
 # game/enemies/snail.py
 import pygame
+from ..animation import AnimationClip, Animator, load_clips
 from ..asset_loader import asset_loader
 from ..health import HealthComponent
 
@@ -10,13 +11,16 @@ class Snail(pygame.sprite.Sprite):
 
         # Загрузка спрайта
         try:
-            self.image = asset_loader.load_image("enemies/snail.png", 0.6)
+            self.animator = Animator(load_clips("snail"), "idle")
+            self.image = self.animator.image()
             print(f"✅ Спрайт улитки загружен: {self.image}")
         except FileNotFoundError as e:
             print(f"⚠️ Спрайт улитки не найден: {e}")
             # Заглушка если спрайт не загрузился
             self.image = pygame.Surface((40, 30))
             self.image.fill((150, 75, 0))  # Коричневый цвет
+            placeholder = AnimationClip.from_frames((self.image,))
+            self.animator = Animator({"idle": placeholder, "dead": placeholder}, "idle")
 
         if self.image is None:
             print("❌ КРИТИЧНО: self.image is None для улитки!")
@@ -62,19 +66,25 @@ class Snail(pygame.sprite.Sprite):
 
     def update(self, dt, level):
         """Обновление улитки"""
+        if self.update_timers(dt):
+            self.move(dt, level)
+            self.update_effects(dt)
+
+    def update_timers(self, dt):
+        """Таймеры состояний; возвращает True, если в этом тике улитка патрулирует"""
         if self.is_dead:
             self.death_timer -= dt
             if self.death_timer <= 0:
                 self.kill()
                 print("💀 Улитка умерла и удалена!")
-            return
+            return False
 
         # 🔥 ПРОВЕРЯЕМ НУЖНО ЛИ ЗАПУСТИТЬ СМЕРТЬ ПОСЛЕ АНИМАЦИИ УДАРА
         if self.will_die_after_hurt and not self.is_hurt:
             print("💀 Запускаем смерть после завершения анимации удара")
             self.die()
             self.will_die_after_hurt = False
-            return
+            return False
 
         # ⚔️ Обновляем таймер неуязвимости
         if self.is_invincible:
@@ -95,7 +105,12 @@ class Snail(pygame.sprite.Sprite):
                     )
                     self.die()
                     self.will_die_after_hurt = False
-                    return
+                    return False
+
+        return True
+
+    def move(self, dt, level):
+        """Патрулирование: гравитация, шаг по X, ограничение патруля и края уровня"""
         # Применяем гравитацию
         self.velocity.y += self.gravity * dt
 
@@ -131,7 +146,8 @@ class Snail(pygame.sprite.Sprite):
         if self.rect.right > level_width - 50 or self.rect.left < 50:
             self.direction *= -1
 
-        # Обновление здоровья
+    def update_effects(self, dt):
+        """Обновление здоровья после движения"""
         self.health_component.update(dt)
 
     def take_damage(self, amount):
@@ -171,11 +187,9 @@ class Snail(pygame.sprite.Sprite):
         self.death_timer = self.death_duration
         self.velocity.x = 0
         self.velocity.y = 0
-        # Загрузка спрайта смерти
-        try:
-            self.image = asset_loader.load_image("enemies/snail_shell.png", 0.6)
-        except FileNotFoundError:
-            pass  # Если спрайт не найден, останется старый
+        # Спрайт смерти загружен заранее вместе с остальными клипами
+        self.animator.play("dead")
+        self.image = self.animator.image()
 
     def draw(self, screen, camera):
         """Отрисовка улитки"""
@@ -183,7 +197,7 @@ class Snail(pygame.sprite.Sprite):
 
         # Отрисовка спрайта
         if self.facing_right:
-            flipped_sprite = pygame.transform.flip(self.image, True, False)
+            flipped_sprite = asset_loader.get_flipped(self.image)
             screen.blit(flipped_sprite, screen_rect)
         else:
             screen.blit(self.image, screen_rect)
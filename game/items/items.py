@@ -1,6 +1,7 @@
 # game/items/item.py
 import pygame
 from ..asset_loader import asset_loader
+from ..asset_manifest import ITEM_IMAGES
 
 
 class Item(pygame.sprite.Sprite):
@@ -19,13 +20,7 @@ class Item(pygame.sprite.Sprite):
 
         # Загрузка спрайта
         try:
-            if item_type == "coin":
-                self.image = asset_loader.load_image("Hud/hudCoin.png", scale=1)
-            elif item_type == "key_yellow":
-                self.image = asset_loader.load_image("Hud/hudKey_yellow.png", scale=1)
-            elif item_type == "jewel_blue":
-                self.image = asset_loader.load_image("Hud/hudJewel_blue.png", scale=1)
-
+            self.image = asset_loader.load_image(ITEM_IMAGES[item_type], scale=1)
             self.image = pygame.transform.scale(self.image, (width, height))
         except:
             # Заглушки
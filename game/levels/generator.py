@@ -0,0 +1,260 @@
+# game/levels/generator.py
+"""
+Генератор синтетических уровней для нагрузочных тестов.
+
+generate_map() по seed строит TmxMap с тем же набором tilesets и слоёв, что
+и level1: пол с краями, парящие полуплатформы, подъёмы из склонов, шипы,
+декорации, враги и монеты. GID берутся из таблиц уровня
+(PLATFORM_TYPES_BY_GID, DECORATION_TYPES_BY_GID), поэтому Level загружает
+результат без особых случаев. Карту можно сразу передать в Level(tmx_map=...)
+или сохранить в .tmx / .lvlc.
+
+Запуск:
+    python -m game.levels.generator --width 400 --enemies 2000 --out big.tmx
+"""
+
+import argparse
+import array
+import hashlib
+import os
+import random
+from dataclasses import asdict, dataclass
+
+from ..path_utils import resource_path
+from .level1 import DECORATION_TYPES_BY_GID, PLATFORM_TYPES_BY_GID
+from .level_cache import CACHE_EXTENSION, write_compiled
+from .tmx_loader import (
+    TmxLayer,
+    TmxMap,
+    TmxObject,
+    TmxObjectGroup,
+    load_tmx,
+    write_tmx,
+)
+
+
+TILE_SIZE = 128
+
+# GID тайлов по назначению (spritesheet_ground)
+GID_BY_PLATFORM_TYPE = {name: gid for gid, name in PLATFORM_TYPES_BY_GID.items()}
+GROUND_LEFT = GID_BY_PLATFORM_TYPE["grass4"]
+GROUND_TOP = GID_BY_PLATFORM_TYPE["grass2"]
+GROUND_RIGHT = GID_BY_PLATFORM_TYPE["grass3"]
+SLOPE_BASE = GID_BY_PLATFORM_TYPE["grass5"]
+SLOPE = GID_BY_PLATFORM_TYPE["triangle"]
+SEMI_LEFT = GID_BY_PLATFORM_TYPE["semitype1"]
+SEMI_MIDDLE = GID_BY_PLATFORM_TYPE["semitype2"]
+SEMI_RIGHT = GID_BY_PLATFORM_TYPE["semitype3"]
+SPIKES = 410
+DECORATIONS = tuple(
+    gid for gid, name in DECORATION_TYPES_BY_GID.items() if name.startswith("dec")
+)
+
+# Тайловые объекты: type -> GID изображения (как в level1.tmx)
+ENEMY_GIDS = {"slime": 418, "snail": 459, "fly": 475, "saw": 481}
+COIN_GID = 158
+PLAYER_GID = 252
+
+# Первые колонки остаются безопасными: там появляется игрок
+SPAWN_CLEARANCE = 4
+
+
+@dataclass
+class GeneratorConfig:
+    width: int = 120  # в тайлах
+    height: int = 20
+    seed: int = 0
+    platform_density: float = 0.15  # доля колонок, над которыми висят платформы
+    slope_runs: int = 4
+    max_slope_length: int = 3
+    enemies: int = 10
+    traps: int = 10
+    coins: int = 20
+    decorations: int = 10
+
+
+def _level1_tilesets():
+    """Tilesets берутся из level1.tmx: те же изображения и firstgid"""
+    return load_tmx(resource_path("game", "assets", "levels", "level1.tmx")).tilesets
+
+
+class _Grid:
+    def __init__(self, name, width, height):
+        data = array.array("I", bytes(4 * width * height))
+        self.layer = TmxLayer(name, width, height, data)
+
+    def get(self, x, y):
+        layer = self.layer
+        if 0 <= x < layer.width and 0 <= y < layer.height:
+            return layer.data[y * layer.width + x]
+        return 0
+
+    def set(self, x, y, gid):
+        layer = self.layer
+        if 0 <= x < layer.width and 0 <= y < layer.height:
+            layer.data[y * layer.width + x] = gid
+
+
+def generate_map(config=None, tilesets=None) -> TmxMap:
+    """Детерминированно (по config.seed) строит карту уровня"""
+    config = config or GeneratorConfig()
+    rng = random.Random(config.seed)
+    width, height = config.width, config.height
+    floor = height - 6  # верхний ряд пола
+
+    ground = _Grid("ground", width, height)
+    slopes = _Grid("triangleleft", width, height)
+    semiground = _Grid("semiground", width, height)
+    traps = _Grid("traps", width, height)
+    decoration = _Grid("decoration", width, height)
+
+    # Пол во всю ширину
+    for x in range(width):
+        ground.set(x, floor, GROUND_TOP)
+    ground.set(0, floor, GROUND_LEFT)
+    ground.set(width - 1, floor, GROUND_RIGHT)
+
+    # Подъёмы: цепочка склонов по диагонали и плато на их вершине
+    busy = set(range(SPAWN_CLEARANCE))  # колонки, занятые рельефом
+    for _ in range(config.slope_runs):
+        length = rng.randint(1, max(1, config.max_slope_length))
+        plateau = rng.randint(2, 4)
+        span = length + plateau
+        if width - span - SPAWN_CLEARANCE <= 0:
+            break
+        x0 = rng.randrange(SPAWN_CLEARANCE, width - span)
+        columns = range(x0 - 1, x0 + span + 1)
+        if busy.intersection(columns):
+            continue
+        busy.update(columns)
+        for k in range(length):
+            x = x0 + k
+            ground.set(x, floor, SLOPE_BASE)
+            for depth in range(k):
+                ground.set(x, floor - 1 - depth, GROUND_TOP)
+            slopes.set(x, floor - 1 - k, SLOPE)
+        for x in range(x0 + length, x0 + span):
+            for depth in range(length):
+                ground.set(x, floor - 1 - depth, GROUND_TOP)
+
+    # Парящие полуплатформы из 2-4 тайлов
+    row_top, row_bottom = 1, floor - 3
+    runs = int(width * config.platform_density / 3)
+    for _ in range(runs):
+        length = rng.randint(2, 4)
+        x0 = rng.randrange(0, max(1, width - length))
+        y = rng.randint(row_top, max(row_top, row_bottom))
+        # Не склеиваем с соседними платформами и не ставим вплотную сверху
+        if any(
+            semiground.get(x, y) or semiground.get(x, y + 1)
+            for x in range(x0 - 1, x0 + length + 1)
+        ):
+            continue
+        for k in range(length):
+            semiground.set(x0 + k, y, SEMI_MIDDLE)
+        # length >= 2: у платформы всегда есть оба края
+        semiground.set(x0, y, SEMI_LEFT)
+        semiground.set(x0 + length - 1, y, SEMI_RIGHT)
+
+    def free_floor_column():
+        """Колонка ровного пола без рельефа (или None, если таких нет)"""
+        for _ in range(20):
+            x = rng.randrange(SPAWN_CLEARANCE, width)
+            if x not in busy and not traps.get(x, floor - 1):
+                return x
+        return None
+
+    # Шипы на полу
+    for _ in range(config.traps):
+        x = free_floor_column()
+        if x is not None:
+            traps.set(x, floor - 1, SPIKES)
+
+    # Декорации под полом (как в level1: земля с вкраплениями)
+    for _ in range(config.decorations):
+        x = rng.randrange(width)
+        y = rng.randint(floor + 1, height - 1)
+        decoration.set(x, y, rng.choice(DECORATIONS))
+
+    # Объекты: враги на полу, монеты над ним, точка спавна
+    next_id = 1
+    enemies = TmxObjectGroup("enemy")
+    enemy_types = sorted(ENEMY_GIDS)
+    floor_y = floor * TILE_SIZE
+    # Враги стоят в колонках ровного пола: над подъёмами и плато они
+    # оказались бы внутри рельефа
+    enemy_columns = [x for x in range(SPAWN_CLEARANCE, width - 1) if x not in busy]
+    for _ in range(config.enemies if enemy_columns else 0):
+        enemy_type = rng.choice(enemy_types)
+        x = rng.choice(enemy_columns) * TILE_SIZE
+        y = floor_y - (rng.randint(1, 3) * TILE_SIZE if enemy_type == "fly" else 0)
+        gid = ENEMY_GIDS[enemy_type]
+        enemies.objects.append(
+            TmxObject(next_id, "", enemy_type, x, y, TILE_SIZE, TILE_SIZE, gid)
+        )
+        next_id += 1
+
+    items = TmxObjectGroup("items")
+    for _ in range(config.coins):
+        x = rng.randrange(width) * TILE_SIZE
+        y = (floor - rng.randint(2, 4)) * TILE_SIZE
+        items.objects.append(
+            TmxObject(next_id, "", "goldcoin", x, y, TILE_SIZE, TILE_SIZE, COIN_GID)
+        )
+        next_id += 1
+
+    spawn = TmxObjectGroup("spawn")
+    spawn.objects.append(
+        TmxObject(next_id, "", "player", 0, floor_y, TILE_SIZE, TILE_SIZE, PLAYER_GID)
+    )
+
+    return TmxMap(
+        width=width,
+        height=height,
+        tilewidth=TILE_SIZE,
+        tileheight=TILE_SIZE,
+        tilesets=list(tilesets if tilesets is not None else _level1_tilesets()),
+        layers=[grid.layer for grid in (ground, slopes, semiground, traps, decoration)],
+        objectgroups=[enemies, items, spawn],
+    )
+
+
+def config_digest(config):
+    """Ключ карты для заголовка .lvlc: SHA-1 параметров генератора"""
+    params = repr(sorted(asdict(config).items()))
+    return hashlib.sha1(params.encode("utf-8")).digest()
+
+
+def save_map(tmx_map, path, config=None):
+    """Сохраняет карту в .tmx или, по расширению, в скомпилированный .lvlc"""
+    if path.endswith(CACHE_EXTENSION):
+        digest = config_digest(config or GeneratorConfig())
+        write_compiled(os.path.abspath(path), tmx_map, digest)
+    else:
+        write_tmx(tmx_map, path)
+
+
+def main(argv=None):
+    defaults = GeneratorConfig()
+    parser = argparse.ArgumentParser(description="Генератор синтетических уровней")
+    for name, value in asdict(defaults).items():
+        option = "--" + name.replace("_", "-")
+        parser.add_argument(option, type=type(value), default=value)
+    parser.add_argument("--out", required=True, help="путь .tmx или .lvlc")
+    args = vars(parser.parse_args(argv))
+    out = args.pop("out")
+
+    config = GeneratorConfig(**args)
+    tmx_map = generate_map(config)
+    save_map(tmx_map, out, config)
+    tiles = sum(1 for layer in tmx_map.layers for gid in layer.data if gid)
+    objects = sum(len(group.objects) for group in tmx_map.objectgroups)
+    print(
+        f"🗺️ Уровень {config.width}x{config.height} сохранён: {out} "
+        f"({tiles} тайлов, {objects} объектов)"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,164 @@
+# game/levels/layout.py
+"""
+Раскладка уровня без поверхностей.
+
+build_level_layout() переводит карту в записи (x, y, w, h, тип) для тайлов и
+объектов и заранее связывает склоны в цепочки. Здесь нет ни спрайтов, ни
+изображений, ни обращений к AssetLoader, поэтому раскладку можно строить в
+фоновом потоке (game/levels/loader.py); Level по ней только создаёт спрайты.
+"""
+
+from dataclasses import dataclass, field
+from types import SimpleNamespace
+
+import pygame
+
+from ..platform import link_slopes
+
+# Назначение тайловых слоёв TMX (по имени слоя)
+LAYER_KINDS = {
+    "ground": "platform",
+    "semiground": "platform",
+    "triangleleft": "platform",
+    "traps": "spikes",
+    "decoration": "decoration",
+}
+
+# Соответствие type объектов TMX игровым сущностям
+ENEMY_OBJECT_TYPES = ("slime", "snail", "fly", "saw")
+ITEM_OBJECT_TYPES = {"goldcoin": "coin", "ruby": "jewel_blue", "key": "key_yellow"}
+DECORATION_OBJECT_TYPES = {"lock": "lock_yellow"}
+PLATFORM_OBJECT_TYPES = {"box": "box"}
+
+# 🔥 СООТВЕТСТВИЕ GID ТИПАМ ПЛАТФОРМ ИЗ spritesheet_ground (GID 1-128)
+PLATFORM_TYPES_BY_GID = {
+    1: "grass1",
+    2: "grass_half",
+    25: "triangle",
+    57: "semitype1",
+    49: "semitype2",
+    41: "semitype3",
+    9: "grass2",
+    89: "grass3",
+    97: "grass4",
+    73: "grass5",
+    17: "grass6",
+    # Добавьте другие GID по мере необходимости
+}
+
+# 🔥 СООТВЕТСТВИЕ GID ТИПАМ ДЕКОРАЦИЙ ИЗ spritesheet_tiles (GID 289-416)
+DECORATION_TYPES_BY_GID = {
+    347: "dec1",
+    356: "dec2",
+    364: "dec3",
+    372: "dec4",
+    380: "dec5",
+    349: "dec6",
+    363: "lock_yellow",
+    # Добавьте другие GID по мере необходимости
+}
+
+
+@dataclass
+class LevelLayout:
+    width: int
+    height: int
+    # (имя слоя, назначение из LAYER_KINDS, [(x, y, w, h, тип)]) в порядке карты
+    layers: list = field(default_factory=list)
+    enemies: list = field(default_factory=list)
+    items: list = field(default_factory=list)
+    decorations: list = field(default_factory=list)
+    boxes: list = field(default_factory=list)
+    player_spawn_point: tuple = None
+    # Левый верхний угол склона -> (угол левого соседа, угол правого соседа)
+    slope_links: dict = field(default_factory=dict)
+
+    def apply_slope_links(self, platforms):
+        """Переносит цепочки склонов на созданные платформы"""
+        slopes = {
+            platform.rect.topleft: platform
+            for platform in platforms
+            if platform.platform_type == "triangle"
+        }
+        for position, (left, right) in self.slope_links.items():
+            slope = slopes.get(position)
+            if slope is None:
+                continue
+            slope.slope_left = slopes.get(left)
+            slope.slope_right = slopes.get(right)
+            slope.slopes_linked = True
+
+
+def build_level_layout(tmx_map):
+    """Раскладка уровня по карте (TmxMap или скомпилированной .lvlc)"""
+    layout = LevelLayout(tmx_map.pixel_width, tmx_map.pixel_height)
+    tile_width, tile_height = tmx_map.tilewidth, tmx_map.tileheight
+
+    for layer in tmx_map.layers:
+        kind = LAYER_KINDS.get(layer.name)
+        if kind is None:
+            print(f"⚠️ Слой '{layer.name}' не поддерживается и пропущен")
+            continue
+        records = []
+        for x, y, tile_gid in layer.iter_tiles():
+            if kind == "platform":
+                tile_type = PLATFORM_TYPES_BY_GID.get(tile_gid, "grass")
+            elif kind == "decoration":
+                tile_type = DECORATION_TYPES_BY_GID.get(tile_gid, "f")
+            else:
+                tile_type = None
+            records.append((x * tile_width, y * tile_height, tile_width, tile_height, tile_type))
+        layout.layers.append((layer.name, kind, records))
+
+    for group in tmx_map.objectgroups:
+        for obj in group.objects:
+            x, w, h = int(obj.x), int(obj.width), int(obj.height)
+            # У тайловых объектов Tiled координата y указывает на НИЖНИЙ край
+            y = int(obj.y) - h if obj.gid else int(obj.y)
+
+            if obj.type in ENEMY_OBJECT_TYPES:
+                layout.enemies.append((x, y, w, h, obj.type))
+            elif obj.type in ITEM_OBJECT_TYPES:
+                layout.items.append((x, y, w, h, ITEM_OBJECT_TYPES[obj.type]))
+            elif obj.type in DECORATION_OBJECT_TYPES:
+                layout.decorations.append((x, y, w, h, DECORATION_OBJECT_TYPES[obj.type]))
+            elif obj.type in PLATFORM_OBJECT_TYPES:
+                layout.boxes.append((x, y, w, h, PLATFORM_OBJECT_TYPES[obj.type]))
+            elif obj.type == "player":
+                # Точка спавна хранится как есть: игрок сам падает на землю
+                layout.player_spawn_point = (x, int(obj.y))
+            else:
+                print(
+                    f"⚠️ Неизвестный объект '{obj.type}' (id={obj.id}) в группе '{group.name}'"
+                )
+
+    layout.slope_links = link_slope_records(layout)
+    return layout
+
+
+def link_slope_records(layout):
+    """
+    Цепочки склонов по записям платформ: link_slopes() над лёгкими заменами
+    спрайтов (только rect и platform_type).
+    """
+    records = [
+        record
+        for _name, kind, layer_records in layout.layers
+        if kind == "platform"
+        for record in layer_records
+    ]
+    records.extend(layout.boxes)
+    slopes = [
+        SimpleNamespace(rect=pygame.Rect(x, y, w, h), platform_type=tile_type)
+        for x, y, w, h, tile_type in records
+        if tile_type == "triangle"
+    ]
+    link_slopes(slopes)
+
+    def position(slope):
+        return slope.rect.topleft if slope is not None else None
+
+    return {
+        slope.rect.topleft: (position(slope.slope_left), position(slope.slope_right))
+        for slope in slopes
+    }
@@ -1,18 +1,38 @@
 # game/levels/level1.py
 import pygame
-import base64
-import zlib
-import os
 from ..platform import Platform
 from game.assets.audio import AudioManager
 from ..enemies.slime import Slime
 from ..enemies.snail import Snail
 from ..enemies.fly import Fly
+from ..enemies.batch import EnemyBatch
 from ..items.items import Item
 from ..decorations import Decoration, ExitDoor
 from ..asset_loader import asset_loader
 from ..traps.saw import Saw
 from ..traps.spikes import Spikes
+from ..path_utils import resource_path
+from ..activation import ActivationGroup
+from ..animation import preload_clips
+from ..asset_manifest import LEVEL_BACKGROUND, preload_manifest
+from ..spatial import SpatialGroup, nearby
+from .layout import (
+    DECORATION_TYPES_BY_GID,
+    PLATFORM_TYPES_BY_GID,
+    build_level_layout,
+)
+from .level_cache import load_map
+from .tile_chunks import TileChunkRenderer
+from .tmx_loader import decode_layer_data
+
+
+# Запас вокруг экрана при отсечении: спрайты бывают больше своего rect
+DRAW_CULL_MARGIN = 128
+
+# Половина активной области вокруг игрока: экран 1400x800 и запас 400 px
+ACTIVE_HALF_SIZE = (1100, 800)
+# Сколько пропущенного времени проснувшийся объект догоняет за раз
+MAX_CATCHUP_SECONDS = 2.0
 
 
 def default_level_complete_handler(level_name):
@@ -21,15 +41,21 @@ def default_level_complete_handler(level_name):
 
 
 class Level:
-    def __init__(self, name):
+    def __init__(
+        self, name, tmx_path=None, tmx_map=None, decoded_images=None, layout=None
+    ):
         print(f"🗺️ Creating level: {name}")
 
         self.name = name
-        self.platforms = pygame.sprite.Group()
-        self.enemies = pygame.sprite.Group()
-        self.items = pygame.sprite.Group()
+        # Платформы статичны: индекс строится при загрузке и обновляется при удалении ящиков
+        self.platforms = SpatialGroup()
+        # Динамические объекты индексируются для отсечения по камере;
+        # враги и ловушки вдобавок разложены по секторам и спят вдали от игрока
+        self.enemies = ActivationGroup()
+        self.items = SpatialGroup()
         self.doors = pygame.sprite.Group()
-        self.traps = pygame.sprite.Group()
+        self.traps = ActivationGroup()
+        self.enemy_batch = EnemyBatch()
         self.decorations = pygame.sprite.Group()
         self.exit_doors = pygame.sprite.Group()
 
@@ -37,38 +63,67 @@ class Level:
         self.completed = False
         self.on_level_complete = default_level_complete_handler
 
+        # Статистика последнего кадра: сколько спрайтов нарисовано и отсечено
+        self.draw_stats = {"drawn": 0, "culled": 0, "chunks": 0}
+
+        # Изображения, уже декодированные в фоновом потоке (game/levels/loader.py):
+        # путь -> поверхность без convert_alpha
+        self.decoded_images = decoded_images or {}
+
+        # Изображения уровня (фон, предметы, ловушки, кадры анимаций) загружаются
+        # одним пакетом по манифесту: в игровом цикле файлы не читаются
+        preload_manifest("level", decoded=self.decoded_images)
+
         # Загрузка фона
-        original_bg = asset_loader.load_image("backgrounds/colored_grass.png", 1)
+        original_bg = asset_loader.load_image(LEVEL_BACKGROUND, 1)
         self.background = pygame.transform.scale(original_bg, (1400, 800))
         self.player = None
-        self.player_spawn_point = (0, 1280)  # Из TMX объекта
+        # Значения по умолчанию; переопределяются данными из TMX
+        self.player_spawn_point = (0, 1280)
         self.width = 30 * 128  # 3840
         self.height = 20 * 128  # 2560
 
         # 🔄 НОВОЕ: Хранение начальных данных врагов для респавна
         self.initial_enemy_data = []
 
-        # 🔥 ЗАГРУЗКА TILESETS - ОБНОВЛЕННЫЕ ПУТИ
-        self.load_tilesets()
-        self.load_from_xml()
+        # Карта уровня лежит рядом с остальными ресурсами: game/assets/levels/<name>.tmx
+        # (tmx_path — карта из другого места, .tmx или .lvlc; tmx_map — готовая
+        # карта в памяти, например от генератора game/levels/generator.py
+        # или от фоновой загрузки LevelLoader; layout — её раскладка, если
+        # LevelLoader уже построил её в фоне)
+        self.tmx_path = tmx_path or resource_path(
+            "game", "assets", "levels", f"{name}.tmx"
+        )
+        # Клипы анимаций собираются из загруженных кадров до расстановки
+        # объектов: удар и смерть врага не читают файлы посреди игры
+        preload_clips()
+        self.load_from_tmx(tmx_map, layout)
+
+        # Статичная геометрия (платформы и декорации) запекается в чанки
+        self.tile_chunks = TileChunkRenderer((self.platforms, self.decorations))
+        self.tile_chunks.build(bake=not asset_loader.stub_pixels)
+        # Декодированные копии больше не нужны: поверхности уже в AssetLoader
+        self.decoded_images = {}
         print(f"🗺️ Уровень '{name}' создан! Спавн игрока: {self.player_spawn_point}")
 
-    def load_tilesets(self):
-        """Загрузка всех tilesets из TMX"""
+    def load_tilesets(self, tmx_map):
+        """Загрузка всех tilesets, описанных в TMX"""
         print("🔄 Загрузка tilesets...")
 
-        # 🔥 ОБНОВЛЕННЫЕ ПУТИ - БЕЗ ldesign/
-        tilesets_data = [
-            ("Spritesheets/spritesheet_ground.png", 1, 128, 128),
-            ("Spritesheets/spritesheet_items.png", 129, 128, 128),
-            ("Spritesheets/spritesheet_players.png", 161, 128, 128),
-            ("Spritesheets/spritesheet_tiles.png", 289, 128, 128),
-            ("Spritesheets/spritesheet_enemies.png", 417, 128, 128),
-            ("Spritesheets/spritesheet_hud.png", 522, 128, 128),
-        ]
-
-        for path, firstgid, tilewidth, tileheight in tilesets_data:
-            asset_loader.load_tileset(path, firstgid, tilewidth, tileheight)
+        for tileset in tmx_map.tilesets:
+            if not tileset.image_source:
+                print(f"⚠️ Tileset '{tileset.name}' без изображения пропущен")
+                continue
+            # Пути изображений в TMX указаны относительно каталога game/assets
+            asset_loader.load_tileset(
+                tileset.image_source,
+                tileset.firstgid,
+                tileset.tilewidth,
+                tileset.tileheight,
+                margin=tileset.margin,
+                spacing=tileset.spacing,
+                decoded=self.decoded_images.get(tileset.image_source),
+            )
 
     def set_player(self, player):
         """Установить ссылку на игрока и сбросить состояние врагов при новом запуске уровня"""
@@ -162,7 +217,13 @@ class Level:
 
         # Найдём первую твёрдую платформу под ящиком, чтобы знать, где монета должна приземлиться
         ground_y = None
-        for platform in self.platforms:
+        column_below = pygame.Rect(
+            box_rect.left,
+            box_rect.bottom,
+            box_rect.width,
+            max(self.height - box_rect.bottom, 1),
+        )
+        for platform in self.platforms.query(column_below):
             if platform is box_platform:
                 continue
             if not getattr(platform, "has_collision", True):
@@ -206,6 +267,7 @@ class Level:
         except ValueError:
             # Если ящик уже удалён из группы — просто игнорируем
             pass
+        self.tile_chunks.invalidate(box_rect)
 
         # Небольшой звуковой эффект (используем тот же, что и для сбора монеты)
         try:
@@ -218,30 +280,30 @@ class Level:
     def decode_layer_data(self, encoded_data):
         """Декодирование данных слоя тайлов из base64+zlib"""
         try:
-            encoded_data = encoded_data.strip().replace("\n", "").replace("\r", "")
-            decoded = base64.b64decode(encoded_data)
-            decompressed = zlib.decompress(decoded)
-
-            tile_data = []
-            for i in range(0, len(decompressed), 4):
-                tile_gid = int.from_bytes(decompressed[i : i + 4], byteorder="little")
-                tile_data.append(tile_gid)
-
-            return tile_data
+            return decode_layer_data(encoded_data, "base64", "zlib")
         except Exception as e:
             print(f"❌ Ошибка декодирования слоя: {e}")
             return []
 
-    def load_from_xml(self):
-        """Загрузка уровня из XML данных TMX"""
+    def load_from_tmx(self, tmx_map=None, layout=None):
+        """Загрузка уровня из TMX файла (или из уже загруженной карты)"""
         try:
-            # 🔥 ЗАГРУЗКА ВСЕХ СЛОЕВ ИЗ TMX
-            self.load_ground_layer()
-            self.load_semiground_layer()
-            self.load_triangleleft_layer()
-            self.load_traps_layer()
-            self.load_decoration_layer()
-            self.load_objects_from_xml()
+            if tmx_map is None:
+                print(f"🔄 Чтение карты: {self.tmx_path}")
+                # Повторные запуски читают скомпилированную копию карты (mmap, без XML/zlib)
+                tmx_map = load_map(self.tmx_path)
+            if layout is None:
+                layout = build_level_layout(tmx_map)
+
+            self.width = layout.width
+            self.height = layout.height
+
+            self.load_tilesets(tmx_map)
+            for name, kind, records in layout.layers:
+                self.load_tile_layer(name, kind, records)
+            self.load_objects(layout)
+            # Склоны связаны в цепочки заранее: переходы между ними — O(1)
+            layout.apply_slope_links(self.platforms)
 
             print("✅ Все слои TMX загружены!")
 
@@ -252,118 +314,33 @@ class Level:
             traceback.print_exc()
             self.create_fallback_level()
 
-    def load_ground_layer(self):
-        """Загрузка основного слоя земли"""
-        print("🔄 Загрузка ground layer...")
-        ground_layer_data = "eJxjYBgFo2AUjHTASWdzYeJMJJqXCNWLD3tCzcUmx4RGg3AkiW4YqUCQARJejFA+OWmGkbASOIDFNRMSRo87YjGp6WwUjAJqAAC+IgLF"
-        tile_data = self.decode_layer_data(ground_layer_data)
-
-        for y in range(20):
-            for x in range(30):
-                tile_index = y * 30 + x
-                if tile_index < len(tile_data):
-                    tile_gid = tile_data[tile_index]
-
-                    if tile_gid != 0:  # Есть тайл
-                        platform_type = self.get_platform_type_by_gid(tile_gid)
-
-                        platform = Platform(x * 128, y * 128, 128, 128, platform_type)
-                        self.platforms.add(platform)
-
-        print(f"✅ Ground layer: {len(self.platforms)} платформ")
-
-    def load_semiground_layer(self):
-        """Загрузка слоя semiground"""
-        print("🔄 Загрузка semiground layer...")
-        semiground_data = (
-            "eJxjYBjawBKIDYFYc6AdQgKAuZnaamkJKAnnoRJHtHAnPf0+VMJ5FIyCUTAKRgIAAN5vBEc="
-        )
-        tile_data = self.decode_layer_data(semiground_data)
-
-        for y in range(20):
-            for x in range(30):
-                tile_index = y * 30 + x
-                if tile_index < len(tile_data):
-                    tile_gid = tile_data[tile_index]
-
-                    if tile_gid != 0:
-                        platform_type = self.get_platform_type_by_gid(tile_gid)
-                        platform = Platform(x * 128, y * 128, 128, 128, platform_type)
-                        self.platforms.add(platform)
-
-    def load_triangleleft_layer(self):
-        """Загрузка слоя triangleleft"""
-        print("🔄 Загрузка triangleleft layer...")
-        triangleleft_data = "eJxjYBgFo2AUjALqA8mBdsAoGAWjYBQMIAAAhsQAGg=="
-        tile_data = self.decode_layer_data(triangleleft_data)
-
-        for y in range(20):
-            for x in range(30):
-                tile_index = y * 30 + x
-                if tile_index < len(tile_data):
-                    tile_gid = tile_data[tile_index]
-
-                    if tile_gid != 0:
-                        platform_type = self.get_platform_type_by_gid(tile_gid)
-                        platform = Platform(x * 128, y * 128, 128, 128, platform_type)
-                        self.platforms.add(platform)
-
-    def load_traps_layer(self):
-        """Загрузка слоя ловушек"""
-        print("🔄 Загрузка traps layer...")
-        traps_layer_data = (
-            "eJxjYBgFQxHMYqSvvlEwCsgFuNLcaFocGgAUT+hxNRp3o2AUEAYA+iEEPg=="
-        )
-        tile_data = self.decode_layer_data(traps_layer_data)
-
-        for y in range(20):
-            for x in range(30):
-                tile_index = y * 30 + x
-                if tile_index < len(tile_data):
-                    tile_gid = tile_data[tile_index]
-
-                    if tile_gid != 0:  # Есть ловушка
-                        spike = Spikes(x * 128, y * 128, 128, 128)
-                        self.traps.add(spike)
-
-        print(f"✅ Traps layer: {len(self.traps)} ловушек")
-
-    def load_decoration_layer(self):
-        """Загрузка слоя декораций"""
-        print("🔄 Загрузка decoration layer...")
-        decoration_layer_data = (
-            "eJxjYBgFo2DkgGjGgXYBdUHKAPknZ5iFI7mgZIDCoQZob+wgiIPhlp9GwSigJgAA5dUC2w=="
-        )
-        tile_data = self.decode_layer_data(decoration_layer_data)
-
-        for y in range(20):
-            for x in range(30):
-                tile_index = y * 30 + x
-                if tile_index < len(tile_data):
-                    tile_gid = tile_data[tile_index]
-
-                    if tile_gid != 0:
-                        deco_type = self.get_decoration_type_by_gid(tile_gid)
-                        decoration = Decoration(x * 128, y * 128, 128, 128, deco_type)
-                        self.decorations.add(decoration)
-
-        print(f"✅ Decoration layer: {len(self.decorations)} декораций")
-
-    def load_objects_from_xml(self):
-        """Загрузка объектов из objectgroups"""
+    def load_tile_layer(self, name, kind, records):
+        """Создание спрайтов тайлового слоя по записям раскладки"""
+        print(f"🔄 Загрузка {name} layer...")
+        for px, py, tile_width, tile_height, tile_type in records:
+            if kind == "platform":
+                self.platforms.add(
+                    Platform(px, py, tile_width, tile_height, tile_type)
+                )
+            elif kind == "spikes":
+                self.traps.add(Spikes(px, py, tile_width, tile_height))
+            elif kind == "decoration":
+                self.decorations.add(
+                    Decoration(px, py, tile_width, tile_height, tile_type)
+                )
+
+        print(f"✅ {name} layer: {len(records)} тайлов")
+
+    def load_objects(self, layout):
+        """Создание объектов из objectgroups по записям раскладки"""
         print("🔄 Загрузка объектов из TMX...")
 
-        # 🔥 ВРАГИ ИЗ OBJECTGROUP (GID из spritesheet_enemies)
-        enemies_data = [
-            # slime (GID 418 = 417 + 1)
-            (898, 1268 - 128, 128, 128, "slime"),
-            # snail (GID 459 = 417 + 42)
-            (1790, 1264 - 128, 128, 128, "snail"),
-            # saw (GID 481 = 417 + 64)
-            (2684, 1788 - 128, 128, 128, "saw"),
-            # fly (GID 475 = 417 + 58)
-            (2308, 1648 - 128, 128, 128, "fly"),
-        ]
+        enemies_data = layout.enemies
+        items_data = layout.items
+        decorations_data = layout.decorations
+        box_data = layout.boxes
+        if layout.player_spawn_point is not None:
+            self.player_spawn_point = layout.player_spawn_point
 
         # 🔄 НОВОЕ: Сохраняем начальные данные врагов для респавна после смерти игрока
         self.initial_enemy_data = enemies_data
@@ -422,40 +399,16 @@ class Level:
                 traceback.print_exc()
 
         # 🔥 ПРЕДМЕТЫ ИЗ OBJECTGROUP
-        items_data = [
-            # Ключ (GID 572 = 522 + 50)
-            (440, 364 - 128, 128, 128, "key_yellow"),
-            # Рубин (GID 522)
-            (2432, 128 - 128, 128, 128, "jewel_blue"),
-            # Монеты (GID 158 = 129 + 29)
-            (384, 1024 - 128, 128, 128, "coin"),
-            (512, 1024 - 128, 128, 128, "coin"),
-            (640, 1024 - 128, 128, 128, "coin"),
-            (2560, 1280 - 128, 128, 128, "coin"),
-            (2816, 1664 - 128, 128, 128, "coin"),
-            (2048, 768 - 128, 128, 128, "coin"),
-            (1852, 368 - 128, 128, 128, "coin"),
-        ]
-
         for x, y, w, h, item_type in items_data:
             item = Item(x, y, w, h, item_type)
             self.items.add(item)
 
         # 🔥 ДЕКОРАЦИИ ИЗ OBJECTGROUP
-        decorations_data = [
-            # Замок (GID 363 = 289 + 74) — визуальный замок над дверью
-            (840, 1590 - 32, 32, 32, "lock_yellow"),
-        ]
-
         for x, y, w, h, deco_type in decorations_data:
             decoration = Decoration(x, y, w, h, deco_type)
             self.decorations.add(decoration)
 
-        box_data = [
-            # Ящики (GID 341 = 289 + 52)
-            (1792, 1664 - 128, 128, 128, "box"),
-            (1920, 1664 - 128, 128, 128, "box"),
-        ]
+        # 🔥 ЯЩИКИ ИЗ OBJECTGROUP (разрушаемые платформы)
         for x, y, w, h, platform_type in box_data:
             platform = Platform(x, y, w, h, platform_type)
             self.platforms.add(platform)
@@ -564,83 +517,81 @@ class Level:
 
     def get_platform_type_by_gid(self, gid):
         """Определяет тип платформы по GID"""
-        # 🔥 СООТВЕТСТВИЕ GID ТИПАМ ПЛАТФОРМ ИЗ spritesheet_ground
-        platform_types = {
-            # spritesheet_ground (GID 1-128)
-            1: "grass1",
-            2: "grass_half",
-            25: "triangle",
-            57: "semitype1",
-            49: "semitype2",
-            41: "semitype3",
-            9: "grass2",
-            89: "grass3",
-            97: "grass4",
-            73: "grass5",
-            17: "grass6",
-            # Добавьте другие GID по мере необходимости
-        }
-        return platform_types.get(gid, "grass")
+        return PLATFORM_TYPES_BY_GID.get(gid, "grass")
 
     def get_decoration_type_by_gid(self, gid):
         """Определяет тип декорации по GID"""
-        # 🔥 СООТВЕТСТВИЕ GID ТИПАМ ДЕКОРАЦИЙ ИЗ spritesheet_tiles
-        decoration_types = {
-            # spritesheet_tiles (GID 289-416)
-            347: "dec1",
-            356: "dec2",
-            364: "dec3",
-            372: "dec4",
-            380: "dec5",
-            349: "dec6",
-            363: "lock_yellow",
-            # Добавьте другие GID по мере необходимости
-        }
-        return decoration_types.get(gid, "f")
-
-    def _compute_update_rect(self) -> pygame.Rect:
-        """Вычисляет область, в которой нужно обновлять объекты (окрестность игрока).
-
-        Если игрока нет (например, при ошибке инициализации), обновляем весь уровень.
+        return DECORATION_TYPES_BY_GID.get(gid, "f")
+
+    def get_surface_y(self, x, top=0, max_depth=None):
+        """
+        Карта высот: Y ближайшей твёрдой поверхности в колонке x, не выше top.
+        Учитывает склоны и полутайлы; возвращает None, если опоры нет.
+        Годится и для врагов (например, чтобы не сходить с края платформы).
+        """
+        bottom = self.height if max_depth is None else top + max_depth
+        column = pygame.Rect(int(x), int(top), 1, max(int(bottom - top), 1))
+        surface_y = None
+        for platform in self.platforms.query(column):
+            if not platform.has_collision:
+                continue
+            platform_y = platform.surface_y_at(x)
+            if platform_y >= top and (surface_y is None or platform_y < surface_y):
+                surface_y = platform_y
+        return surface_y
+
+    def get_active_rect(self) -> pygame.Rect:
+        """Активная область: сектора, которые она задевает, обновляются каждый тик.
+
+        Если игрока нет (например, при ошибке инициализации), активен весь уровень.
         """
         if not self.player:
             return pygame.Rect(0, 0, self.width, self.height)
 
-        half_w, half_h = 700, 400
-        margin = 400
-        cx, cy = self.player.rect.center
+        half_w, half_h = ACTIVE_HALF_SIZE
         return pygame.Rect(
-            cx - half_w - margin,
-            cy - half_h - margin,
-            2 * (half_w + margin),
-            2 * (half_h + margin),
+            self.player.rect.centerx - half_w,
+            self.player.rect.centery - half_h,
+            2 * half_w,
+            2 * half_h,
         )
 
-    def update(self, dt):
-        """Обновление уровня с локализованными апдейтами."""
-        update_rect = self._compute_update_rect()
+    def _step_enemy(self, enemy, dt):
+        enemy.update(dt, self)
+        self.check_enemy_collisions(enemy)
+
+    def _step_enemies(self, enemies, dt):
+        # Патрулирующие враги двигаются одним пакетом, столкновения — поштучно
+        self.enemy_batch.update(enemies, dt, self)
+        for enemy in enemies:
+            self.check_enemy_collisions(enemy)
+
+    def _step_trap(self, trap, dt):
+        trap.update(dt, self)
 
-        for enemy in self.enemies:
-            if enemy.rect.colliderect(update_rect):
-                enemy.update(dt, self)
-                self.check_enemy_collisions(enemy)
+    def update(self, dt):
+        """Обновление уровня: только враги и ловушки в активных секторах."""
+        active_rect = self.get_active_rect()
+        max_catchup = int(MAX_CATCHUP_SECONDS / dt) if dt > 0 else 0
 
-        for trap in self.traps:
-            if hasattr(trap, "rect") and trap.rect.colliderect(update_rect):
-                trap.update(dt, self)
+        self.enemies.update_active(
+            active_rect, dt, self._step_enemy, max_catchup, self._step_enemies
+        )
+        self.traps.update_active(active_rect, dt, self._step_trap, max_catchup)
 
         if self.player:
             # Обновляем анимацию для динамических предметов (например, монет из ящиков)
             for item in self.items:
                 if hasattr(item, "update"):
                     item.update(dt)
+                    self.items.refresh(item)
 
             self.check_item_collection()
             self.check_exit_door_collision()
 
     def check_item_collection(self):
         """Проверка сбора предметов игроком"""
-        for item in self.items.sprites():
+        for item in nearby(self.items, self.player.rect):
             if not item.collected and self.player.rect.colliderect(item.rect):
                 item_type = item.collect()
                 if item_type:
@@ -676,7 +627,7 @@ class Level:
 
     def check_enemy_collisions(self, enemy):
         """Проверка столкновений врага с платформами"""
-        for platform in self.platforms:
+        for platform in self.platforms.query(enemy.rect):
             if not platform.has_collision:
                 continue
 
@@ -722,22 +673,17 @@ class Level:
         """Отрисовка уровня в правильном порядке"""
         screen.blit(self.background, (0, 0))
 
-        # 1. Основные платформы
-        for platform in self.platforms:
-            platform.draw(screen, camera)
-
-        # 2. Декорации
-        for decoration in self.decorations:
-            decoration.draw(screen, camera)
-
-        # 3. Ловушки
-        for trap in self.traps:
-            trap.draw(screen, camera)
+        # 1-2. Платформы и декорации: готовые чанки, пересекающие экран
+        chunks = self.tile_chunks.draw(screen, camera)
 
-        # 4. Враги
-        for enemy in self.enemies:
-            enemy.draw(screen, camera)
+        # 3-5. Ловушки, враги, предметы: только попадающие в камеру
+        view = camera.get_view_rect(DRAW_CULL_MARGIN)
+        drawn = culled = 0
+        for group in (self.traps, self.enemies, self.items):
+            visible = group.query(view)
+            for sprite in visible:
+                sprite.draw(screen, camera)
+            drawn += len(visible)
+            culled += len(group) - len(visible)
 
-        # 5. Предметы
-        for item in self.items:
-            item.draw(screen, camera)
+        self.draw_stats = {"drawn": drawn, "culled": culled, "chunks": chunks}
@@ -0,0 +1,315 @@
+# game/levels/level_cache.py
+"""
+Кэш скомпилированных уровней.
+
+При первом запуске TMX карта разбирается обычным загрузчиком и сохраняется в
+компактный бинарный файл (.lvlc): заголовок, таблица строк, tilesets, объекты
+и сетки GID слоёв в виде сырых uint32. При следующих запусках файл
+отображается в память (mmap) и слои читаются как memoryview без XML, base64
+и zlib. Файл привязан к SHA-1 исходной карты: любое изменение .tmx приводит
+к перекомпиляции.
+"""
+
+import array
+import hashlib
+import io
+import json
+import mmap
+import os
+import struct
+import sys
+
+from .tmx_loader import (
+    TmxLayer,
+    TmxMap,
+    TmxObject,
+    TmxObjectGroup,
+    TmxTileset,
+    load_tmx,
+)
+
+
+MAGIC = b"LVLC"
+FORMAT_VERSION = 2
+CACHE_EXTENSION = ".lvlc"
+NO_STRING = 0xFFFFFFFF
+
+# magic, версия, резерв, sha1, размеры карты, количество записей в таблицах
+_HEADER = struct.Struct("<4sHH20s4I4I")
+_STRING_LEN = struct.Struct("<H")
+_TILESET = struct.Struct("<9I")
+_LAYER = struct.Struct("<4I")
+_OBJECT = struct.Struct("<5I4dI")
+
+
+def source_digest(data: bytes) -> bytes:
+    """Ключ кэша: хэш содержимого исходной карты."""
+    return hashlib.sha1(data).digest()
+
+
+def get_cache_dir(tmx_path) -> str:
+    """
+    Каталог для скомпилированных уровней.
+    В режиме PyInstaller ресурсы распакованы во временный каталог, поэтому
+    кэш хранится рядом с исполняемым файлом (в текущем каталоге).
+    """
+    if hasattr(sys, "_MEIPASS"):
+        return os.path.join(os.getcwd(), "level_cache")
+    return os.path.join(os.path.dirname(os.path.abspath(tmx_path)), "__levelcache__")
+
+
+def get_cache_path(tmx_path, cache_dir=None) -> str:
+    stem = os.path.splitext(os.path.basename(tmx_path))[0]
+    return os.path.join(cache_dir or get_cache_dir(tmx_path), stem + CACHE_EXTENSION)
+
+
+def compile_map(tmx_map: TmxMap, digest: bytes) -> bytes:
+    """Сериализует TmxMap в бинарный формат .lvlc."""
+    strings = []
+    string_index = {}
+
+    def intern(value):
+        if value is None:
+            return NO_STRING
+        if value not in string_index:
+            string_index[value] = len(strings)
+            strings.append(value)
+        return string_index[value]
+
+    tileset_records = [
+        _TILESET.pack(
+            ts.firstgid,
+            intern(ts.name),
+            ts.tilewidth,
+            ts.tileheight,
+            ts.tilecount,
+            ts.columns,
+            ts.margin,
+            ts.spacing,
+            intern(ts.image_source),
+        )
+        for ts in tmx_map.tilesets
+    ]
+
+    object_records = []
+    for group_idx, group in enumerate(tmx_map.objectgroups):
+        for obj in group.objects:
+            props = json.dumps(obj.properties, ensure_ascii=False) if obj.properties else None
+            object_records.append(
+                _OBJECT.pack(
+                    group_idx,
+                    obj.id,
+                    intern(obj.name),
+                    intern(obj.type),
+                    obj.gid,
+                    obj.x,
+                    obj.y,
+                    obj.width,
+                    obj.height,
+                    intern(props),
+                )
+            )
+    # Группы хранятся отдельно: так сохраняются пустые группы и их порядок
+    group_names = [intern(group.name) for group in tmx_map.objectgroups]
+
+    layer_names = [intern(layer.name) for layer in tmx_map.layers]
+
+    string_blob = bytearray()
+    for value in strings:
+        encoded = value.encode("utf-8")
+        string_blob += _STRING_LEN.pack(len(encoded)) + encoded
+
+    header = _HEADER.pack(
+        MAGIC,
+        FORMAT_VERSION,
+        0,
+        digest,
+        tmx_map.width,
+        tmx_map.height,
+        tmx_map.tilewidth,
+        tmx_map.tileheight,
+        len(strings),
+        len(tileset_records),
+        len(group_names),
+        len(object_records),
+    )
+
+    out = bytearray(header)
+    out += struct.pack("<I", len(layer_names))
+    out += string_blob
+    out += b"".join(tileset_records)
+    out += struct.pack(f"<{len(group_names)}I", *group_names)
+    out += b"".join(object_records)
+
+    # Таблица слоёв: смещения данных вычисляются после выравнивания на 4 байта
+    layer_table_pos = len(out)
+    out += bytes(_LAYER.size * len(layer_names))
+    out += bytes(-len(out) % 4)
+
+    for i, layer in enumerate(tmx_map.layers):
+        data = array.array("I", layer.data)
+        if sys.byteorder == "big":
+            data.byteswap()
+        offset = len(out)
+        out += data.tobytes()
+        _LAYER.pack_into(
+            out, layer_table_pos + i * _LAYER.size,
+            layer_names[i], layer.width, layer.height, offset,
+        )
+
+    return bytes(out)
+
+
+def read_compiled(path, expected_digest=None):
+    """
+    Читает .lvlc через mmap. Возвращает TmxMap или None, если файла нет,
+    он повреждён или собран из другой версии карты.
+    """
+    try:
+        with open(path, "rb") as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+
+    try:
+        tmx_map = _parse_compiled(mm, expected_digest)
+    except (struct.error, IndexError, ValueError) as e:
+        print(f"⚠️ Повреждённый кэш уровня {path}: {e}")
+        tmx_map = None
+
+    if tmx_map is None:
+        try:
+            mm.close()
+        except BufferError:
+            # Частично созданные memoryview ещё живы — файл закроет сборщик мусора
+            pass
+    return tmx_map
+
+
+def _parse_compiled(mm, expected_digest):
+    (
+        magic, version, _, digest,
+        width, height, tilewidth, tileheight,
+        n_strings, n_tilesets, n_groups, n_objects,
+    ) = _HEADER.unpack_from(mm, 0)
+    if magic != MAGIC or version != FORMAT_VERSION:
+        return None
+    if expected_digest is not None and digest != expected_digest:
+        return None
+
+    pos = _HEADER.size
+    (n_layers,) = struct.unpack_from("<I", mm, pos)
+    pos += 4
+
+    strings = []
+    for _ in range(n_strings):
+        (length,) = _STRING_LEN.unpack_from(mm, pos)
+        pos += _STRING_LEN.size
+        strings.append(mm[pos:pos + length].decode("utf-8"))
+        pos += length
+
+    def lookup(idx):
+        return None if idx == NO_STRING else strings[idx]
+
+    tmx_map = TmxMap(width, height, tilewidth, tileheight)
+
+    for _ in range(n_tilesets):
+        values = _TILESET.unpack_from(mm, pos)
+        pos += _TILESET.size
+        tmx_map.tilesets.append(
+            TmxTileset(
+                firstgid=values[0],
+                name=lookup(values[1]),
+                tilewidth=values[2],
+                tileheight=values[3],
+                tilecount=values[4],
+                columns=values[5],
+                margin=values[6],
+                spacing=values[7],
+                image_source=lookup(values[8]),
+            )
+        )
+
+    for idx in struct.unpack_from(f"<{n_groups}I", mm, pos):
+        tmx_map.objectgroups.append(TmxObjectGroup(name=lookup(idx)))
+    pos += 4 * n_groups
+
+    for _ in range(n_objects):
+        group_idx, obj_id, name_idx, type_idx, gid, x, y, w, h, props_idx = (
+            _OBJECT.unpack_from(mm, pos)
+        )
+        pos += _OBJECT.size
+        props = lookup(props_idx)
+        tmx_map.objectgroups[group_idx].objects.append(
+            TmxObject(
+                id=obj_id,
+                name=lookup(name_idx),
+                type=lookup(type_idx),
+                x=x,
+                y=y,
+                width=w,
+                height=h,
+                gid=gid,
+                properties=json.loads(props) if props else {},
+            )
+        )
+
+    view = memoryview(mm)
+    for _ in range(n_layers):
+        name_idx, layer_w, layer_h, offset = _LAYER.unpack_from(mm, pos)
+        pos += _LAYER.size
+        raw = view[offset:offset + 4 * layer_w * layer_h]
+        if len(raw) != 4 * layer_w * layer_h:
+            raise ValueError(f"слой обрезан (смещение {offset})")
+        if sys.byteorder == "little":
+            # Без копирования: слой ссылается прямо на отображённый файл
+            data = raw.cast("I")
+        else:
+            data = array.array("I", raw.tobytes())
+            data.byteswap()
+        tmx_map.layers.append(TmxLayer(lookup(name_idx), layer_w, layer_h, data))
+
+    return tmx_map
+
+
+def write_compiled(path, tmx_map: TmxMap, digest: bytes):
+    """Атомарно записывает скомпилированный уровень."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(compile_map(tmx_map, digest))
+    os.replace(tmp_path, path)
+
+
+def load_map(tmx_path, cache_dir=None, use_cache=True) -> TmxMap:
+    """
+    Возвращает карту уровня: из кэша, если он актуален, иначе разбирает TMX
+    и обновляет кэш. Ошибки записи кэша не мешают загрузке уровня.
+    Путь к .lvlc (например, от генератора уровней) читается напрямую.
+    """
+    if tmx_path.endswith(CACHE_EXTENSION):
+        tmx_map = read_compiled(tmx_path)
+        if tmx_map is None:
+            raise ValueError(f"Не удалось прочитать скомпилированный уровень {tmx_path}")
+        return tmx_map
+
+    with open(tmx_path, "rb") as f:
+        source = f.read()
+    if not use_cache:
+        return load_tmx(io.BytesIO(source))
+
+    digest = source_digest(source)
+    cache_path = get_cache_path(tmx_path, cache_dir)
+
+    tmx_map = read_compiled(cache_path, expected_digest=digest)
+    if tmx_map is not None:
+        print(f"⚡ Уровень загружен из кэша: {cache_path}")
+        return tmx_map
+
+    tmx_map = load_tmx(io.BytesIO(source))
+    try:
+        write_compiled(cache_path, tmx_map, digest)
+        print(f"💾 Скомпилированный уровень сохранён: {cache_path}")
+    except OSError as e:
+        print(f"⚠️ Не удалось сохранить кэш уровня {cache_path}: {e}")
+    return tmx_map
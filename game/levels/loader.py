@@ -0,0 +1,125 @@
+# game/levels/loader.py
+"""
+Фоновая загрузка уровня.
+
+Level создаётся в две фазы:
+- CPU-фаза в рабочем потоке: чтение карты (.lvlc через mmap или разбор TMX),
+  раскладка уровня (записи тайлов и объектов, цепочки склонов —
+  game/levels/layout.py) и декодирование PNG tilesets и фона.
+  pygame.image.load и zlib отпускают GIL, окно для них не нужно, кэши
+  AssetLoader не изменяются.
+- фаза поверхностей в главном потоке: convert_alpha, создание спрайтов по
+  записям, индексы и запекание чанков (Level.__init__ с готовой раскладкой).
+  Спрайты остаются здесь: каждый берёт изображение из кэшей AssetLoader,
+  которые не защищены от одновременного доступа.
+
+Пока идёт CPU-фаза, главный цикл продолжает рисовать экран загрузки по
+progress/stage. Так же можно заранее подготовить следующий уровень, пока
+игрок проходит текущий.
+"""
+
+import threading
+
+from ..asset_loader import asset_loader
+from ..asset_manifest import MANIFESTS, map_images
+from ..path_utils import resource_path
+from .layout import build_level_layout
+from .level1 import Level
+from .level_cache import load_map
+
+# Доля прогресса, которая приходится на CPU-фазу (остальное — главный поток)
+CPU_PHASE_SHARE = 0.9
+
+
+class LevelLoader:
+    def __init__(self, name, tmx_path=None, tmx_map=None):
+        self.name = name
+        self.tmx_path = tmx_path or resource_path(
+            "game", "assets", "levels", f"{name}.tmx"
+        )
+        self.tmx_map = tmx_map
+        self.layout = None
+        self.decoded_images = {}
+        self.error = None
+        # Прогресс 0..1 и текущий этап для экрана загрузки
+        self.progress = 0.0
+        self.stage = "ожидание"
+        self.level = None
+        self._prepared = threading.Event()
+        self._thread = None
+
+    def start(self):
+        """Запускает CPU-фазу в фоновом потоке"""
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._prepare, name=f"level-loader-{self.name}", daemon=True
+            )
+            self._thread.start()
+        return self
+
+    @property
+    def prepared(self):
+        """CPU-фаза завершена (успешно или с ошибкой)"""
+        return self._prepared.is_set()
+
+    def _prepare(self):
+        try:
+            if self.tmx_map is None:
+                self.stage = "чтение карты"
+                self.tmx_map = load_map(self.tmx_path)
+            self.progress = 0.2
+
+            self.stage = "разбор объектов"
+            self.layout = build_level_layout(self.tmx_map)
+            self.progress = 0.3
+
+            # Манифест уровня и tilesets карты, ещё не загруженные AssetLoader
+            names = [
+                entry if isinstance(entry, str) else entry[0]
+                for entry in MANIFESTS["level"]
+            ]
+            names.extend(map_images(self.tmx_map))
+            names = [
+                name
+                for name in names
+                if name not in asset_loader.assets and name not in asset_loader.tilesets
+            ]
+            if names:
+                self.stage = f"декодирование изображений ({len(names)})"
+                # Ошибки чтения покажет обычная загрузка в главном потоке
+                self.decoded_images = asset_loader.decode_images(names)
+        except Exception as e:
+            # Карта не прочиталась: Level в главном потоке попробует ещё раз
+            # и сообщит об ошибке сам
+            print(f"❌ Ошибка фоновой загрузки уровня '{self.name}': {e}")
+            self.error = e
+            self.tmx_map = None
+            self.layout = None
+        finally:
+            self.progress = CPU_PHASE_SHARE
+            self.stage = "создание объектов"
+            self._prepared.set()
+
+    def poll(self):
+        """
+        Вызывается из главного потока каждый кадр. Когда CPU-фаза готова,
+        создаёт Level (фаза поверхностей) и возвращает его; до того — None.
+        """
+        if self.level is None and self.prepared:
+            self.level = Level(
+                self.name,
+                tmx_path=self.tmx_path,
+                tmx_map=self.tmx_map,
+                decoded_images=self.decoded_images,
+                layout=self.layout,
+            )
+            self.decoded_images = {}
+            self.progress = 1.0
+            self.stage = "готово"
+        return self.level
+
+    def wait(self, timeout=None):
+        """Дожидается CPU-фазы и возвращает готовый Level (для тестов и утилит)"""
+        self.start()
+        self._prepared.wait(timeout)
+        return self.poll()
@@ -0,0 +1,122 @@
+# game/levels/tile_chunks.py
+"""
+Предварительно отрисованные чанки статической геометрии уровня.
+
+Платформы и декорации не двигаются, поэтому при загрузке уровня они
+запекаются в поверхности CHUNK_SIZE x CHUNK_SIZE. Каждый кадр рисуются только
+чанки, пересекающие экран (обычно 2-4), и стоимость отрисовки не зависит от
+количества тайлов на карте. Чанк перерисовывается только после invalidate(),
+например когда разрушен ящик.
+
+На больших картах все чанки в память не помещаются (1024x1024 RGBA — 4 МБ),
+поэтому при числе чанков больше MAX_CACHED_CHUNKS они запекаются при первом
+появлении на экране, а давно не видимые вытесняются (LRU).
+"""
+
+import pygame
+
+
+CHUNK_SIZE = 1024
+MAX_CACHED_CHUNKS = 32
+
+
+class TileChunkRenderer:
+    def __init__(self, groups, chunk_size=CHUNK_SIZE, max_chunks=MAX_CACHED_CHUNKS):
+        # Группы запекаются в указанном порядке (платформы под декорациями)
+        self.groups = list(groups)
+        self.chunk_size = chunk_size
+        self.max_chunks = max_chunks
+        self.chunks = {}  # (cx, cy) -> Surface, порядок — от давно видимых к недавним
+        self.tile_keys = set()  # чанки, в которых есть тайлы
+        self.dirty = set()
+
+    def chunk_rect(self, key):
+        size = self.chunk_size
+        return pygame.Rect(key[0] * size, key[1] * size, size, size)
+
+    def chunk_keys(self, rect):
+        """Ключи всех чанков, которые пересекает прямоугольник мира."""
+        size = self.chunk_size
+        x0, y0 = rect.left // size, rect.top // size
+        x1, y1 = (rect.right - 1) // size, (rect.bottom - 1) // size
+        return [(cx, cy) for cy in range(y0, y1 + 1) for cx in range(x0, x1 + 1)]
+
+    def build(self, bake=True):
+        """
+        Полное запекание: чанки создаются только там, где есть тайлы.
+        С bake=False (или если чанков больше max_chunks) чанки лишь
+        помечаются и рисуются при первом появлении на экране
+        (в безголовом режиме кадров может не быть вовсе).
+        """
+        keys = set()
+        for group in self.groups:
+            for sprite in group:
+                keys.update(self.chunk_keys(sprite.rect))
+        self.chunks.clear()
+        self.tile_keys = keys
+        self.dirty = set(keys)
+        if bake and len(keys) <= self.max_chunks:
+            self.rebuild_dirty()
+
+    def invalidate(self, rect):
+        """Помечает чанки, пересекающие rect, для перерисовки перед следующим кадром."""
+        keys = self.chunk_keys(rect)
+        self.tile_keys.update(keys)
+        self.dirty.update(keys)
+
+    def rebuild_dirty(self):
+        for key in self.dirty:
+            self._render_chunk(key)
+        self.dirty.clear()
+
+    def _render_chunk(self, key):
+        area = self.chunk_rect(key)
+        surface = pygame.Surface(area.size, pygame.SRCALPHA)
+        # pygame смешивает в прозрачную поверхность в прямой (straight) альфе,
+        # поэтому обычный блит чанка совпадает с поочерёдными блитами тайлов
+        offset_x, offset_y = -area.x, -area.y
+        empty = True
+        for group in self.groups:
+            if hasattr(group, "query"):
+                sprites = group.query(area)
+            else:
+                sprites = [sprite for sprite in group if sprite.rect.colliderect(area)]
+            for sprite in sprites:
+                surface.blit(sprite.image, sprite.rect.move(offset_x, offset_y))
+                empty = False
+
+        self.chunks.pop(key, None)
+        if empty:
+            self.tile_keys.discard(key)
+            return None
+        self.chunks[key] = surface
+        return surface
+
+    def _get_chunk(self, key):
+        """Поверхность чанка: из кэша (с отметкой использования) или запечённая заново."""
+        if key not in self.tile_keys:
+            return None
+        if key in self.dirty:
+            self.dirty.discard(key)
+            return self._render_chunk(key)
+        surface = self.chunks.pop(key, None)
+        if surface is None:
+            return self._render_chunk(key)
+        self.chunks[key] = surface
+        return surface
+
+    def draw(self, screen, camera):
+        """Рисует видимые чанки; возвращает их количество."""
+        view = pygame.Rect(camera.offset.x, camera.offset.y, *screen.get_size())
+        drawn = 0
+        for key in self.chunk_keys(view):
+            surface = self._get_chunk(key)
+            if surface is None:
+                continue
+            screen.blit(surface, camera.apply(self.chunk_rect(key)))
+            drawn += 1
+
+        # Вытесняем давно не видимые чанки
+        while len(self.chunks) > self.max_chunks:
+            del self.chunks[next(iter(self.chunks))]
+        return drawn
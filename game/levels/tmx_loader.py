@@ -0,0 +1,343 @@
+# game/levels/tmx_loader.py
+"""
+Потоковый загрузчик карт Tiled (.tmx).
+
+Карта читается через xml.etree.ElementTree.iterparse: каждый слой декодируется
+в момент закрытия его тега, после чего XML-элемент очищается. Поэтому память и
+время загрузки растут пропорционально размеру карты, а не количеству вручную
+написанных слоёв.
+"""
+
+import array
+import base64
+import gzip
+import struct
+import sys
+import zlib
+import xml.etree.ElementTree as ET
+from dataclasses import dataclass, field
+from itertools import compress
+from typing import Dict, List, Optional
+
+
+# Tiled хранит флаги отражения в старших битах GID
+FLIPPED_HORIZONTALLY_FLAG = 0x80000000
+FLIPPED_VERTICALLY_FLAG = 0x40000000
+FLIPPED_DIAGONALLY_FLAG = 0x20000000
+ROTATED_HEXAGONAL_120_FLAG = 0x10000000
+GID_MASK = 0x0FFFFFFF
+
+# Флаги занимают старший байт GID: в little-endian это каждый четвёртый байт,
+# поэтому маскирование сводится к bytes.translate по срезу [3::4]
+_HIGH_BYTE_MASK = bytes(value & (GID_MASK >> 24) for value in range(256))
+
+
+@dataclass
+class TmxTileset:
+    firstgid: int
+    name: str
+    tilewidth: int
+    tileheight: int
+    tilecount: int = 0
+    columns: int = 0
+    margin: int = 0
+    spacing: int = 0
+    image_source: Optional[str] = None
+
+
+@dataclass
+class TmxLayer:
+    name: str
+    width: int
+    height: int
+    data: array.array = None  # GID-ы построчно (row-major), array или memoryview
+
+    @property
+    def grid(self) -> memoryview:
+        """Двумерное представление grid[y, x] без копирования данных."""
+        return memoryview(self.data).cast("B").cast("I", (self.height, self.width))
+
+    def nonzero_indices(self):
+        """Индексы непустых клеток; пустые отбрасываются на уровне C."""
+        return compress(range(len(self.data)), self.data)
+
+    def iter_tiles(self):
+        """(x, y, gid) только для непустых клеток слоя."""
+        data = self.data
+        width = self.width
+        for index in self.nonzero_indices():
+            y, x = divmod(index, width)
+            yield x, y, data[index]
+
+
+@dataclass
+class TmxObject:
+    id: int
+    name: str
+    type: str
+    x: float
+    y: float
+    width: float = 0.0
+    height: float = 0.0
+    gid: int = 0
+    properties: Dict[str, str] = field(default_factory=dict)
+
+
+@dataclass
+class TmxObjectGroup:
+    name: str
+    objects: List[TmxObject] = field(default_factory=list)
+
+
+@dataclass
+class TmxMap:
+    width: int
+    height: int
+    tilewidth: int
+    tileheight: int
+    tilesets: List[TmxTileset] = field(default_factory=list)
+    layers: List[TmxLayer] = field(default_factory=list)
+    objectgroups: List[TmxObjectGroup] = field(default_factory=list)
+
+    @property
+    def pixel_width(self) -> int:
+        return self.width * self.tilewidth
+
+    @property
+    def pixel_height(self) -> int:
+        return self.height * self.tileheight
+
+    def get_layer(self, name) -> Optional[TmxLayer]:
+        for layer in self.layers:
+            if layer.name == name:
+                return layer
+        return None
+
+    def get_objectgroup(self, name) -> Optional[TmxObjectGroup]:
+        for group in self.objectgroups:
+            if group.name == name:
+                return group
+        return None
+
+
+def decode_layer_data(text, encoding="base64", compression=None):
+    """
+    Декодирует содержимое <data> слоя в плоский массив GID (uint32, row-major).
+    Флаги отражения Tiled снимаются. Для base64 результат — memoryview поверх
+    распакованного буфера: данные не копируются поэлементно.
+    """
+    text = text or ""
+
+    if encoding == "csv":
+        values = [
+            int(v) & GID_MASK for v in text.replace("\n", "").split(",") if v.strip()
+        ]
+        return array.array("I", values)
+
+    if encoding != "base64":
+        raise ValueError(f"Неподдерживаемая кодировка слоя: {encoding}")
+
+    raw = base64.b64decode(text.strip())
+    if compression == "zlib":
+        raw = zlib.decompress(raw)
+    elif compression == "gzip":
+        raw = gzip.decompress(raw)
+    elif compression:
+        raise ValueError(f"Неподдерживаемое сжатие слоя: {compression}")
+
+    if struct.calcsize("I") != 4:
+        raise ValueError("Платформа не поддерживает 32-битный формат 'I'")
+    if len(raw) % 4:
+        raise ValueError(f"Длина данных слоя не кратна 4: {len(raw)}")
+
+    # Tiled всегда пишет GID в little-endian
+    if sys.byteorder == "big":
+        tile_data = array.array("I")
+        tile_data.frombytes(raw)
+        tile_data.byteswap()
+        if any(gid & ~GID_MASK for gid in tile_data):
+            tile_data = array.array("I", (gid & GID_MASK for gid in tile_data))
+        return tile_data
+
+    high_bytes = raw[3::4]
+    if high_bytes.translate(_HIGH_BYTE_MASK) != high_bytes:
+        raw = bytearray(raw)
+        raw[3::4] = high_bytes.translate(_HIGH_BYTE_MASK)
+    return memoryview(raw).cast("I")
+
+
+def _parse_properties(elem):
+    props = {}
+    for prop in elem.iter("property"):
+        props[prop.get("name", "")] = prop.get("value", prop.text or "")
+    return props
+
+
+def load_tmx(path) -> TmxMap:
+    """Загружает .tmx файл целиком за один проход iterparse."""
+    tmx_map = None
+    current_group = None
+    current_layer = None
+
+    for event, elem in ET.iterparse(path, events=("start", "end")):
+        tag = elem.tag
+
+        if event == "start":
+            if tag == "map":
+                tmx_map = TmxMap(
+                    width=int(elem.get("width", 0)),
+                    height=int(elem.get("height", 0)),
+                    tilewidth=int(elem.get("tilewidth", 0)),
+                    tileheight=int(elem.get("tileheight", 0)),
+                )
+            elif tag == "objectgroup":
+                current_group = TmxObjectGroup(name=elem.get("name", ""))
+            elif tag == "layer":
+                current_layer = TmxLayer(
+                    name=elem.get("name", ""),
+                    width=int(elem.get("width", tmx_map.width)),
+                    height=int(elem.get("height", tmx_map.height)),
+                )
+            continue
+
+        # event == "end": элемент прочитан полностью
+        if tag == "tileset":
+            image = elem.find("image")
+            tmx_map.tilesets.append(
+                TmxTileset(
+                    firstgid=int(elem.get("firstgid", 1)),
+                    name=elem.get("name", ""),
+                    tilewidth=int(elem.get("tilewidth", tmx_map.tilewidth)),
+                    tileheight=int(elem.get("tileheight", tmx_map.tileheight)),
+                    tilecount=int(elem.get("tilecount", 0)),
+                    columns=int(elem.get("columns", 0)),
+                    margin=int(elem.get("margin", 0)),
+                    spacing=int(elem.get("spacing", 0)),
+                    image_source=image.get("source") if image is not None else None,
+                )
+            )
+            elem.clear()
+
+        elif tag == "data" and current_layer is not None:
+            current_layer.data = decode_layer_data(
+                elem.text, elem.get("encoding", "csv"), elem.get("compression")
+            )
+            elem.clear()
+
+        elif tag == "layer":
+            if current_layer.data is None:
+                current_layer.data = (
+                    array.array("I", [0]) * (current_layer.width * current_layer.height)
+                )
+            tmx_map.layers.append(current_layer)
+            current_layer = None
+            elem.clear()
+
+        elif tag == "object" and current_group is not None:
+            gid = int(elem.get("gid", 0))
+            current_group.objects.append(
+                TmxObject(
+                    id=int(elem.get("id", 0)),
+                    name=elem.get("name", ""),
+                    # В Tiled 1.9+ атрибут называется class, раньше — type
+                    type=elem.get("type") or elem.get("class") or "",
+                    x=float(elem.get("x", 0)),
+                    y=float(elem.get("y", 0)),
+                    width=float(elem.get("width", 0)),
+                    height=float(elem.get("height", 0)),
+                    gid=gid & GID_MASK,
+                    properties=_parse_properties(elem),
+                )
+            )
+            elem.clear()
+
+        elif tag == "objectgroup":
+            tmx_map.objectgroups.append(current_group)
+            current_group = None
+            elem.clear()
+
+    if tmx_map is None:
+        raise ValueError(f"Файл {path} не содержит элемента <map>")
+    return tmx_map
+
+
+def _format_number(value):
+    """Координаты объектов: целые без дробной части, как пишет Tiled"""
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+def write_tmx(tmx_map: TmxMap, path):
+    """
+    Сохраняет карту в .tmx (слои base64+zlib), который читает load_tmx.
+    Используется генераторами синтетических уровней и бенчмарками.
+    """
+    root = ET.Element(
+        "map",
+        version="1.10",
+        orientation="orthogonal",
+        renderorder="right-down",
+        width=str(tmx_map.width),
+        height=str(tmx_map.height),
+        tilewidth=str(tmx_map.tilewidth),
+        tileheight=str(tmx_map.tileheight),
+        infinite="0",
+    )
+    for tileset in tmx_map.tilesets:
+        elem = ET.SubElement(
+            root,
+            "tileset",
+            firstgid=str(tileset.firstgid),
+            name=tileset.name,
+            tilewidth=str(tileset.tilewidth),
+            tileheight=str(tileset.tileheight),
+            tilecount=str(tileset.tilecount),
+            columns=str(tileset.columns),
+        )
+        if tileset.margin:
+            elem.set("margin", str(tileset.margin))
+        if tileset.spacing:
+            elem.set("spacing", str(tileset.spacing))
+        if tileset.image_source:
+            ET.SubElement(elem, "image", source=tileset.image_source)
+
+    for layer_id, layer in enumerate(tmx_map.layers, start=1):
+        elem = ET.SubElement(
+            root,
+            "layer",
+            id=str(layer_id),
+            name=layer.name,
+            width=str(layer.width),
+            height=str(layer.height),
+        )
+        raw = array.array("I", layer.data)
+        if sys.byteorder == "big":
+            raw.byteswap()
+        data = ET.SubElement(elem, "data", encoding="base64", compression="zlib")
+        data.text = base64.b64encode(zlib.compress(raw.tobytes())).decode("ascii")
+
+    for group in tmx_map.objectgroups:
+        group_elem = ET.SubElement(root, "objectgroup", name=group.name)
+        for obj in group.objects:
+            elem = ET.SubElement(
+                group_elem,
+                "object",
+                id=str(obj.id),
+                x=_format_number(obj.x),
+                y=_format_number(obj.y),
+            )
+            if obj.name:
+                elem.set("name", obj.name)
+            if obj.type:
+                elem.set("type", obj.type)
+            if obj.gid:
+                elem.set("gid", str(obj.gid))
+            if obj.width:
+                elem.set("width", _format_number(obj.width))
+            if obj.height:
+                elem.set("height", _format_number(obj.height))
+            if obj.properties:
+                props = ET.SubElement(elem, "properties")
+                for name, value in obj.properties.items():
+                    ET.SubElement(props, "property", name=name, value=str(value))
+
+    ET.ElementTree(root).write(path, encoding="UTF-8", xml_declaration=True)
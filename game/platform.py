@@ -11,16 +11,20 @@ class Platform(pygame.sprite.Sprite):
         self.is_door = is_door
         
         # 🔥 ИСПОЛЬЗУЕМ TILESET ДЛЯ ПОЛУЧЕНИЯ ИЗОБРАЖЕНИЯ
-        self.image = self.get_tile_image(platform_type)
-        if self.image:
-            self.image = pygame.transform.scale(self.image, (width, height))
-        else:
+        # Поверхность общая для всех платформ этого типа и размера
+        self.image = self.get_tile_image(platform_type, (width, height))
+        if not self.image:
             # Заглушка если тайл не найден
             self.image = pygame.Surface((width, height))
             self.image.fill((100, 200, 100))  # Зеленый для платформ
         
         self.rect = self.image.get_rect(topleft=(x, y))
         self.has_collision = True
+
+        # Соседние наклонные тайлы; заполняются link_slopes() при загрузке уровня
+        self.slope_left = None
+        self.slope_right = None
+        self.slopes_linked = False
         
         # 🔥 СОЗДАЕМ СПЕЦИАЛЬНЫЕ COLLISION_RECT ДЛЯ РАЗНЫХ ТИПОВ
         self.collision_rect = self.create_collision_rect()
@@ -99,7 +103,16 @@ class Platform(pygame.sprite.Sprite):
     
     
     
-    def get_tile_image(self, platform_type):
+    def surface_y_at(self, x):
+        """Высота поверхности платформы (мировой Y верхней кромки) в точке x"""
+        if self.platform_type == "triangle":
+            # Склон поднимается слева направо: у левого края — низ тайла, у правого — верх
+            relative_x = (x - self.rect.left) / self.rect.width
+            relative_x = max(0.0, min(1.0, relative_x))
+            return self.rect.bottom - relative_x * self.rect.height
+        return self.collision_rect.top
+
+    def get_tile_image(self, platform_type, size=None):
         """🔥 ПОЛУЧАЕМ ТАЙЛ ИЗ TILESET ПО ТИПУ"""
         type_to_gid = {
             "grass1": 1,  
@@ -117,9 +130,55 @@ class Platform(pygame.sprite.Sprite):
         }
         
         gid = type_to_gid.get(platform_type, 1)
-        return asset_loader.get_tile_image(gid)
+        return asset_loader.get_tile_image(gid, size)
     
     def draw(self, screen, camera):
         screen.blit(self.image, camera.apply(self.rect))
-        
-        
\ No newline at end of file
+
+
+# Допуск при сопоставлении кромок соседних тайлов (как в проверках игрока)
+SLOPE_EDGE_TOLERANCE = 5
+
+
+def find_adjacent_slope(slope, platforms):
+    """
+    Поиск наклонного тайла справа от slope перебором platforms.
+    Сначала ищется тайл в том же ряду, затем продолжение склона рядом выше.
+    """
+    same_row = continuation = None
+    for platform in platforms:
+        if platform is slope or getattr(platform, "platform_type", None) != "triangle":
+            continue
+        if abs(platform.rect.left - slope.rect.right) >= SLOPE_EDGE_TOLERANCE:
+            continue
+        if same_row is None and abs(platform.rect.bottom - slope.rect.bottom) < SLOPE_EDGE_TOLERANCE:
+            same_row = platform
+        elif continuation is None and abs(platform.rect.bottom - slope.rect.top) < SLOPE_EDGE_TOLERANCE:
+            continuation = platform
+    return same_row or continuation
+
+
+def link_slopes(platforms):
+    """
+    Связывает наклонные тайлы в цепочки slope_left/slope_right.
+    Вызывается один раз при загрузке уровня; дальше переход между склонами —
+    это обращение к атрибуту вместо перебора всех платформ.
+    """
+    slopes = [p for p in platforms if getattr(p, "platform_type", None) == "triangle"]
+    by_left_edge = {}
+    for slope in slopes:
+        by_left_edge.setdefault(slope.rect.left // SLOPE_EDGE_TOLERANCE, []).append(slope)
+
+    def candidates(x):
+        bucket = x // SLOPE_EDGE_TOLERANCE
+        for key in (bucket - 1, bucket, bucket + 1):
+            yield from by_left_edge.get(key, ())
+
+    for slope in slopes:
+        slope.slope_left = None
+    for slope in slopes:
+        slope.slope_right = find_adjacent_slope(slope, candidates(slope.rect.right))
+        if slope.slope_right is not None and slope.slope_right.slope_left is None:
+            slope.slope_right.slope_left = slope
+        slope.slopes_linked = True
+    return len(slopes)
@@ -1,9 +1,19 @@
+import math
+
 import pygame
-from .asset_loader import asset_loader
+from .animation import Animator, load_clips
+from .platform import find_adjacent_slope
+from .spatial import nearby
 from game.assets.audio import AudioManager
 
 
 class Player:
+    # Запас вокруг хитбокса при выборке платформ из пространственного индекса
+    COLLISION_QUERY_MARGIN = 128
+    # Длительность шага, в котором заданы скорости и гравитация (пиксели за
+    # шаг 60 Гц); при другой частоте шагов движение масштабируется по dt
+    FIXED_DT = 1 / 60
+
     class HealthComponent:
         def __init__(self, max_health):
             self.max_health = max_health
@@ -56,11 +66,8 @@ class Player:
         self.jump_buffer = 0
         self.jump_buffer_time = 0.1
 
-        # Анимации
+        # Анимации (клипы и проигрыватель создаются в load_sprites)
         self.current_state = "idle"
-        self.animation_frame = 0
-        self.animation_speed = 0.2
-        self.animation_timer = 0
 
         # Система урона
         self.is_invincible = False
@@ -104,26 +111,27 @@ class Player:
         self.old_x = x
         self.old_y = y
 
+        # Дробная часть движения, ещё не попавшая в rect (см. move_subpixel),
+        # и позиция rect после последнего такого сдвига
+        self.subpixel = [0.0, 0.0]
+        self.subpixel_origin = (x, y)
+
     def collect_yellow_key(self):
         """Отмечает, что игрок подобрал жёлтый ключ."""
         self.has_yellow_key = True
         print("🔑 Yellow key collected")
 
     def load_sprites(self):
-        """Загружает все спрайты для анимаций"""
-        self.idle_sprite = asset_loader.load_image("player/alienPink_front.png", 0.6)
-        self.run_sprites = [
-            asset_loader.load_image("player/alienPink_stand.png", 0.6),
-            asset_loader.load_image("player/alienPink_walk1.png", 0.6),
-            asset_loader.load_image("player/alienPink_walk2.png", 0.6),
-        ]
-        self.jump_sprite = asset_loader.load_image("player/alienPink_jump.png", 0.6)
-        self.land_sprite = asset_loader.load_image("player/alienPink_duck.png", 0.6)
-
-    def update_animation(self, moved):
+        """Клипы анимаций игрока (общие для всех экземпляров, см. game/animation.py)"""
+        self.animator = Animator(load_clips("player"), "idle")
+        self.idle_sprite = self.animator.clips["idle"].frames[0]
+
+    def update_animation(self, moved, dt=None):
         """Обновляет анимацию в зависимости от состояния игрока"""
         if not self.is_alive:
             return
+        if dt is None:
+            dt = self.FIXED_DT
 
         previous_state = self.current_state
 
@@ -138,47 +146,33 @@ class Player:
         else:
             self.current_state = "idle"
 
-        # Если состояние изменилось — сбрасываем кадр/таймер
-        if previous_state != self.current_state:
-            self.animation_frame = 0
-            self.animation_timer = 0
-
-        # Прогресс таймера анимации
-        self.animation_timer += self.animation_speed
-
-        if self.current_state == "run":
-            # Бег — циклическая анимация
-            if self.animation_timer >= 1:
-                self.animation_frame = (self.animation_frame + 1) % len(
-                    self.run_sprites
-                )
-                self.animation_timer = 0
-            self.current_sprite = self.run_sprites[self.animation_frame]
-
-        elif self.current_state == "idle":
-            self.current_sprite = self.idle_sprite
-
-        elif self.current_state == "jump":
-            self.current_sprite = self.jump_sprite
-
-        elif self.current_state == "land":
-            # Приземление — показываем спрайт duck на короткое время, затем возвращаемся в idle
-            self.current_sprite = self.land_sprite
-            if self.animation_timer >= 0.2:
-                self.current_state = "idle"
-                self.current_sprite = self.idle_sprite
-                self.animation_frame = 0
-                self.animation_timer = 0
+        # Смена состояния запускает клип сначала
+        self.animator.play(self.current_state)
+        self.animator.update(dt)
+
+        if self.current_state == "land" and self.animator.finished:
+            # Приземление показано — возвращаемся в idle
+            self.current_state = "idle"
+            self.animator.play("idle")
+
+        self.current_sprite = self.animator.image()
 
     def handle_landing_animation(self):
         """Обрабатывает завершение анимации приземления"""
         self.current_state = "idle"
+        self.animator.play("idle")
         self.current_sprite = self.idle_sprite
 
-    def update(self, platforms, enemies, current_time, traps=None):
-        """Обновление состояния игрока с системой урона"""
+    def update(self, platforms, enemies, current_time, traps=None, dt=None):
+        """
+        Обновление состояния игрока с системой урона.
+        Один вызов — один шаг симуляции длительностью dt (по умолчанию
+        FIXED_DT): скорости и гравитация масштабируются на dt / FIXED_DT.
+        """
+        if dt is None:
+            dt = self.FIXED_DT
         if not self.is_alive:
-            self.respawn_timer -= 1 / 60
+            self.respawn_timer -= dt
             if self.respawn_timer <= 0:
                 self.respawn()
             return
@@ -198,13 +192,13 @@ class Player:
 
         # Таймер неуязвимости
         if self.is_invincible:
-            self.invincibility_timer -= 1 / 60
+            self.invincibility_timer -= dt
             if self.invincibility_timer <= 0:
                 self.is_invincible = False
 
         # Таймер отскока
         if self.is_knockback:
-            self.knockback_timer -= 1 / 60
+            self.knockback_timer -= dt
             if self.knockback_timer <= 0:
                 self.is_knockback = False
                 self.velocity_x = 0
@@ -215,9 +209,16 @@ class Player:
         if not self.is_knockback:
             self.handle_horizontal_collisions(platforms)
 
-        # Применяем гравитацию
-        self.velocity_y += self.gravity
-        self.rect.y += self.velocity_y
+        # Применяем гравитацию. Сдвиг за шаг повторяет шаговое интегрирование
+        # при 60 Гц (скорость после ускорения), а поправка k * (k - 1) / 2
+        # держит ту же параболу прыжка при любой частоте шагов
+        k = dt / self.FIXED_DT
+        self.velocity_y += self.gravity * k
+        dy = self.velocity_y * k - self.gravity * k * (k - 1) / 2
+        if was_on_ground and 0 < dy < 1:
+            # Стоя на земле, проверяем опору каждый шаг, как при 60 Гц
+            dy = 1
+        self.move_subpixel(0, dy)
 
         # Обрабатываем вертикальные столкновения
         self.handle_vertical_collisions(platforms)
@@ -228,7 +229,7 @@ class Player:
         elif was_on_ground:
             self.time_since_ground = 0
         else:
-            self.time_since_ground += 1 / 60
+            self.time_since_ground += dt
 
         # Автопрыжок по буферу
         if not self.is_knockback and self.jump_buffer > 0 and self.can_jump():
@@ -238,15 +239,37 @@ class Player:
         # Проверка врагов
         self.check_enemy_collisions(enemies, current_time)
 
+    def move_subpixel(self, dx, dy):
+        """
+        Сдвиг на дробное число пикселей: целая часть попадает в rect, остаток
+        копится до следующего шага. Иначе при частых шагах округление съедало
+        бы медленное движение. Если rect сдвинули коллизии или респавн,
+        остаток по этой оси сбрасывается.
+        """
+        position = (self.rect.x, self.rect.y)
+        for axis, delta in enumerate((dx, dy)):
+            if position[axis] != self.subpixel_origin[axis]:
+                self.subpixel[axis] = 0.0
+            total = self.subpixel[axis] + delta
+            # Округление от нуля, как при присваивании float в pygame.Rect
+            step = int(math.copysign(math.floor(abs(total) + 0.5), total))
+            self.subpixel[axis] = total - step
+            if axis == 0:
+                self.rect.x += step
+            else:
+                self.rect.y += step
+        self.subpixel_origin = (self.rect.x, self.rect.y)
+
     def handle_horizontal_collisions(self, platforms):
         """Обрабатывает горизонтальные столкновения для ВСЕХ типов движения"""
         # 🔥 СБРАСЫВАЕМ ФЛАГИ БЛОКИРОВКИ ПЕРЕД ПРОВЕРКОЙ
         self.blocked_left = False
         self.blocked_right = False
         self.on_slope = False
+        nearby_platforms = self.get_nearby_platforms(platforms)
 
         # Сначала обрабатываем все треугольные платформы, чтобы понять, стоим ли мы на склоне
-        for platform in platforms:
+        for platform in nearby_platforms:
             if hasattr(platform, "has_collision") and not platform.has_collision:
                 continue
             if getattr(platform, "platform_type", None) != "triangle":
@@ -271,22 +294,21 @@ class Player:
 
                 # If we're moving right and approaching the edge, look for next slope
                 if relative_x > 0.7 and self.velocity_x > 0:
-                    for next_platform in platforms:
-                        if (getattr(next_platform, "platform_type", None) == "triangle" and 
-                            abs(next_platform.rect.left - platform.rect.right) < 5):
-                            # Found adjacent slope, adjust position to transition smoothly
-                            next_relative_x = (player_hitbox.centerx - next_platform.rect.left) / next_platform.rect.width
-                            next_relative_x = max(0.0, min(1.0, next_relative_x))
-                            next_slope_height = next_relative_x * next_platform.rect.height
-                            expected_y = next_platform.rect.bottom - next_slope_height - self.hitbox.height - self.hitbox.y
-                            break
+                    next_platform = self.get_next_slope(platform, platforms)
+                    if next_platform is not None:
+                        # Found adjacent slope, adjust position to transition smoothly
+                        expected_y = (
+                            next_platform.surface_y_at(player_hitbox.centerx)
+                            - self.hitbox.height
+                            - self.hitbox.y
+                        )
 
                 # Smoothly adjust Y position to match slope
                 if abs(self.rect.y - expected_y) < 20:  # Only adjust if difference is reasonable
                     self.rect.y = expected_y
 
         # Теперь обрабатываем остальные платформы
-        for platform in platforms:
+        for platform in nearby_platforms:
             # Пропускаем платформы без коллизий
             if hasattr(platform, "has_collision") and not platform.has_collision:
                 continue
@@ -362,7 +384,7 @@ class Player:
         """Обрабатывает вертикальные столкновения"""
         self.on_ground = False
 
-        for platform in platforms:
+        for platform in self.get_nearby_platforms(platforms):
             # Пропускаем платформы без коллизий
             if hasattr(platform, "has_collision") and not platform.has_collision:
                 continue
@@ -443,18 +465,11 @@ class Player:
 
         # Check if we're near the right edge and moving right
         if (relative_x > 0.8 and self.velocity_x > 0 and platforms):
-            # Look for next triangle tile to the right
-            next_tile_x = triangle_right
-            next_tile_y = triangle_bottom
-
-            # Find any triangle tile at this position
-            for platform in platforms:
-                if (platform.platform_type == "triangle" and 
-                    abs(platform.rect.left - next_tile_x) < 5 and 
-                    abs(platform.rect.bottom - next_tile_y) < 5):
-                    # Found adjacent triangle tile, increase tolerance
-                    look_ahead_distance = 30
-                    break
+            # Look for next triangle tile to the right (same row)
+            next_slope = self.get_next_slope(triangle, platforms)
+            if next_slope is not None and abs(next_slope.rect.bottom - triangle_bottom) < 5:
+                # Found adjacent triangle tile, increase tolerance
+                look_ahead_distance = 30
 
         # 🔥 FIX: Adaptive tolerance at slope peak for smooth transition
         if relative_x > 0.85:
@@ -491,12 +506,8 @@ class Player:
         if not enemies:
             return
 
-        if hasattr(enemies, "sprites"):
-            enemy_iterable = enemies.sprites()
-        else:
-            enemy_iterable = enemies
-
-        for enemy in enemy_iterable:
+        # Только враги рядом с хитбоксом: стоимость не растёт с размером карты
+        for enemy in nearby(enemies, self.get_actual_hitbox()):
             if hasattr(enemy, "is_dead") and enemy.is_dead:
                 continue
             if hasattr(enemy, "is_hurt") and enemy.is_hurt:
@@ -581,6 +592,7 @@ class Player:
         self.is_invincible = True
         self.invincibility_timer = 3.0
         self.current_state = "idle"
+        self.animator.play("idle")
         self.current_sprite = self.idle_sprite
 
         # Вызываем callback респавна, если он установлен (для возрождения врагов и т.д.)
@@ -611,20 +623,22 @@ class Player:
             self.handle_landing_animation()
             pygame.time.set_timer(pygame.USEREVENT + 1, 0)
 
-    def handle_keys(self, keys, platforms):
-        """🔥 ИСПРАВЛЕНИЕ: Теперь принимает platforms как параметр"""
+    def handle_keys(self, keys, platforms, dt=None):
+        """🔥 ИСПРАВЛЕНИЕ: Теперь принимает platforms как параметр (dt — для анимации)"""
         if not self.is_alive or self.is_knockback:
             return
 
         moved = False
+        # Скорость задана в пикселях за шаг 60 Гц
+        step = self.speed * (dt or self.FIXED_DT) / self.FIXED_DT
 
         # 🔥 ИСПРАВЛЕНИЕ: ПРОВЕРЯЕМ БЛОКИРОВКУ ПЕРЕД ДВИЖЕНИЕМ
         if (keys[pygame.K_LEFT] or keys[pygame.K_a]) and not self.blocked_left:
-            self.rect.x -= self.speed
+            self.move_subpixel(-step, 0)
             self.facing_right = False
             moved = True
         if (keys[pygame.K_RIGHT] or keys[pygame.K_d]) and not self.blocked_right:
-            self.rect.x += self.speed
+            self.move_subpixel(step, 0)
             self.facing_right = True
             moved = True
 
@@ -632,7 +646,7 @@ class Player:
         if moved:
             self.handle_horizontal_collisions(platforms)
 
-        self.update_animation(moved)
+        self.update_animation(moved, dt)
 
     def can_jump(self):
         return (
@@ -651,6 +665,31 @@ class Player:
             except Exception as e:
                 print(f"[Audio][Player] jump sfx failed: {e}")
 
+    def get_nearby_platforms(self, platforms, area=None):
+        """
+        Платформы, которые могут пересекаться с игроком (или с area).
+        Группа с пространственным индексом отвечает за O(затронутых ячеек);
+        обычный список или Group возвращается целиком.
+        """
+        if not hasattr(platforms, "query"):
+            return platforms
+        if area is None:
+            # Запас на смещения во время разрешения коллизий (ступеньки, склоны)
+            margin = self.COLLISION_QUERY_MARGIN
+            area = self.get_actual_hitbox().inflate(2 * margin, 2 * margin)
+        return platforms.query(area)
+
+    def get_next_slope(self, slope, platforms):
+        """
+        Соседний наклонный тайл справа. У платформ уровня связка готова
+        (link_slopes), для несвязанных платформ выполняется перебор.
+        """
+        if getattr(slope, "slopes_linked", False):
+            return slope.slope_right
+        if not platforms:
+            return None
+        return find_adjacent_slope(slope, platforms)
+
     def check_collision(self, platform):
         """Проверка коллизии с платформой"""
         # Проверяем имеет ли платформа коллизии
@@ -666,7 +705,9 @@ class Player:
 
     def check_trap_collisions(self, traps, current_time):
         """Проверка столкновений с ловушками"""
-        for trap in traps:
+        # Пила сравнивает себя с rect игрока, шипы — с хитбоксом
+        area = self.rect.union(self.get_actual_hitbox())
+        for trap in nearby(traps, area):
             if hasattr(trap, "check_collision") and trap.check_collision(self):
                 self.take_damage_from_trap(trap.damage)
 
@@ -702,7 +743,7 @@ class Player:
 
         if self.current_sprite:
             if not self.facing_right:
-                flipped_sprite = pygame.transform.flip(self.current_sprite, True, False)
+                flipped_sprite = self.animator.image(mirrored=True)
                 screen.blit(flipped_sprite, (screen_x, screen_y))
             else:
                 screen.blit(self.current_sprite, (screen_x, screen_y))
@@ -0,0 +1,146 @@
+# game/profiler.py
+"""
+Профилировщик кадра по подсистемам.
+
+FrameProfiler замеряет время секций (handle_events, player.update, ...)
+внутри кадра, а end_frame() складывает их в скользящее окно последних
+кадров. По окну считаются p50/p95/p99 для оверлея HUD; полная история
+кадров при необходимости сохраняется в CSV или JSON при выходе из игры.
+"""
+
+import csv
+import json
+import time
+from collections import deque
+from contextlib import contextmanager, nullcontext
+
+
+# Секции в порядке игрового цикла
+SECTIONS = (
+    "handle_events",
+    "player.update",
+    "level.update",
+    "camera.update",
+    "level.draw",
+    "player.draw",
+    "hud.draw",
+)
+PERCENTILES = (50, 95, 99)
+
+_NO_SECTION = nullcontext()
+
+
+def percentile(values, percent):
+    """Перцентиль по ближайшему рангу; 0.0 для пустой выборки"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(len(ordered) * percent / 100))
+    return ordered[index]
+
+
+class FrameProfiler:
+    def __init__(self, enabled=True, window=300, keep_history=False):
+        self.enabled = enabled
+        self.window = window
+        # Время секций текущего кадра (секунды); шаг симуляции может
+        # выполниться несколько раз за кадр — время суммируется
+        self.current = dict.fromkeys(SECTIONS, 0.0)
+        # Последние кадры: кортежи (секции в порядке SECTIONS..., весь кадр)
+        self.frames = deque(maxlen=window)
+        self.history = [] if keep_history else None
+        self.frame_count = 0
+        self._frame_start = None
+        self._stats = None
+        self._stats_frame = -1
+
+    def section(self, name):
+        """Контекст замера секции; при выключенном профилировщике ничего не делает"""
+        if not self.enabled:
+            return _NO_SECTION
+        return self._timed(name)
+
+    @contextmanager
+    def _timed(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.current[name] = self.current.get(name, 0.0) + (
+                time.perf_counter() - start
+            )
+
+    def begin_frame(self):
+        """
+        Начинает отсчёт кадра без записи строки: вызывается после кадров меню
+        и загрузки, чтобы их время не попало в первый игровой кадр.
+        """
+        if not self.enabled:
+            return
+        self._frame_start = time.perf_counter()
+        for name in self.current:
+            self.current[name] = 0.0
+
+    def end_frame(self):
+        """Закрывает кадр: переносит замеры секций в окно и историю"""
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        if self._frame_start is None:
+            # Начало первого кадра неизвестно: строка с нулевым временем
+            # исказила бы статистику, отсчёт начинается отсюда
+            self.begin_frame()
+            return
+        frame_time = now - self._frame_start
+        self._frame_start = now
+
+        current = self.current
+        row = tuple(current.get(name, 0.0) for name in SECTIONS) + (frame_time,)
+        self.frames.append(row)
+        if self.history is not None:
+            self.history.append(row)
+        for name in current:
+            current[name] = 0.0
+        self.frame_count += 1
+
+    def stats(self):
+        """
+        {секция: {"p50", "p95", "p99", "max"}} в миллисекундах по окну кадров,
+        включая "frame" — полное время кадра. Пересчитывается раз в кадр.
+        """
+        if self._stats_frame == self.frame_count:
+            return self._stats
+        columns = list(zip(*self.frames)) if self.frames else [()] * (len(SECTIONS) + 1)
+        stats = {}
+        for name, column in zip(SECTIONS + ("frame",), columns):
+            entry = {f"p{p}": percentile(column, p) * 1000.0 for p in PERCENTILES}
+            entry["max"] = max(column, default=0.0) * 1000.0
+            stats[name] = entry
+        self._stats = stats
+        self._stats_frame = self.frame_count
+        return stats
+
+    def dump(self, path):
+        """Сохраняет историю кадров: .csv — по кадру на строку, иначе JSON со сводкой"""
+        rows = self.history if self.history is not None else list(self.frames)
+        header = ("frame",) + tuple(f"{name}_ms" for name in SECTIONS) + ("total_ms",)
+        if path.lower().endswith(".csv"):
+            with open(path, "w", newline="", encoding="utf-8") as f:
+                writer = csv.writer(f)
+                writer.writerow(header)
+                for index, row in enumerate(rows):
+                    writer.writerow(
+                        [index] + [f"{value * 1000.0:.4f}" for value in row]
+                    )
+        else:
+            data = {
+                "sections": list(SECTIONS),
+                "frames": len(rows),
+                "summary": self.stats(),
+                "history_ms": [
+                    [round(value * 1000.0, 4) for value in row] for row in rows
+                ],
+            }
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False, indent=2)
+        print(f"📊 Профиль кадров сохранён: {path} ({len(rows)} кадров)")
@@ -0,0 +1,225 @@
+# game/replay.py
+"""
+Запись и воспроизведение ввода игрока.
+
+InputRecorder по шагам симуляции записывает состояние клавиш, переданное в
+Player.handle_keys, и события, переданные в Player.handle_event. Лог хранится
+в компактном двоичном виде: одинаковые шаги без событий сжимаются в одну
+запись (RLE), поэтому 10 минут игры занимают единицы килобайт. replay()
+прогоняет лог через безголовую GameSession шаг в шаг и возвращает хэш
+конечного состояния и время каждого шага.
+
+Запуск:
+    python -m game.replay session.rpgr [--budget-ms 4]
+"""
+
+import argparse
+import struct
+import sys
+import time
+from dataclasses import dataclass, field
+from typing import List
+
+import pygame
+
+from .profiler import percentile
+from .simulation import GameSession, KeyState
+
+
+MAGIC = b"RPGR"
+FORMAT_VERSION = 1
+
+# Клавиши, которые читает Player.handle_keys; номер бита = индекс в кортеже
+RECORDED_KEYS = (pygame.K_LEFT, pygame.K_a, pygame.K_RIGHT, pygame.K_d, pygame.K_SPACE)
+# События, на которые реагирует Player.handle_event
+RECORDED_EVENT_TYPES = (pygame.KEYDOWN, pygame.KEYUP, pygame.USEREVENT + 1)
+
+_HEADER = struct.Struct("<4sHHB")  # magic, версия, tick_rate, длина имени уровня
+_RECORD = struct.Struct("<HBB")  # повторов, маска клавиш, число событий
+_EVENT = struct.Struct("<HI")  # тип события, клавиша
+MAX_REPEAT = 0xFFFF
+
+
+def keys_to_mask(keys):
+    """Состояние клавиш (get_pressed() или KeyState) -> битовая маска"""
+    mask = 0
+    for bit, key in enumerate(RECORDED_KEYS):
+        if keys[key]:
+            mask |= 1 << bit
+    return mask
+
+
+def mask_to_keys(mask):
+    """Битовая маска -> KeyState для Player.handle_keys"""
+    return KeyState(key for bit, key in enumerate(RECORDED_KEYS) if mask & (1 << bit))
+
+
+class InputLog:
+    """
+    Лог ввода: список записей [повторов, маска клавиш, события].
+    События бывают только у записей с одним повтором.
+    """
+
+    def __init__(self, level_name="level1", tick_rate=60, records=None):
+        self.level_name = level_name
+        self.tick_rate = tick_rate
+        self.records = records if records is not None else []
+
+    @property
+    def ticks(self):
+        return sum(record[0] for record in self.records)
+
+    def append(self, mask, events=()):
+        """Добавляет один шаг, сливая его с предыдущим, если это возможно"""
+        events = tuple(events)
+        last = self.records[-1] if self.records else None
+        if (
+            not events
+            and last is not None
+            and not last[2]
+            and last[1] == mask
+            and last[0] < MAX_REPEAT
+        ):
+            last[0] += 1
+        else:
+            self.records.append([1, mask, events])
+
+    def iter_ticks(self):
+        """Шаги лога: (KeyState, [pygame.event.Event, ...])"""
+        for repeat, mask, events in self.records:
+            keys = mask_to_keys(mask)
+            event_objects = [
+                pygame.event.Event(event_type, key=key) for event_type, key in events
+            ]
+            yield keys, event_objects
+            for _ in range(repeat - 1):
+                yield keys, []
+
+    def to_bytes(self):
+        name = self.level_name.encode("utf-8")
+        chunks = [_HEADER.pack(MAGIC, FORMAT_VERSION, self.tick_rate, len(name)), name]
+        for repeat, mask, events in self.records:
+            chunks.append(_RECORD.pack(repeat, mask, len(events)))
+            for event_type, key in events:
+                chunks.append(_EVENT.pack(event_type, key))
+        return b"".join(chunks)
+
+    @classmethod
+    def from_bytes(cls, data):
+        magic, version, tick_rate, name_length = _HEADER.unpack_from(data, 0)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            raise ValueError("Неизвестный формат лога ввода")
+        offset = _HEADER.size
+        level_name = bytes(data[offset : offset + name_length]).decode("utf-8")
+        offset += name_length
+
+        records = []
+        while offset < len(data):
+            repeat, mask, event_count = _RECORD.unpack_from(data, offset)
+            offset += _RECORD.size
+            events = []
+            for _ in range(event_count):
+                events.append(_EVENT.unpack_from(data, offset))
+                offset += _EVENT.size
+            records.append([repeat, mask, tuple(events)])
+        return cls(level_name, tick_rate, records)
+
+    def save(self, path):
+        with open(path, "wb") as f:
+            f.write(self.to_bytes())
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "rb") as f:
+            return cls.from_bytes(f.read())
+
+
+class InputRecorder:
+    """
+    Записывает ввод игрока по шагам симуляции. События копятся до ближайшего
+    шага: при воспроизведении они подаются в Player.handle_event прямо перед
+    ним, что эквивалентно игре (между шагами состояние мира не меняется).
+    """
+
+    def __init__(self, level_name="level1", tick_rate=60):
+        self.log = InputLog(level_name, tick_rate)
+        self.pending_events = []
+
+    @property
+    def ticks(self):
+        return self.log.ticks
+
+    def record_event(self, event):
+        if event.type in RECORDED_EVENT_TYPES:
+            self.pending_events.append((event.type, getattr(event, "key", 0)))
+
+    def record_tick(self, keys):
+        self.log.append(keys_to_mask(keys), self.pending_events)
+        self.pending_events = []
+
+    def save(self, path):
+        self.log.save(path)
+
+
+@dataclass
+class ReplayResult:
+    ticks: int
+    state_hash: str
+    completed: bool
+    tick_times: List[float] = field(default_factory=list)  # секунды на шаг
+
+    @property
+    def total_time(self):
+        return sum(self.tick_times)
+
+    @property
+    def max_tick_time(self):
+        return max(self.tick_times, default=0.0)
+
+    def percentile(self, percent):
+        return percentile(self.tick_times, percent)
+
+
+def replay(log, session=None):
+    """Прогоняет лог через безголовую сессию и возвращает ReplayResult"""
+    if session is None:
+        session = GameSession(log.level_name, tick_rate=log.tick_rate)
+    tick_times = []
+    clock = time.perf_counter
+    for keys, events in log.iter_ticks():
+        start = clock()
+        session.step_raw(keys, events)
+        tick_times.append(clock() - start)
+    return ReplayResult(
+        ticks=session.tick,
+        state_hash=session.state_hash(),
+        completed=session.completed,
+        tick_times=tick_times,
+    )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Воспроизведение лога ввода")
+    parser.add_argument("log")
+    parser.add_argument(
+        "--budget-ms", type=float, default=None, help="лимит p99 времени шага"
+    )
+    args = parser.parse_args(argv)
+
+    log = InputLog.load(args.log)
+    result = replay(log)
+    p99_ms = result.percentile(99) * 1000.0
+    print(f"🎬 Уровень: {log.level_name}, шагов: {result.ticks}")
+    print(f"🔑 Хэш состояния: {result.state_hash}")
+    print(
+        f"⏱️ Шаг: p50 {result.percentile(50) * 1000.0:.3f} мс, "
+        f"p99 {p99_ms:.3f} мс, max {result.max_tick_time * 1000.0:.3f} мс"
+    )
+    if args.budget_ms is not None and p99_ms > args.budget_ms:
+        print(f"❌ p99 превышает бюджет {args.budget_ms} мс")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,227 @@
+# game/simulation.py
+"""
+Шаг игровой симуляции и безголовый режим.
+
+simulate_tick() — один шаг мира (ввод игрока, физика, уровень, камера);
+его используют и игра (main.RPGPlatformer), и GameSession. GameSession
+запускает Level, Player и врагов без окна: SDL работает с драйвером dummy,
+а AssetLoader по умолчанию не декодирует пиксели (stub_pixels). Это
+позволяет прогонять тысячи сессий на CI для баланса и регрессионных тестов.
+"""
+
+import contextlib
+import hashlib
+import io
+import json
+import os
+from dataclasses import dataclass
+
+import pygame
+
+from .asset_loader import asset_loader
+from .assets.audio import AudioManager
+from .camera import Camera
+from .profiler import FrameProfiler
+
+
+DEFAULT_SCREEN_SIZE = (1400, 800)
+_NO_PROFILER = FrameProfiler(enabled=False)
+
+
+@dataclass(frozen=True)
+class FrameInput:
+    """Ввод игрока за один шаг симуляции"""
+
+    left: bool = False
+    right: bool = False
+    jump: bool = False  # нажатие пробела (KEYDOWN) в этом шаге
+
+
+class KeyState:
+    """Замена pygame.key.get_pressed() для Player.handle_keys"""
+
+    def __init__(self, pressed=()):
+        self.pressed = frozenset(pressed)
+
+    def __getitem__(self, key):
+        return key in self.pressed
+
+    @classmethod
+    def from_input(cls, frame_input):
+        pressed = []
+        if frame_input.left:
+            pressed.append(pygame.K_LEFT)
+        if frame_input.right:
+            pressed.append(pygame.K_RIGHT)
+        if frame_input.jump:
+            pressed.append(pygame.K_SPACE)
+        return cls(pressed)
+
+
+def simulate_tick(player, level, camera, keys, current_time, dt, profiler=None):
+    """
+    Один шаг мира: удерживаемые клавиши, игрок, уровень, камера.
+    profiler (FrameProfiler) замеряет подсистемы; handle_keys входит в
+    player.update, так как тоже проверяет горизонтальные коллизии.
+    """
+    if profiler is None:
+        profiler = _NO_PROFILER
+    with profiler.section("player.update"):
+        player.handle_keys(keys, level.platforms, dt)
+        player.update(
+            platforms=level.platforms,
+            enemies=level.enemies,
+            current_time=current_time,
+            traps=level.traps,
+            dt=dt,
+        )
+    with profiler.section("level.update"):
+        level.update(dt)
+    if camera is not None:
+        with profiler.section("camera.update"):
+            camera.update()
+
+
+def init_headless(stub_pixels=True, audio=False):
+    """
+    Готовит pygame к работе без окна: драйверы dummy и поверхность 1x1,
+    чтобы convert_alpha() работал. Вызывать до создания Level и Player.
+    """
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    pygame.init()
+    if pygame.display.get_surface() is None:
+        pygame.display.set_mode((1, 1))
+    if not audio:
+        # Звук без окна не нужен, а поток микшера SDL с драйвером dummy лишь
+        # тратит время (и изредка падает). Без микшера звуки молча пропускаются
+        AudioManager.get_instance().shutdown()
+    asset_loader.set_stub_pixels(stub_pixels)
+
+
+class GameSession:
+    """
+    Безголовая игровая сессия с API step(inputs).
+
+    quiet=True глушит отладочный вывод уровня и игрока, чтобы массовые
+    прогоны не тратили время на печать.
+    """
+
+    def __init__(
+        self,
+        level_name="level1",
+        tick_rate=60,
+        stub_pixels=True,
+        quiet=True,
+        screen_size=DEFAULT_SCREEN_SIZE,
+    ):
+        init_headless(stub_pixels)
+        # Импорт здесь: модуль уровня тянет за собой врагов и ресурсы
+        from .levels.level1 import Level
+        from .player import Player
+
+        self.quiet = quiet
+        self.step_dt = 1.0 / tick_rate
+        self.tick = 0
+        self.completed = False
+        # InputRecorder (game/replay.py), если ввод нужно записывать
+        self.recorder = None
+        # FrameProfiler, если нужны замеры подсистем по шагам
+        self.profiler = None
+
+        with self._output():
+            self.level = Level(level_name)
+            self.player = Player(0, 0)
+            self.level.set_player(self.player)
+            self.camera = Camera(self.player, screen_size)
+            self.camera.update()
+        self.level.on_level_complete = self._on_level_complete
+
+    @property
+    def time(self):
+        """Игровое время сессии в секундах"""
+        return self.tick * self.step_dt
+
+    def _output(self):
+        if self.quiet:
+            return contextlib.redirect_stdout(io.StringIO())
+        return contextlib.nullcontext()
+
+    def _on_level_complete(self, level_name):
+        self.completed = True
+
+    def step(self, inputs=None):
+        """Продвигает симуляцию на один шаг с вводом inputs (FrameInput)"""
+        inputs = inputs or FrameInput()
+        events = []
+        if inputs.jump:
+            events.append(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_SPACE))
+        self.step_raw(KeyState.from_input(inputs), events)
+
+    def step_raw(self, keys, events=()):
+        """
+        Шаг с «сырым» вводом: события для Player.handle_event и состояние
+        клавиш для Player.handle_keys (как в игровом цикле main.py).
+        """
+        if self.recorder is not None:
+            for event in events:
+                self.recorder.record_event(event)
+            self.recorder.record_tick(keys)
+        with self._output():
+            for event in events:
+                self.player.handle_event(event)
+            self.tick += 1
+            simulate_tick(
+                self.player,
+                self.level,
+                self.camera,
+                keys,
+                self.time,
+                self.step_dt,
+                self.profiler,
+            )
+
+    def run(self, inputs, stop_on_complete=True):
+        """Прогоняет последовательность FrameInput; возвращает число шагов"""
+        steps = 0
+        for frame_input in inputs:
+            self.step(frame_input)
+            steps += 1
+            if stop_on_complete and self.completed:
+                break
+        return steps
+
+    def draw(self, screen):
+        """Отрисовка текущего состояния (например, для скриншота в тесте)"""
+        self.level.draw(screen, self.camera)
+        self.player.draw(screen, self.camera)
+
+    def state(self):
+        """Снимок состояния мира для сравнения прогонов"""
+        player = self.player
+        return {
+            "tick": self.tick,
+            "player": {
+                "rect": tuple(player.rect),
+                "velocity": (player.velocity_x, player.velocity_y),
+                "on_ground": player.on_ground,
+                "alive": player.is_alive,
+                "health": player.health_component.current_health,
+                "coins": player.coins,
+                "keys": player.keys,
+            },
+            "enemies": sorted(
+                (type(enemy).__name__, tuple(enemy.rect)) for enemy in self.level.enemies
+            ),
+            "items": sorted(
+                (getattr(item, "item_type", ""), tuple(item.rect), item.collected)
+                for item in self.level.items
+            ),
+            "platforms": len(self.level.platforms),
+            "completed": self.completed,
+        }
+
+    def state_hash(self):
+        """SHA-256 снимка state(): короткий отпечаток для сравнения прогонов"""
+        data = json.dumps(self.state(), sort_keys=True)
+        return hashlib.sha256(data.encode("utf-8")).hexdigest()
@@ -0,0 +1,155 @@
+# game/spatial.py
+"""
+Пространственный индекс на равномерной сетке.
+
+SpatialHash хранит объекты в ячейках CELL_SIZE x CELL_SIZE и отвечает на
+запрос "кто пересекает прямоугольник" за O(затронутых ячеек) вместо обхода
+всех объектов. SpatialGroup — pygame.sprite.Group, который поддерживает такой
+индекс автоматически при add/remove/kill.
+"""
+
+import pygame
+
+
+CELL_SIZE = 256
+# Запас вокруг прямоугольника в nearby(): индекс подвижных спрайтов
+# обновляется раз в тик и может отставать на несколько пикселей
+NEARBY_MARGIN = 64
+
+
+class SpatialHash:
+    def __init__(self, cell_size=CELL_SIZE):
+        self.cell_size = cell_size
+        self.cells = {}  # (cx, cy) -> {obj: None}
+        self._bounds = {}  # obj -> (x0, y0, x1, y1) занимаемых ячеек
+        self._order = {}  # obj -> порядковый номер вставки
+        self._counter = 0
+
+    def __len__(self):
+        return len(self._bounds)
+
+    def __contains__(self, obj):
+        return obj in self._bounds
+
+    def cell_bounds(self, rect):
+        size = self.cell_size
+        return (
+            rect.left // size,
+            rect.top // size,
+            (rect.right - 1) // size if rect.width > 0 else rect.left // size,
+            (rect.bottom - 1) // size if rect.height > 0 else rect.top // size,
+        )
+
+    def insert(self, obj, rect):
+        if obj in self._bounds:
+            self.move(obj, rect)
+            return
+        self._order[obj] = self._counter
+        self._counter += 1
+        bounds = self.cell_bounds(rect)
+        self._bounds[obj] = bounds
+        self._link(obj, bounds)
+
+    def remove(self, obj):
+        bounds = self._bounds.pop(obj, None)
+        if bounds is None:
+            return
+        del self._order[obj]
+        self._unlink(obj, bounds)
+
+    def move(self, obj, rect):
+        """Обновляет положение объекта; дёшево, если он остался в тех же ячейках."""
+        old_bounds = self._bounds.get(obj)
+        if old_bounds is None:
+            self.insert(obj, rect)
+            return
+        bounds = self.cell_bounds(rect)
+        if bounds == old_bounds:
+            return
+        self._unlink(obj, old_bounds)
+        self._bounds[obj] = bounds
+        self._link(obj, bounds)
+
+    def query(self, rect):
+        """Объекты из ячеек, которые пересекает rect, в порядке вставки."""
+        x0, y0, x1, y1 = self.cell_bounds(rect)
+        cells = self.cells
+        found = {}
+        for cy in range(y0, y1 + 1):
+            for cx in range(x0, x1 + 1):
+                cell = cells.get((cx, cy))
+                if cell:
+                    found.update(cell)
+        if len(found) < 2:
+            return list(found)
+        return sorted(found, key=self._order.__getitem__)
+
+    def clear(self):
+        self.cells.clear()
+        self._bounds.clear()
+        self._order.clear()
+
+    def _link(self, obj, bounds):
+        x0, y0, x1, y1 = bounds
+        for cy in range(y0, y1 + 1):
+            for cx in range(x0, x1 + 1):
+                self.cells.setdefault((cx, cy), {})[obj] = None
+
+    def _unlink(self, obj, bounds):
+        x0, y0, x1, y1 = bounds
+        for cy in range(y0, y1 + 1):
+            for cx in range(x0, x1 + 1):
+                cell = self.cells.get((cx, cy))
+                if cell is not None:
+                    cell.pop(obj, None)
+                    if not cell:
+                        del self.cells[(cx, cy)]
+
+
+class SpatialGroup(pygame.sprite.Group):
+    """
+    Группа спрайтов с пространственным индексом по sprite.rect.
+    Статичные спрайты индексируются один раз; после перемещения спрайта
+    нужно вызвать refresh(sprite), чтобы индекс узнал о новом положении.
+    """
+
+    def __init__(self, *sprites, cell_size=CELL_SIZE):
+        self.spatial = SpatialHash(cell_size)
+        super().__init__(*sprites)
+
+    def add_internal(self, sprite, layer=None):
+        super().add_internal(sprite, layer)
+        self.spatial.insert(sprite, sprite.rect)
+
+    def remove_internal(self, sprite):
+        super().remove_internal(sprite)
+        self.spatial.remove(sprite)
+
+    def query(self, rect):
+        """Спрайты, чьи rect пересекают rect, в порядке добавления в группу."""
+        return [
+            sprite
+            for sprite in self.spatial.query(rect)
+            if sprite.rect.colliderect(rect)
+        ]
+
+    def refresh(self, sprite=None):
+        """Переиндексирует один спрайт или всю группу после перемещения."""
+        if sprite is not None:
+            if sprite in self.spatial:
+                self.spatial.move(sprite, sprite.rect)
+            return
+        for member in self.sprites():
+            self.spatial.move(member, member.rect)
+
+
+def nearby(group, rect, margin=NEARBY_MARGIN):
+    """
+    Кандидаты на столкновение с rect: запрос к индексу группы, если он есть
+    (SpatialGroup, ActivationGroup), иначе все спрайты группы или списка.
+    """
+    if hasattr(group, "query"):
+        return group.query(rect.inflate(2 * margin, 2 * margin))
+    if hasattr(group, "sprites"):
+        return group.sprites()
+    return group
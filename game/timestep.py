@@ -0,0 +1,113 @@
+# game/timestep.py
+"""
+Фиксированный шаг симуляции.
+
+Кадр отрисовки и шаг физики развязаны: реальное время кадра копится в
+аккумуляторе, а симуляция продвигается целыми шагами 1 / tick_rate. Остаток
+(alpha) используется для интерполяции позиций между двумя последними
+состояниями, поэтому при падении FPS отрисовки геймплей не меняется.
+"""
+
+from contextlib import contextmanager
+
+
+class FixedTimestep:
+    def __init__(self, tick_rate=60, max_frame_time=0.25, max_steps=5):
+        self.tick_rate = tick_rate
+        self.step_dt = 1.0 / tick_rate
+        # Защита от "спирали смерти": длинный кадр не порождает сотни шагов
+        self.max_frame_time = max_frame_time
+        self.max_steps = max_steps
+        self.accumulator = 0.0
+        self.ticks = 0
+        self.dropped_time = 0.0
+
+    @property
+    def sim_time(self):
+        """Время симуляции в секундах (ticks * step_dt)"""
+        return self.ticks * self.step_dt
+
+    @property
+    def alpha(self):
+        """Доля шага, прошедшая после последнего тика (0..1)"""
+        return min(self.accumulator / self.step_dt, 1.0)
+
+    def reset(self):
+        """Сбрасывает накопленное время (например, после загрузки уровня)"""
+        self.accumulator = 0.0
+
+    def advance(self, frame_time):
+        """
+        Добавляет реальное время кадра и возвращает число шагов симуляции,
+        которые нужно выполнить в этом кадре.
+        """
+        self.accumulator += min(max(frame_time, 0.0), self.max_frame_time)
+        steps = int(self.accumulator / self.step_dt)
+        if steps > self.max_steps:
+            # Не успеваем — отбрасываем лишнее время вместо накопления долга
+            steps = self.max_steps
+            self.dropped_time += self.accumulator - steps * self.step_dt
+            self.accumulator = steps * self.step_dt
+        self.accumulator -= steps * self.step_dt
+        self.ticks += steps
+        return steps
+
+
+def lerp_position(previous, current, alpha):
+    """Линейная интерполяция точки, округлённая до пикселя"""
+    return (
+        round(previous[0] + (current[0] - previous[0]) * alpha),
+        round(previous[1] + (current[1] - previous[1]) * alpha),
+    )
+
+
+class RenderInterpolator:
+    """
+    Запоминает позиции спрайтов и камеры до последнего шага симуляции и на
+    время отрисовки подставляет интерполированные значения.
+    """
+
+    def __init__(self, snap_distance=256):
+        self.sprite_positions = {}
+        self.camera_offset = None
+        # Телепорты (респавн) не интерполируются
+        self.snap_distance = snap_distance
+
+    def capture(self, sprites, camera=None):
+        self.sprite_positions = {sprite: sprite.rect.topleft for sprite in sprites}
+        self.camera_offset = tuple(camera.offset) if camera is not None else None
+
+    def clear(self):
+        self.sprite_positions = {}
+        self.camera_offset = None
+
+    def _is_continuous(self, previous, current):
+        return (
+            abs(current[0] - previous[0]) <= self.snap_distance
+            and abs(current[1] - previous[1]) <= self.snap_distance
+        )
+
+    @contextmanager
+    def interpolated(self, alpha, camera=None):
+        """Контекст отрисовки: внутри позиции сдвинуты назад на (1 - alpha) шага"""
+        restore = []
+        for sprite, previous in self.sprite_positions.items():
+            current = sprite.rect.topleft
+            if previous != current and self._is_continuous(previous, current):
+                restore.append((sprite, current))
+                sprite.rect.topleft = lerp_position(previous, current, alpha)
+
+        camera_current = None
+        if camera is not None and self.camera_offset is not None:
+            camera_current = tuple(camera.offset)
+            if self._is_continuous(self.camera_offset, camera_current):
+                camera.offset.update(
+                    lerp_position(self.camera_offset, camera_current, alpha)
+                )
+        try:
+            yield
+        finally:
+            for sprite, current in restore:
+                sprite.rect.topleft = current
+            if camera_current is not None:
+                camera.offset.update(camera_current)
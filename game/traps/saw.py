@@ -1,32 +1,26 @@
 # game/enemies/saw.py
 import pygame
-from ..asset_loader import asset_loader
+from ..animation import AnimationClip, Animator, load_clips
 
 
 class Saw(pygame.sprite.Sprite):
     def __init__(self, x, y):
         super().__init__()
 
-        # Загрузка анимации
-        self.animation_frames = []
+        # Загрузка анимации (два кадра, 10 кадров в секунду)
         try:
-            # Загружаем оба кадра анимации
-            frame1 = asset_loader.load_image("enemies/sawHalf.png", 1)
-            frame2 = asset_loader.load_image("enemies/sawHalf_move.png", 1)
-            self.animation_frames.append(frame1)
-            self.animation_frames.append(frame2)
-            print(f"✅ Загружено {len(self.animation_frames)} кадров анимации пилы")
+            clips = load_clips("saw")
+            print(f"✅ Загружено {len(clips['spin'].frames)} кадров анимации пилы")
         except FileNotFoundError as e:
             print(f"❌ Ошибка загрузки спрайтов пилы: {e}")
             # Заглушка если спрайты не загрузились
             fallback_surface = pygame.Surface((50, 50))
             fallback_surface.fill((100, 100, 100))
             pygame.draw.circle(fallback_surface, (200, 200, 200), (25, 25), 20)
-            self.animation_frames.append(fallback_surface)
-            self.animation_frames.append(fallback_surface)
+            clips = {"spin": AnimationClip.from_frames((fallback_surface,))}
+        self.animator = Animator(clips, "spin")
 
-        self.current_frame = 0
-        self.image = self.animation_frames[self.current_frame]
+        self.image = self.animator.image()
         self.image_rect = self.image.get_rect(topleft=(x, y))
 
         # Создаем уменьшенный хитбокс - в 2 раза меньше, центрированный и опущенный
@@ -41,10 +35,12 @@ class Saw(pygame.sprite.Sprite):
             smaller_size[0],
             smaller_size[1],
         )
-
-        # Анимация
-        self.animation_speed = 0.1  # время между кадрами
-        self.animation_timer = 0
+        # Смещение изображения от хитбокса: изображение рисуется от rect, поэтому
+        # сглаживание движения (RenderInterpolator) сдвигает и его
+        self.image_offset = (
+            self.image_rect.x - self.rect.x,
+            self.image_rect.y - self.rect.y,
+        )
 
         # Физика и AI (без вращения)
         self.speed = 60
@@ -59,14 +55,9 @@ class Saw(pygame.sprite.Sprite):
 
     def update(self, dt, level):
         """Обновление пилы"""
-        # Обновление анимации
-        self.animation_timer += dt
-        if self.animation_timer >= self.animation_speed:
-            self.animation_timer = 0
-            self.current_frame = (self.current_frame + 1) % len(self.animation_frames)
-
-        # Обновляем изображение с текущим кадром
-        self.image = self.animation_frames[self.current_frame]
+        # Обновление анимации и изображения с текущим кадром
+        self.animator.update(dt)
+        self.image = self.animator.image()
 
     def check_collision(self, player):
         """Проверка столкновения с игроком"""
@@ -76,6 +67,10 @@ class Saw(pygame.sprite.Sprite):
 
     def draw(self, screen, camera):
         """Отрисовка пилы"""
-        # Отрисовка изображения по его оригинальному rect
+        # Отрисовка изображения по его оригинальному rect (относительно хитбокса)
+        self.image_rect.topleft = (
+            self.rect.x + self.image_offset[0],
+            self.rect.y + self.image_offset[1],
+        )
         image_screen_rect = self.image_rect.move(-camera.offset.x, -camera.offset.y)
         screen.blit(self.image, image_screen_rect)
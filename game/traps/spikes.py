@@ -1,6 +1,7 @@
 # game/traps/spikes.py
 import pygame
 from ..asset_loader import asset_loader
+from ..asset_manifest import SPIKES_IMAGE
 
 class Spikes(pygame.sprite.Sprite):
     def __init__(self, x, y, width=128, height=128):
@@ -20,7 +21,7 @@ class Spikes(pygame.sprite.Sprite):
 
         # Загрузка спрайта
         try:
-            self.image = asset_loader.load_image("tiles/spikes.png", scale=1)
+            self.image = asset_loader.load_image(SPIKES_IMAGE, scale=1)
             self.image = pygame.transform.scale(self.image, (width, height))
         except:
             # Заглушка
@@ -7,17 +7,26 @@ sys.path.append(os.path.dirname(__file__))
 
 from game.player import Player
 from game.camera import Camera
-from game.levels.level1 import Level
+from game.levels.level1 import DRAW_CULL_MARGIN
+from game.levels.loader import LevelLoader
 from ui.menu import MainMenu
 from ui.hud import HUD
 from ui.credits import Credits
+from ui.loading_screen import LoadingScreen
 from game.assets.audio import AudioManager
 from game.config import load_config
 from game.path_utils import resource_path
+from game.timestep import FixedTimestep, RenderInterpolator
+from game.simulation import simulate_tick
+from game.replay import InputRecorder
+from game.profiler import FrameProfiler
+
+# Экраны без анимаций: пока нет ввода, кадр не меняется
+IDLE_STATES = ("menu", "credits")
 
 
 class RPGPlatformer:
-    def __init__(self):
+    def __init__(self, record_path=None, profile_path=None):
         pygame.init()
         # Настройки экрана
         self.config = load_config()
@@ -33,7 +42,36 @@ class RPGPlatformer:
 
         self.clock = pygame.time.Clock()
         self.running = True
-        self.state = "menu"  # menu, game, settings, credits
+
+        # Фиксированный шаг симуляции, независимый от FPS отрисовки
+        simulation = self.config.simulation
+        self.timestep = FixedTimestep(
+            simulation.tick_rate, max_steps=simulation.max_steps_per_frame
+        )
+        self.render_fps = simulation.render_fps
+        # В меню и титрах цикл спит в ожидании события (см. run_idle_frame)
+        self.idle_wait_ms = simulation.idle_wait_ms
+        # Экран, показанный последним кадром в режиме ожидания (None — перерисовать)
+        self.idle_drawn_state = None
+        self.interpolate = simulation.interpolate
+        self.interpolator = RenderInterpolator()
+        # Запись ввода игровой сессии (python main.py --record session.rpgr)
+        self.record_path = record_path
+        self.recorder = None
+
+        # Профилировщик подсистем кадра (оверлей HUD и дамп при выходе)
+        profiler_config = self.config.profiler
+        self.profile_path = profile_path or profiler_config.dump_path
+        self.profiler = FrameProfiler(
+            enabled=bool(
+                profiler_config.enabled
+                or self.profile_path
+                or self.config.ui.debug_overlay
+            ),
+            window=profiler_config.window,
+            keep_history=bool(self.profile_path),
+        )
+        self.state = "menu"  # menu, loading, game, settings, credits
 
         # Инициализация систем
         # Аудиосистема (глобальный синглтон, базовый путь укажем на каталог audio)
@@ -44,6 +82,11 @@ class RPGPlatformer:
 
         self.menu = MainMenu(self)
         self.credits = Credits(self)
+        self.loading_screen = LoadingScreen(self)
+        # Загрузка уровня текущего запуска и заранее начатая загрузка
+        # для следующего «Новой игры» (см. game/levels/loader.py)
+        self.level_loader = None
+        self.next_level_loader = None
         self.player = None
         self.level = None
         self.camera = None
@@ -51,6 +94,8 @@ class RPGPlatformer:
 
         # ⏰ ДОБАВЛЕНО: Переменная для отслеживания времени игры
         self.game_start_time = 0
+        # Игровое время в секундах: сумма шагов симуляции текущей сессии
+        self.game_time = 0.0
 
         # 🔄 НОВОЕ: Флаг для отслеживания активной игровой сессии
         self.has_active_game = False
@@ -60,22 +105,32 @@ class RPGPlatformer:
         self.audio.on_menu_enter()
 
     def start_game(self):
-        """Запуск новой игры"""
+        """Запуск новой игры: уровень загружается в фоне за экраном загрузки"""
         print("🚀 Запуск новой игры...")
-        self.state = "game"
+        self.state = "loading"
         # Музыка для игрового уровня
         self.audio.on_game_start("level1")
         self.game_start_time = pygame.time.get_ticks()
+        self.game_time = 0.0
+
+        # Уровень, подготовленный заранее во время прошлой игры, или новый
+        self.level_loader = self.next_level_loader or LevelLoader("level1")
+        self.next_level_loader = None
+        self.level_loader.start()
+
+    def finish_start_game(self, level):
+        """Окончание запуска, когда уровень загружен: игрок, камера и HUD"""
+        self.level_loader = None
+        self.state = "game"
 
         try:
-            # 🔥 Сначала создаем уровень, потом игрока
-            self.level = Level("level1")
+            self.level = level
 
             # Игрок создаётся и затем привязывается к уровню
             self.player = Player(0, 0)
             self.level.set_player(self.player)
             self.camera = Camera(self.player, (self.SCREEN_WIDTH, self.SCREEN_HEIGHT))
-            self.hud = HUD(self.player)
+            self.hud = HUD(self.player, self.profiler)
             print(f"📷 Камера создана:")
             print(f"  - Позиция игрока: ({self.player.rect.x}, {self.player.rect.y})")
             print(
@@ -97,11 +152,19 @@ class RPGPlatformer:
 
             self.level.on_level_complete = on_level_complete
 
+            if self.record_path:
+                self.recorder = InputRecorder("level1", self.timestep.tick_rate)
+
             # 🔄 Флаг активной игры
             self.has_active_game = True
 
             # Reset clock to avoid huge dt on first frame after loading
             self.clock.tick()
+            self.timestep.reset()
+            self.interpolator.clear()
+
+            # Следующая «Новая игра» получит уже прочитанную карту
+            self.next_level_loader = LevelLoader("level1").start()
 
             print("✅ Игра запущена!")
 
@@ -116,6 +179,8 @@ class RPGPlatformer:
         print("🔄 Продолжение игры...")
         if self.has_active_game and self.player and self.level:
             self.state = "game"
+            self.timestep.reset()
+            self.interpolator.clear()
             print("✅ Игра восстановлена!")
         else:
             print("❌ Нет активной игры для продолжения")
@@ -130,8 +195,10 @@ class RPGPlatformer:
         print("📝 Переход к кредитам...")
         self.state = "credits"
 
-    def handle_events(self):
-        for event in pygame.event.get():
+    def handle_events(self, events=None):
+        if events is None:
+            events = pygame.event.get()
+        for event in events:
             if event.type == pygame.QUIT:
                 self.running = False
                 # Корректно выключаем аудио
@@ -152,41 +219,46 @@ class RPGPlatformer:
             if self.state == "game" and self.player and self.level:
                 # Обычный игровой ввод
                 self.player.handle_event(event)
+                if self.recorder:
+                    self.recorder.record_event(event)
 
                 # ESC → переход в меню
                 if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
                     self.go_to_menu()
 
-    def update(self):
-        dt = self.clock.get_time() / 1000.0  # Delta time в секундах
-        # Cap dt to prevent tunneling on lag spikes (e.g. asset loading)
-        dt = min(dt, 0.1)
-
+    def update(self, dt):
+        """Один шаг симуляции длительностью dt (фиксированный шаг timestep)"""
         # Обновление в зависимости от состояния
         if self.state == "game" and self.player and self.level:
-            # ⏰ ДОБАВЛЕНО: Получаем текущее время игры
-            current_time = (pygame.time.get_ticks() - self.game_start_time) / 1000.0
+            # ⏰ Игровое время считается по шагам симуляции, а не по часам
+            self.game_time += dt
+            current_time = self.game_time
 
-            # 🔧 ВАЖНО: Обрабатываем непрерывный ввод клавиш
+            # 🔧 ВАЖНО: непрерывный ввод клавиш, игрок, уровень и камера —
+            # тот же шаг, что и в безголовой GameSession
             keys = pygame.key.get_pressed()
-            # 🔥 ИСПРАВЛЕНИЕ: Передаем platforms в handle_keys
-            self.player.handle_keys(
-                keys, self.level.platforms
-            )  # 🔥 ДОБАВЛЕНО platforms
-
-            # 🔧 Обновляем игрока
-            self.player.update(
-                platforms=self.level.platforms,
-                enemies=self.level.enemies,
-                current_time=current_time,
-                traps=self.level.traps,
+            if self.recorder:
+                self.recorder.record_tick(keys)
+            simulate_tick(
+                self.player,
+                self.level,
+                self.camera,
+                keys,
+                current_time,
+                dt,
+                self.profiler,
             )
 
-            # Обновление уровня
-            self.level.update(dt)
-
-            # Обновление камеры
-            self.camera.update()
+    def capture_interpolation_state(self):
+        """Запоминает позиции видимых объектов перед шагом симуляции"""
+        if not self.interpolate or self.state != "game" or not self.camera:
+            return
+        view = self.camera.get_view_rect(DRAW_CULL_MARGIN)
+        sprites = [self.player]
+        sprites.extend(self.level.enemies.query(view))
+        sprites.extend(self.level.items.query(view))
+        sprites.extend(self.level.traps.query(view))
+        self.interpolator.capture(sprites, self.camera)
 
     def draw(self):
         # Отрисовка в зависимости от состояния
@@ -194,27 +266,120 @@ class RPGPlatformer:
             self.menu.draw(self.screen)
         elif self.state == "credits":
             self.credits.draw(self.screen)
+        elif self.state == "loading":
+            self.loading_screen.draw(
+                self.screen, self.level_loader.progress, self.level_loader.stage
+            )
         elif self.state == "game":
-            # Отрисовка игры
-            self.level.draw(self.screen, self.camera)
-            self.player.draw(self.screen, self.camera)
-            self.hud.draw(self.screen)
+            # Отрисовка игры между двумя последними шагами симуляции
+            alpha = self.timestep.alpha if self.interpolate else 1.0
+            with self.interpolator.interpolated(alpha, self.camera):
+                with self.profiler.section("level.draw"):
+                    self.level.draw(self.screen, self.camera)
+                with self.profiler.section("player.draw"):
+                    self.player.draw(self.screen, self.camera)
+            with self.profiler.section("hud.draw"):
+                self.hud.draw(self.screen)
 
         pygame.display.flip()
 
     def run(self):
         # Сброс первого dt, чтобы избежать гигантского шага физики
-        self.clock.tick(60)
+        self.clock.tick()
         while self.running:
-            self.handle_events()
-            self.update()
-            self.draw()
-            self.clock.tick(60)
+            self.run_frame()
 
+        if self.profile_path:
+            self.profiler.dump(self.profile_path)
+        if self.recorder:
+            self.recorder.save(self.record_path)
+            print(f"🎬 Ввод записан: {self.record_path} ({self.recorder.ticks} шагов)")
         pygame.quit()
         sys.exit()
 
+    def run_frame(self):
+        """Один проход главного цикла: ввод, шаги симуляции и отрисовка"""
+        if self.state in IDLE_STATES and self.idle_wait_ms > 0:
+            self.run_idle_frame()
+            # Меню и загрузка не профилируются; отсчёт игрового кадра
+            # начинается заново, чтобы простой не стал одним долгим кадром
+            self.profiler.begin_frame()
+            return
+        self.idle_drawn_state = None
+        if self.state == "loading":
+            self.run_loading_frame()
+            self.profiler.begin_frame()
+            return
+
+        # Реальное время кадра; render_fps ограничивает только отрисовку
+        frame_time = self.clock.tick(self.render_fps) / 1000.0
+        with self.profiler.section("handle_events"):
+            self.handle_events()
+        if not self.running:
+            return
+
+        for _ in range(self.timestep.advance(frame_time)):
+            self.capture_interpolation_state()
+            self.update(self.timestep.step_dt)
+        self.draw()
+        self.profiler.end_frame()
+
+    def run_loading_frame(self):
+        """
+        Кадр экрана загрузки: окно отвечает на ввод, пока карта читается в
+        фоновом потоке. Когда она готова, уровень достраивается в этом потоке
+        (convert_alpha и спрайты) и начинается игра.
+        """
+        self.clock.tick(self.render_fps)
+        self.handle_events()
+        if not self.running:
+            return
+        self.draw()
+        try:
+            level = self.level_loader.poll()
+        except Exception as e:
+            print(f"❌ Ошибка при запуске игры: {e}")
+            import traceback
+
+            traceback.print_exc()
+            self.level_loader = None
+            self.go_to_menu()
+            return
+        if level is not None:
+            self.finish_start_game(level)
+
+    def run_idle_frame(self):
+        """
+        Кадр меню или титров: процесс спит в pygame.event.wait, пока не придёт
+        событие (или не истечёт idle_wait_ms), и перерисовывает экран только
+        после ввода или смены экрана. Громкость и mute меняются только вводом.
+        """
+        event = pygame.event.wait(self.idle_wait_ms)
+        events = [] if event.type == pygame.NOEVENT else [event]
+        events.extend(pygame.event.get())
+        # Часы идут дальше, чтобы первый игровой кадр не получил весь простой
+        self.clock.tick()
+
+        self.handle_events(events)
+        if not self.running:
+            return
+        if events or self.state != self.idle_drawn_state:
+            self.draw()
+            self.idle_drawn_state = self.state
+
 
 if __name__ == "__main__":
-    game = RPGPlatformer()
+    import argparse
+
+    parser = argparse.ArgumentParser(description="2D PLATFORMER")
+    parser.add_argument(
+        "--record", metavar="PATH", help="записать ввод игровой сессии в файл"
+    )
+    parser.add_argument(
+        "--profile",
+        metavar="PATH",
+        help="сохранить профиль кадров при выходе (.csv или .json)",
+    )
+    args = parser.parse_args()
+    game = RPGPlatformer(record_path=args.record, profile_path=args.profile)
     game.run()
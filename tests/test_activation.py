@@ -0,0 +1,98 @@
+import unittest
+import sys
+import os
+import pygame
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from game.activation import ActivationGroup
+
+
+class _Walker(pygame.sprite.Sprite):
+    """Спрайт, который каждый тик сдвигается на speed пикселей"""
+
+    def __init__(self, x, y, speed=1):
+        super().__init__()
+        self.rect = pygame.Rect(x, y, 32, 32)
+        self.speed = speed
+        self.ticks = 0
+
+
+def _step(walker, dt):
+    walker.ticks += 1
+    walker.rect.x += walker.speed
+
+
+class TestActivationGroup(unittest.TestCase):
+    """Тесты активации объектов по секторам"""
+
+    def setUp(self):
+        self.near = _Walker(100, 100)
+        self.far = _Walker(5000, 100)
+        self.group = ActivationGroup(self.near, self.far, sector_size=1024)
+        self.view = pygame.Rect(0, 0, 800, 600)
+
+    def test_only_active_sectors_update(self):
+        """Спящие объекты не обновляются"""
+        for _ in range(10):
+            updated = self.group.update_active(self.view, 1 / 60, _step, 100)
+
+        self.assertEqual(updated, 1)
+        self.assertEqual(self.near.ticks, 10)
+        self.assertEqual(self.far.ticks, 0)
+
+    def test_woken_sprite_catches_up(self):
+        """Проснувшийся объект догоняет пропущенные тики и совпадает с неспящим"""
+        for _ in range(30):
+            self.group.update_active(self.view, 1 / 60, _step, 100)
+        self.group.update_active(self.far.rect, 1 / 60, _step, 100)
+
+        self.assertEqual(self.far.ticks, 31)
+        self.assertEqual(self.far.rect.x, 5000 + 31)
+
+    def test_catchup_is_capped(self):
+        """Догонять больше max_catchup тиков не нужно"""
+        for _ in range(30):
+            self.group.update_active(self.view, 1 / 60, _step, 5)
+        self.group.update_active(self.far.rect, 1 / 60, _step, 5)
+
+        self.assertEqual(self.far.ticks, 6)
+
+    def test_sprite_moves_between_sectors(self):
+        """Ушедший из активной области объект засыпает"""
+        self.near.speed = 400
+        for _ in range(5):
+            self.group.update_active(self.view, 1 / 60, _step, 100)
+
+        self.assertEqual(self.near.ticks, 3)
+        self.assertEqual(self.group.active(self.view), [])
+
+    def test_added_sprite_does_not_catch_up(self):
+        """Новый объект не догоняет время до своего появления"""
+        for _ in range(10):
+            self.group.update_active(self.view, 1 / 60, _step, 100)
+        late = _Walker(200, 100)
+        self.group.add(late)
+        self.group.update_active(self.view, 1 / 60, _step, 100)
+
+        self.assertEqual(late.ticks, 1)
+
+    def test_killed_during_catchup(self):
+        """Объект, убитый на шаге догонялки, удаляется и из секторов"""
+
+        def step_and_die(walker, dt):
+            _step(walker, dt)
+            if walker.ticks == 3:
+                walker.kill()
+
+        for _ in range(10):
+            self.group.update_active(self.view, 1 / 60, _step, 100)
+        self.group.update_active(self.far.rect, 1 / 60, step_and_die, 100)
+
+        self.assertEqual(self.far.ticks, 3)
+        self.assertNotIn(self.far, self.group.sectors)
+        self.assertEqual(self.group.active(self.far.rect), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,136 @@
+import unittest
+import sys
+import os
+import contextlib
+import io
+import pygame
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from game.animation import AnimationClip, Animator, load_clips, preload_clips
+from game.asset_loader import asset_loader
+from game.simulation import init_headless
+
+
+def _frames(count):
+    return [pygame.Surface((10 + i, 10), pygame.SRCALPHA) for i in range(count)]
+
+
+class TestAnimationClip(unittest.TestCase):
+    """Кадры выбираются по времени, а не по числу тиков"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls._stub_pixels = asset_loader.stub_pixels
+        init_headless(stub_pixels=True)
+
+    @classmethod
+    def tearDownClass(cls):
+        asset_loader.set_stub_pixels(cls._stub_pixels)
+
+    def test_same_frames_at_any_tick_rate(self):
+        """При 30, 60 и 144 тиках в секунду клип показывает одни и те же кадры"""
+        clip = AnimationClip.from_frames(_frames(3), fps=12)
+        sequences = []
+        for rate in (30, 60, 144):
+            animator = Animator({"run": clip}, "run")
+            samples = []
+            # Сравниваем в моменты k/6 с — кратны тику для всех трёх частот
+            for tick in range(1, rate + 1):
+                animator.update(1 / rate)
+                if tick % (rate // 6) == 0:
+                    samples.append(clip.frames.index(animator.image()))
+            sequences.append(samples)
+
+        self.assertEqual(sequences[0], [2, 1, 0, 2, 1, 0])
+        self.assertEqual(sequences[0], sequences[1])
+        self.assertEqual(sequences[0], sequences[2])
+
+    def test_non_loop_clip_finishes(self):
+        """Незацикленный клип останавливается на последнем кадре"""
+        frames = _frames(2)
+        animator = Animator({"land": AnimationClip.from_frames(frames, 10, False)}, "land")
+
+        animator.update(0.15)
+        self.assertFalse(animator.finished)
+        self.assertIs(animator.image(), frames[1])
+
+        animator.update(0.1)
+        self.assertTrue(animator.finished)
+        self.assertIs(animator.image(), frames[1])
+
+    def test_play_resets_only_on_state_change(self):
+        clips = {
+            "idle": AnimationClip.from_frames(_frames(1)),
+            "run": AnimationClip.from_frames(_frames(3), 12),
+        }
+        animator = Animator(clips, "idle")
+        animator.play("run")
+        animator.update(0.1)
+        animator.play("run")
+        self.assertAlmostEqual(animator.time, 0.1)
+
+        animator.play("idle")
+        self.assertEqual(animator.time, 0.0)
+
+    def test_mirrored_frames_shared_with_flip_cache(self):
+        """Отражённые кадры готовы заранее и совпадают с копиями AssetLoader"""
+        clip = AnimationClip.from_frames(_frames(2), fps=10)
+
+        for index, frame in enumerate(clip.frames):
+            self.assertIs(clip.mirrored_frames[index], asset_loader.get_flipped(frame))
+        self.assertIs(clip.frame(0.1, mirrored=True), clip.mirrored_frames[1])
+
+
+class TestPreloadedClips(unittest.TestCase):
+    """Сущности берут кадры из заранее загруженных клипов"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls._stub_pixels = asset_loader.stub_pixels
+        init_headless(stub_pixels=True)
+
+    @classmethod
+    def tearDownClass(cls):
+        asset_loader.set_stub_pixels(cls._stub_pixels)
+
+    def test_clips_are_shared(self):
+        self.assertIs(load_clips("fly"), load_clips("fly"))
+
+    def test_no_image_loading_after_preload(self):
+        """Удар, смерть и анимация врагов не загружают изображения"""
+        from game.enemies.fly import Fly
+        from game.enemies.slime import Slime
+        from game.enemies.snail import Snail
+        from game.traps.saw import Saw
+
+        preload_clips()
+        load_image = asset_loader.load_image
+        calls = []
+
+        def counting_load_image(*args, **kwargs):
+            calls.append(args)
+            return load_image(*args, **kwargs)
+
+        asset_loader.load_image = counting_load_image
+        try:
+            with contextlib.redirect_stdout(io.StringIO()):
+                enemies = [Slime(0, 0), Snail(0, 0), Fly(0, 0)]
+                saw = Saw(0, 0)
+                for enemy in enemies:
+                    enemy.take_damage(100)
+                    enemy.die()
+                    enemy.update_timers(0.1)
+                saw.update(0.25, None)
+        finally:
+            asset_loader.load_image = load_image
+
+        self.assertEqual(calls, [])
+        self.assertIs(enemies[0].image, load_clips("slime")["dead"].frames[0])
+        self.assertIs(enemies[1].image, load_clips("snail")["dead"].frames[0])
+        self.assertIs(enemies[2].image, load_clips("fly")["dead"].frames[0])
+        self.assertIs(saw.image, load_clips("saw")["spin"].frames[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,99 @@
+import unittest
+import sys
+import os
+import contextlib
+import io
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from game.asset_loader import asset_loader
+from game.asset_manifest import (
+    ITEM_IMAGES,
+    MANIFESTS,
+    find_case_exact,
+    resolve,
+    validate_all,
+)
+from game.simulation import init_headless
+
+
+class TestAssetManifest(unittest.TestCase):
+    """Все пути манифеста существуют с точным регистром"""
+
+    def test_manifests_and_maps_are_valid(self):
+        self.assertEqual(validate_all(), [])
+
+    def test_wrong_case_is_reported(self):
+        error = find_case_exact("hud/hudCoin.png")
+        self.assertIn("регистр", error)
+        self.assertIn("'Hud'", error)
+
+        error = find_case_exact("Hud/hudcoin.png")
+        self.assertIn("'hudCoin.png'", error)
+
+    def test_missing_file_is_reported(self):
+        self.assertIn("не найден", find_case_exact("Hud/missing.png"))
+        self.assertIn("не файл", find_case_exact("Hud"))
+
+    def test_resolve_normalizes_and_raises(self):
+        self.assertEqual(
+            resolve(["Hud/hudCoin.png", ("player/alienPink_duck.png", 0.6)]),
+            [("Hud/hudCoin.png", 1), ("player/alienPink_duck.png", 0.6)],
+        )
+        with self.assertRaises(ValueError) as context:
+            resolve(["backgrounds/colored_grass.png", "Hud/missing.png"])
+        self.assertIn("'Backgrounds'", str(context.exception))
+        self.assertIn("Hud/missing.png", str(context.exception))
+
+
+class TestManifestPreload(unittest.TestCase):
+    """После создания уровня и HUD изображения больше не читаются с диска"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls._stub_pixels = asset_loader.stub_pixels
+        init_headless(stub_pixels=True)
+
+    @classmethod
+    def tearDownClass(cls):
+        asset_loader.set_stub_pixels(cls._stub_pixels)
+
+    def test_no_file_reads_after_level_and_hud(self):
+        from game.items.items import Item
+        from game.levels.level1 import Level
+        from game.player import Player
+        from game.traps.spikes import Spikes
+        from ui.hud import HUD
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            level = Level("level1")
+            player = Player(0, 0)
+            level.set_player(player)
+            HUD(player)
+
+        for entries in MANIFESTS["level"], MANIFESTS["hud"]:
+            for name, _scale in resolve(entries):
+                self.assertIn(name, asset_loader.assets)
+
+        load_surface = asset_loader._load_surface
+        reads = []
+
+        def counting_load_surface(path, decoded=None):
+            reads.append(path)
+            return load_surface(path, decoded)
+
+        asset_loader._load_surface = counting_load_surface
+        try:
+            with contextlib.redirect_stdout(io.StringIO()):
+                for item_type in ITEM_IMAGES:
+                    Item(0, 0, 32, 32, item_type)
+                Spikes(0, 0)
+                HUD(player)
+        finally:
+            asset_loader._load_surface = load_surface
+
+        self.assertEqual(reads, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,11 +1,13 @@
 import unittest
 import sys
 import os
+import contextlib
+import io
 import pygame
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 
-from game.asset_loader import asset_loader
+from game.asset_loader import AssetLoader, asset_loader
 
 class TestAssets(unittest.TestCase):
     def setUp(self):
@@ -42,5 +44,115 @@ class TestAssets(unittest.TestCase):
             print(f"{asset}: {'✅' if exists else '❌'} {full_path}")
             self.assertTrue(exists, f"Asset file should exist: {asset}")
 
+
+class TestTileAtlas(unittest.TestCase):
+    """Тесты таблицы GID и общих поверхностей тайлов"""
+
+    def setUp(self):
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+        pygame.init()
+        pygame.display.set_mode((1, 1))
+        self.loader = AssetLoader()
+
+    def tearDown(self):
+        pygame.quit()
+
+    def test_gid_table_built_at_load(self):
+        """load_tileset заполняет таблицу GID с учётом margin"""
+        self.loader.load_tileset("Spritesheets/spritesheet_ground.png", 1, 128, 128)
+        self.loader.load_tileset(
+            "Spritesheets/spritesheet_enemies.png", 417, 128, 128, margin=2
+        )
+
+        name, rect = self.loader.tile_index[10]
+        self.assertEqual(name, "Spritesheets/spritesheet_ground.png")
+        self.assertEqual(tuple(rect), (128, 128, 128, 128))
+
+        # 7 колонок по 128 px с отступом 2 px, 105 тайлов
+        name, rect = self.loader.tile_index[417 + 8]
+        self.assertEqual(tuple(rect), (2 + 128, 2 + 128, 128, 128))
+        self.assertIn(417 + 104, self.loader.tile_index)
+        self.assertNotIn(417 + 105, self.loader.tile_index)
+
+    def test_tiles_share_surfaces(self):
+        """Одинаковые тайлы используют одну поверхность"""
+        self.loader.load_tileset("Spritesheets/spritesheet_ground.png", 1, 128, 128)
+        tileset_image = self.loader.tilesets["Spritesheets/spritesheet_ground.png"]["image"]
+
+        tile = self.loader.get_tile_image(1)
+        self.assertIs(tile.get_parent(), tileset_image)
+        self.assertIs(self.loader.get_tile_image(1), tile)
+
+        scaled = self.loader.get_tile_image(1, (64, 64))
+        self.assertEqual(scaled.get_size(), (64, 64))
+        self.assertIs(self.loader.get_tile_image(1, (64, 64)), scaled)
+
+    def test_unknown_gid_returns_stub(self):
+        """Неизвестный GID даёт заглушку нужного размера"""
+        stub = self.loader.get_tile_image(9999, (32, 32))
+        self.assertEqual(stub.get_size(), (32, 32))
+
+    def test_flipped_sprite_cached(self):
+        """Отражённая копия создаётся один раз и живёт, пока жив оригинал"""
+        sprite = pygame.Surface((4, 2), pygame.SRCALPHA)
+        sprite.set_at((0, 0), (255, 0, 0, 255))
+
+        flipped = self.loader.get_flipped(sprite)
+        self.assertEqual(flipped.get_at((3, 0)), (255, 0, 0, 255))
+        self.assertIs(self.loader.get_flipped(sprite), flipped)
+
+        del sprite
+        self.assertEqual(len(self.loader.flip_cache), 0)
+
+
+class TestPreload(unittest.TestCase):
+    """Пакетная загрузка: параллельное декодирование, доводка в главном потоке"""
+
+    MANIFEST = [
+        ("player/alienPink_stand.png", 0.5),
+        "player/alienPink_walk1.png",
+        "Hud/hudCoin.png",
+    ]
+
+    def setUp(self):
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+        pygame.init()
+        pygame.display.set_mode((1, 1))
+        self.loader = AssetLoader()
+
+    def tearDown(self):
+        pygame.quit()
+
+    def test_preload_matches_sequential_loading(self):
+        reference = AssetLoader()
+        with contextlib.redirect_stdout(io.StringIO()):
+            count = self.loader.preload(self.MANIFEST, workers=3)
+            expected = reference.load_image("player/alienPink_stand.png", 0.5)
+
+        self.assertEqual(count, 3)
+        image = self.loader.assets["player/alienPink_stand.png"]
+        self.assertEqual(image.get_size(), expected.get_size())
+        self.assertEqual(
+            pygame.image.tobytes(image, "RGBA"), pygame.image.tobytes(expected, "RGBA")
+        )
+
+    def test_preload_skips_loaded_images(self):
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.loader.preload(self.MANIFEST[:1])
+            image = self.loader.assets["player/alienPink_stand.png"]
+            count = self.loader.preload(self.MANIFEST, workers=2)
+
+        self.assertEqual(count, 2)
+        self.assertIs(self.loader.assets["player/alienPink_stand.png"], image)
+
+    def test_missing_file_is_reported_by_load_image(self):
+        with contextlib.redirect_stdout(io.StringIO()):
+            decoded = self.loader.decode_images(["missing.png", "Hud/hudCoin.png"], 2)
+            self.loader.preload(["missing.png"], workers=2)
+
+        self.assertEqual(list(decoded), ["Hud/hudCoin.png"])
+        self.assertNotIn("missing.png", self.loader.assets)
+
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,77 @@
+import unittest
+import sys
+import os
+import contextlib
+import io
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from game.asset_loader import asset_loader
+
+
+def _entry(ops, spread=0.05, peak_kib=10.0):
+    return {"ops_per_sec": ops, "spread": spread, "peak_kib": peak_kib}
+
+
+class TestBenchmarkCompare(unittest.TestCase):
+    """Гейт бенчмарков: шум — предупреждение, грубые замедления и рост памяти — ошибка"""
+
+    @classmethod
+    def setUpClass(cls):
+        # Модуль при импорте готовит pygame без окна и включает настоящие пиксели
+        stub_pixels = asset_loader.stub_pixels
+        with contextlib.redirect_stdout(io.StringIO()):
+            from benchmarks import run_benchmarks
+        asset_loader.set_stub_pixels(stub_pixels)
+        cls.compare = staticmethod(run_benchmarks.compare)
+
+    def test_noise_is_not_a_regression(self):
+        regressions, slowdowns = self.compare(
+            {"bench[1x]": _entry(900.0)}, {"bench[1x]": _entry(1000.0)}, 0.3
+        )
+        self.assertEqual(regressions, [])
+        self.assertEqual(slowdowns, [])
+
+    def test_slowdown_within_gross_limit_only_warns(self):
+        regressions, slowdowns = self.compare(
+            {"bench[1x]": _entry(600.0)}, {"bench[1x]": _entry(1000.0)}, 0.3
+        )
+        self.assertEqual(regressions, [])
+        self.assertEqual(len(slowdowns), 1)
+
+    def test_gross_slowdown_fails(self):
+        regressions, slowdowns = self.compare(
+            {"bench[1x]": _entry(100.0)}, {"bench[1x]": _entry(1000.0)}, 0.3
+        )
+        self.assertEqual(len(regressions), 1)
+        self.assertIn("bench[1x]", regressions[0])
+        self.assertEqual(slowdowns, [])
+
+    def test_gross_limit_grows_with_spread(self):
+        """При большом разбросе граница ошибки — 1 + SPREAD_FACTOR * разброс"""
+        current = {"bench[1x]": _entry(300.0, spread=0.05)}
+        baseline = {"bench[1x]": _entry(1000.0, spread=0.05)}
+        regressions, _ = self.compare(current, baseline, 0.3)
+        self.assertEqual(len(regressions), 1)
+
+        baseline["bench[1x]"]["spread"] = 0.8
+        regressions, _ = self.compare(current, baseline, 0.3)
+        self.assertEqual(regressions, [])
+
+    def test_memory_growth_fails(self):
+        regressions, _ = self.compare(
+            {"bench[1x]": _entry(1000.0, peak_kib=200.0)},
+            {"bench[1x]": _entry(1000.0, peak_kib=100.0)},
+            0.3,
+        )
+        self.assertEqual(len(regressions), 1)
+        self.assertIn("KiB", regressions[0])
+
+    def test_unknown_bench_is_skipped(self):
+        self.assertEqual(
+            self.compare({"new[1x]": _entry(1.0)}, {}, 0.3), ([], [])
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,116 @@
+import unittest
+import sys
+import os
+import contextlib
+import io
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from game.asset_loader import asset_loader
+from game.enemies.batch import BATCH_AVAILABLE, EnemyBatch
+from game.simulation import init_headless
+
+
+class _Level:
+    width = 4000
+
+
+def _state(enemies):
+    return [
+        (
+            type(enemy).__name__,
+            tuple(enemy.rect),
+            enemy.direction,
+            enemy.facing_right,
+            enemy.velocity.x,
+            enemy.velocity.y,
+            enemy.alive(),
+        )
+        for enemy in enemies
+    ]
+
+
+@unittest.skipUnless(BATCH_AVAILABLE, "numpy не установлен")
+class TestEnemyBatch(unittest.TestCase):
+    """Пакетная физика совпадает с поштучным update"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls._stub_pixels = asset_loader.stub_pixels
+        init_headless(stub_pixels=True)
+
+    @classmethod
+    def tearDownClass(cls):
+        asset_loader.set_stub_pixels(cls._stub_pixels)
+
+    def _make_enemies(self):
+        from game.enemies.fly import Fly
+        from game.enemies.slime import Slime
+        from game.enemies.snail import Snail
+
+        enemies = []
+        with contextlib.redirect_stdout(io.StringIO()):
+            for i in range(12):
+                x = 60 + i * 310.5  # дробные границы патруля
+                enemies.extend([Slime(x, 300), Snail(x, 900), Fly(x, 100)])
+            # Раненый, неуязвимый и падающий враги идут через обычные ветки
+            enemies[0].take_damage(5)
+            enemies[1].is_invincible = True
+            enemies[1].invincibility_timer = 0.2
+            enemies[3].start_y = -2500
+            for index, enemy in enumerate(enemies):
+                if index % 4 == 1:
+                    enemy.direction = -1
+        return enemies
+
+    def test_batch_matches_scalar_update(self):
+        level = _Level()
+        scalar = self._make_enemies()
+        batched = self._make_enemies()
+        batch = EnemyBatch(min_size=1)
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            for _ in range(900):
+                for enemy in scalar:
+                    enemy.update(1 / 60, level)
+                batch.update(batched, 1 / 60, level)
+
+        self.assertEqual(_state(scalar), _state(batched))
+
+    def test_disabled_batch_uses_update(self):
+        level = _Level()
+        scalar = self._make_enemies()
+        plain = self._make_enemies()
+        batch = EnemyBatch()
+        batch.enabled = False
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            for _ in range(120):
+                for enemy in scalar:
+                    enemy.update(1 / 60, level)
+                batch.update(plain, 1 / 60, level)
+
+        self.assertEqual(_state(scalar), _state(plain))
+
+    def test_level_with_batch_matches_scalar(self):
+        from game.levels.generator import GeneratorConfig, generate_map
+        from game.levels.level1 import Level
+        from game.player import Player
+
+        tmx_map = generate_map(GeneratorConfig(width=60, enemies=300, seed=4))
+        states = []
+        for enabled in (False, True):
+            with contextlib.redirect_stdout(io.StringIO()):
+                level = Level("generated", tmx_map=tmx_map)
+                level.player = Player(*level.player_spawn_point)
+                level.enemy_batch.enabled = enabled
+                level.enemy_batch.min_size = 1
+                for _ in range(300):
+                    level.update(1 / 60)
+            states.append(_state(level.enemies))
+
+        self.assertEqual(states[0], states[1])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,57 @@
+import unittest
+import sys
+import os
+import pygame
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from ui.frame_cache import FrameCache
+
+
+class TestFrameCache(unittest.TestCase):
+    """Статичный кадр экрана строится один раз и перестраивается по ключу"""
+
+    def setUp(self):
+        self.screen = pygame.Surface((200, 100))
+        self.cache = FrameCache()
+        self.builds = []
+
+    def _build(self, color):
+        def build(frame):
+            self.builds.append(color)
+            frame.fill(color)
+
+        return build
+
+    def test_frame_built_once(self):
+        for _ in range(5):
+            self.cache.blit(self.screen, "menu", 1, self._build((10, 20, 30)))
+
+        self.assertEqual(self.builds, [(10, 20, 30)])
+        self.assertEqual(self.screen.get_at((150, 50))[:3], (10, 20, 30))
+
+    def test_key_change_rebuilds(self):
+        self.cache.blit(self.screen, "menu", 1, self._build((10, 20, 30)))
+        self.cache.blit(self.screen, "menu", 2, self._build((40, 50, 60)))
+
+        self.assertEqual(len(self.builds), 2)
+        self.assertEqual(self.screen.get_at((0, 0))[:3], (40, 50, 60))
+
+    def test_resize_rebuilds(self):
+        self.cache.blit(self.screen, "menu", 1, self._build((10, 20, 30)))
+        bigger = pygame.Surface((300, 150))
+        self.cache.blit(bigger, "menu", 1, self._build((10, 20, 30)))
+
+        self.assertEqual(len(self.builds), 2)
+        self.assertEqual(self.cache.frames["menu"][1].get_size(), (300, 150))
+
+    def test_clear(self):
+        self.cache.blit(self.screen, "menu", 1, self._build((10, 20, 30)))
+        self.cache.clear()
+        self.cache.blit(self.screen, "menu", 1, self._build((10, 20, 30)))
+
+        self.assertEqual(len(self.builds), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
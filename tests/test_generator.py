@@ -0,0 +1,147 @@
+import unittest
+import sys
+import os
+import contextlib
+import io
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from game.asset_loader import asset_loader
+from game.simulation import init_headless
+
+
+class TestLevelGenerator(unittest.TestCase):
+    """Тесты генератора синтетических уровней"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls._stub_pixels = asset_loader.stub_pixels
+        init_headless(stub_pixels=True)
+
+    @classmethod
+    def tearDownClass(cls):
+        asset_loader.set_stub_pixels(cls._stub_pixels)
+
+    def _layers(self, tmx_map):
+        return {layer.name: list(layer.data) for layer in tmx_map.layers}
+
+    def test_same_seed_same_map(self):
+        from game.levels.generator import GeneratorConfig, generate_map
+
+        first = generate_map(GeneratorConfig(seed=5))
+        second = generate_map(GeneratorConfig(seed=5))
+        other = generate_map(GeneratorConfig(seed=6))
+
+        self.assertEqual(self._layers(first), self._layers(second))
+        self.assertEqual(first.objectgroups, second.objectgroups)
+        self.assertNotEqual(self._layers(first), self._layers(other))
+
+    def test_config_controls_size_and_counts(self):
+        from game.levels.generator import GeneratorConfig, generate_map
+
+        config = GeneratorConfig(width=200, height=30, enemies=40, coins=25)
+        tmx_map = generate_map(config)
+
+        self.assertEqual((tmx_map.width, tmx_map.height), (200, 30))
+        self.assertEqual(len(tmx_map.get_objectgroup("enemy").objects), 40)
+        self.assertEqual(len(tmx_map.get_objectgroup("items").objects), 25)
+        self.assertEqual(len(tmx_map.get_objectgroup("spawn").objects), 1)
+
+    def test_tiles_use_level_gid_tables(self):
+        from game.levels.generator import SPIKES, generate_map
+        from game.levels.level1 import DECORATION_TYPES_BY_GID, PLATFORM_TYPES_BY_GID
+
+        layers = self._layers(generate_map())
+        platform_gids = set(layers["ground"] + layers["semiground"] + layers["triangleleft"])
+        self.assertTrue(platform_gids - {0} <= set(PLATFORM_TYPES_BY_GID))
+        self.assertTrue(set(layers["decoration"]) - {0} <= set(DECORATION_TYPES_BY_GID))
+        self.assertEqual(set(layers["traps"]) - {0}, {SPIKES})
+
+    def test_enemies_not_inside_terrain(self):
+        """Враги не попадают в подъёмы и плато"""
+        import pygame
+
+        from game.levels.generator import TILE_SIZE, GeneratorConfig, generate_map
+
+        for seed in range(5):
+            tmx_map = generate_map(
+                GeneratorConfig(seed=seed, slope_runs=12, max_slope_length=4, enemies=60)
+            )
+            solid = [
+                pygame.Rect(x * TILE_SIZE, y * TILE_SIZE, TILE_SIZE, TILE_SIZE)
+                for name in ("ground", "triangleleft")
+                for x, y, _gid in tmx_map.get_layer(name).iter_tiles()
+            ]
+            enemies = tmx_map.get_objectgroup("enemy").objects
+            self.assertEqual(len(enemies), 60)
+            for obj in enemies:
+                # У тайловых объектов y — нижний край
+                rect = pygame.Rect(obj.x, obj.y - obj.height, obj.width, obj.height)
+                self.assertEqual(rect.collidelist(solid), -1, f"seed={seed} {obj}")
+
+    def test_floating_platforms_have_both_caps(self):
+        from game.levels.generator import (
+            SEMI_LEFT,
+            SEMI_RIGHT,
+            GeneratorConfig,
+            generate_map,
+        )
+
+        layer = generate_map(GeneratorConfig(platform_density=0.6)).get_layer("semiground")
+        rows = [
+            layer.data[y * layer.width : (y + 1) * layer.width] for y in range(layer.height)
+        ]
+        runs = 0
+        for row in rows:
+            for x, gid in enumerate(row):
+                starts = gid and (x == 0 or not row[x - 1])
+                ends = gid and (x == len(row) - 1 or not row[x + 1])
+                if starts:
+                    runs += 1
+                    self.assertEqual(gid, SEMI_LEFT)
+                if ends:
+                    self.assertEqual(gid, SEMI_RIGHT)
+        self.assertGreater(runs, 0)
+
+    def test_level_loads_generated_map(self):
+        from game.levels.generator import GeneratorConfig, generate_map
+        from game.levels.level1 import Level
+
+        config = GeneratorConfig(width=80, enemies=12, traps=6, coins=9)
+        tmx_map = generate_map(config)
+        with contextlib.redirect_stdout(io.StringIO()):
+            level = Level("generated", tmx_map=tmx_map)
+
+        saws = sum(1 for obj in tmx_map.get_objectgroup("enemy").objects if obj.type == "saw")
+        tiles = sum(
+            1 for gid in tmx_map.get_layer("ground").data if gid
+        ) + sum(1 for gid in tmx_map.get_layer("semiground").data if gid)
+        self.assertEqual(level.width, 80 * 128)
+        self.assertEqual(len(level.enemies), 12 - saws)
+        self.assertEqual(len(level.items), 9)
+        self.assertGreaterEqual(len(level.platforms), tiles)
+        self.assertEqual(level.player_spawn_point[0], 0)
+
+    def test_save_tmx_and_compiled(self):
+        from game.levels.generator import GeneratorConfig, generate_map, save_map
+        from game.levels.level1 import Level
+
+        config = GeneratorConfig(width=50, seed=2)
+        tmx_map = generate_map(config)
+        with tempfile.TemporaryDirectory() as tmp:
+            with contextlib.redirect_stdout(io.StringIO()):
+                levels = []
+                for name in ("generated.tmx", "generated.lvlc"):
+                    path = os.path.join(tmp, name)
+                    save_map(tmx_map, path, config)
+                    levels.append(Level("generated", path))
+
+        from_tmx, from_compiled = levels
+        self.assertEqual(len(from_tmx.platforms), len(from_compiled.platforms))
+        self.assertEqual(len(from_tmx.enemies), len(from_compiled.enemies))
+        self.assertGreater(len(from_tmx.platforms), 50)
+
+
+if __name__ == "__main__":
+    unittest.main()
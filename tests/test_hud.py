@@ -0,0 +1,101 @@
+import unittest
+import sys
+import os
+import contextlib
+import io
+import pygame
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+
+class _Health:
+    current_health = 50
+    max_health = 60
+
+
+class _Player:
+    def __init__(self):
+        self.health_component = _Health()
+        self.keys = 2
+        self.coins = 7
+        self.is_alive = True
+        self.rect = pygame.Rect(0, 0, 10, 10)
+
+
+class TestHUDLayer(unittest.TestCase):
+    """Сердца, ключи и монеты рисуются из слоя, который строится при изменениях"""
+
+    def setUp(self):
+        pygame.init()
+        self.screen = pygame.display.set_mode((800, 600))
+        from ui.hud import HUD
+
+        self.player = _Player()
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.hud = HUD(self.player)
+        self.hud.ui_config.debug_overlay = False
+
+    def test_layer_rebuilt_only_on_change(self):
+        self.hud.draw(self.screen)
+        layer = self.hud.layer
+        self.assertTrue(self.hud.dirty_rects)
+
+        self.hud.draw(self.screen)
+        self.assertIs(self.hud.layer, layer)
+        self.assertEqual(self.hud.dirty_rects, [])
+
+        self.player.coins += 1
+        self.hud.draw(self.screen)
+        self.assertIsNot(self.hud.layer, layer)
+
+    def test_dirty_rects_cover_old_and_new_elements(self):
+        self.hud.draw(self.screen)
+        coin_rect = self.hud.layer_rects[-1]
+
+        self.player.coins = 0  # счётчик монет исчезает
+        self.hud.draw(self.screen)
+
+        self.assertIn(coin_rect, self.hud.dirty_rects)
+        self.assertNotIn(coin_rect, self.hud.layer_rects)
+
+    def test_layer_matches_direct_drawing(self):
+        """Слой даёт те же пиксели, что и прямая отрисовка (с точностью до округления)"""
+        background = pygame.Surface(self.screen.get_size())
+        for x in range(0, 800, 16):
+            background.fill((x % 256, 255 - x % 256, 90), (x, 0, 16, 600))
+
+        direct = background.copy()
+        self.hud.draw_hearts(direct, 50, 60)
+        self.hud.draw_collectibles(direct)
+
+        self.screen.blit(background, (0, 0))
+        self.hud.draw(self.screen)
+
+        for rect in self.hud.layer_rects:
+            for x in range(rect.left, rect.right):
+                for y in range(rect.top, rect.bottom):
+                    expected = direct.get_at((x, y))
+                    actual = self.screen.get_at((x, y))
+                    for channel in range(3):
+                        self.assertLessEqual(abs(expected[channel] - actual[channel]), 1)
+
+    def test_profiler_graph_background_reused(self):
+        """Подложка графика профилировщика не создаётся заново каждый кадр"""
+        from game.profiler import FrameProfiler
+
+        profiler = FrameProfiler(window=120)
+        profiler.begin_frame()
+        for _ in range(3):
+            profiler.end_frame()
+        self.hud.profiler = profiler
+
+        self.hud._draw_profiler_graph(self.screen, 10, 300)
+        background = self.hud._profiler_background
+        self.hud._draw_profiler_graph(self.screen, 10, 300)
+
+        self.assertIs(self.hud._profiler_background, background)
+        self.assertEqual(background.get_size(), (120, 100))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,94 @@
+import unittest
+import sys
+import os
+import contextlib
+import io
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+
+class TestIdleLoop(unittest.TestCase):
+    """В меню главный цикл ждёт ввода и не перерисовывает неизменный экран"""
+
+    def setUp(self):
+        from main import RPGPlatformer
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.game = RPGPlatformer()
+        self.game.idle_wait_ms = 5
+        self.draws = 0
+        draw = self.game.draw
+
+        def counting_draw():
+            self.draws += 1
+            draw()
+
+        self.game.draw = counting_draw
+        pygame.event.clear()
+
+    def _frames(self, count):
+        with contextlib.redirect_stdout(io.StringIO()):
+            for _ in range(count):
+                self.game.run_frame()
+
+    def test_menu_drawn_once_without_input(self):
+        self._frames(5)
+
+        self.assertEqual(self.draws, 1)
+
+    def test_input_triggers_redraw(self):
+        self._frames(2)
+        pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_DOWN))
+        self._frames(2)
+
+        self.assertEqual(self.draws, 2)
+        self.assertEqual(self.game.menu.selected_index, 1)
+
+    def test_state_change_triggers_redraw(self):
+        self._frames(2)
+        self.game.go_to_credits()
+        self._frames(2)
+
+        self.assertEqual(self.draws, 2)
+
+    def test_disabled_idle_wait_draws_every_frame(self):
+        self.game.idle_wait_ms = 0
+        self.game.render_fps = 0
+        self._frames(3)
+
+        self.assertEqual(self.draws, 3)
+
+    def test_idle_time_not_recorded_as_game_frame(self):
+        """Время в меню и на экране загрузки не попадает в игровые кадры"""
+        from game.profiler import FrameProfiler
+
+        self.game.profiler = FrameProfiler()
+        with contextlib.redirect_stdout(io.StringIO()):
+            time.sleep(0.2)
+            self._frames(1)
+            self.game.start_game()
+            for _ in range(1000):
+                self.game.run_frame()
+                if self.game.state != "loading":
+                    break
+            self.game.run_frame()
+
+            self.game.go_to_menu()
+            time.sleep(0.2)
+            self._frames(1)
+            self.game.resume_game()
+            self.game.run_frame()
+
+        frame_times = [row[-1] for row in self.game.profiler.frames]
+        self.assertEqual(len(frame_times), 2)
+        self.assertTrue(all(0.0 < value < 0.2 for value in frame_times))
+
+
+if __name__ == "__main__":
+    unittest.main()
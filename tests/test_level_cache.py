@@ -0,0 +1,80 @@
+import unittest
+import sys
+import os
+import shutil
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from game.path_utils import resource_path
+from game.levels.tmx_loader import load_tmx
+from game.levels import level_cache
+
+
+LEVEL1_PATH = resource_path("game", "assets", "levels", "level1.tmx")
+
+
+class TestLevelCache(unittest.TestCase):
+    """Тесты бинарного кэша уровней"""
+
+    def setUp(self):
+        self.cache_dir = tempfile.mkdtemp(prefix="lvlc_test_")
+        with open(LEVEL1_PATH, "rb") as f:
+            self.digest = level_cache.source_digest(f.read())
+
+    def tearDown(self):
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+
+    def _write(self, tmx_map, digest=None):
+        path = os.path.join(self.cache_dir, "level1.lvlc")
+        level_cache.write_compiled(path, tmx_map, digest or self.digest)
+        return path
+
+    def test_round_trip(self):
+        """Скомпилированная карта совпадает с исходной"""
+        original = load_tmx(LEVEL1_PATH)
+        cached = level_cache.read_compiled(self._write(original), self.digest)
+
+        self.assertIsNotNone(cached)
+        self.assertEqual(
+            (cached.width, cached.height, cached.tilewidth, cached.tileheight),
+            (original.width, original.height, original.tilewidth, original.tileheight),
+        )
+        self.assertEqual(cached.tilesets, original.tilesets)
+        self.assertEqual(
+            [layer.name for layer in cached.layers],
+            [layer.name for layer in original.layers],
+        )
+        for cached_layer, layer in zip(cached.layers, original.layers):
+            self.assertEqual(list(cached_layer.data), list(layer.data))
+        self.assertEqual(cached.objectgroups, original.objectgroups)
+
+    def test_digest_mismatch_invalidates(self):
+        """Кэш от другой версии карты игнорируется"""
+        path = self._write(load_tmx(LEVEL1_PATH), digest=b"\x00" * 20)
+        self.assertIsNone(level_cache.read_compiled(path, self.digest))
+
+    def test_corrupt_file_ignored(self):
+        """Обрезанный файл не ломает загрузку"""
+        path = self._write(load_tmx(LEVEL1_PATH))
+        with open(path, "r+b") as f:
+            f.truncate(200)
+        self.assertIsNone(level_cache.read_compiled(path, self.digest))
+
+    def test_load_map_creates_and_uses_cache(self):
+        """Первый load_map пишет кэш, второй читает его"""
+        cache_path = level_cache.get_cache_path(LEVEL1_PATH, self.cache_dir)
+        self.assertFalse(os.path.exists(cache_path))
+
+        cold = level_cache.load_map(LEVEL1_PATH, cache_dir=self.cache_dir)
+        self.assertTrue(os.path.exists(cache_path))
+
+        warm = level_cache.load_map(LEVEL1_PATH, cache_dir=self.cache_dir)
+        self.assertEqual(
+            list(warm.get_layer("ground").data), list(cold.get_layer("ground").data)
+        )
+        self.assertEqual(warm.objectgroups, cold.objectgroups)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,106 @@
+import unittest
+import sys
+import os
+import contextlib
+import io
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from game.simulation import init_headless
+
+
+class TestLevelLoader(unittest.TestCase):
+    """Уровень читается в фоновом потоке и достраивается в главном"""
+
+    @classmethod
+    def setUpClass(cls):
+        init_headless(stub_pixels=True)
+
+    def test_loaded_level_matches_synchronous(self):
+        from game.levels.level1 import Level
+        from game.levels.loader import LevelLoader
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            expected = Level("level1")
+            loader = LevelLoader("level1").start()
+            level = loader.wait(timeout=30)
+
+        self.assertIsNotNone(level)
+        self.assertIsNone(loader.error)
+        self.assertEqual(loader.progress, 1.0)
+        self.assertEqual(len(level.platforms), len(expected.platforms))
+        self.assertEqual(len(level.enemies), len(expected.enemies))
+        self.assertEqual(level.player_spawn_point, expected.player_spawn_point)
+        # Раскладка (записи объектов и склоны) построена ещё в рабочем потоке
+        self.assertIsNotNone(loader.layout)
+        self.assertEqual(len(loader.layout.enemies), len(level.initial_enemy_data))
+
+    def test_layout_slope_links_match_link_slopes(self):
+        from game.levels.level1 import Level
+        from game.platform import link_slopes
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            level = Level("level1")
+        slopes = [p for p in level.platforms if p.platform_type == "triangle"]
+        self.assertTrue(slopes)
+        self.assertTrue(all(slope.slopes_linked for slope in slopes))
+        linked = {
+            slope: (slope.slope_left, slope.slope_right) for slope in slopes
+        }
+
+        link_slopes(level.platforms)
+        for slope in slopes:
+            self.assertEqual((slope.slope_left, slope.slope_right), linked[slope])
+
+    def test_poll_returns_same_level(self):
+        from game.levels.loader import LevelLoader
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            loader = LevelLoader("level1")
+            self.assertIsNone(loader.poll())
+            level = loader.wait(timeout=30)
+
+        self.assertIs(loader.poll(), level)
+
+    def test_missing_map_reports_error(self):
+        from game.levels.loader import LevelLoader
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            loader = LevelLoader("missing", tmx_path="/nonexistent/missing.tmx")
+            loader.start()
+            loader._prepared.wait(30)
+
+        self.assertTrue(loader.prepared)
+        self.assertIsInstance(loader.error, FileNotFoundError)
+        self.assertIsNone(loader.tmx_map)
+
+
+class TestLoadingState(unittest.TestCase):
+    """Новая игра проходит через экран загрузки, окно при этом отвечает"""
+
+    @classmethod
+    def setUpClass(cls):
+        init_headless(stub_pixels=True)
+
+    def test_start_game_goes_through_loading(self):
+        from main import RPGPlatformer
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            game = RPGPlatformer()
+            game.start_game()
+            self.assertEqual(game.state, "loading")
+            for _ in range(1000):
+                game.run_frame()
+                if game.state != "loading":
+                    break
+
+        self.assertEqual(game.state, "game")
+        self.assertTrue(game.has_active_game)
+        self.assertIsNotNone(game.level.player)
+        self.assertIsNone(game.level_loader)
+        # Карта для следующей новой игры уже читается в фоне
+        self.assertIsNotNone(game.next_level_loader)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -5,7 +5,9 @@ import pygame
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 
-from game.platform import Platform
+from game.levels.level1 import Level
+from game.platform import Platform, find_adjacent_slope, link_slopes
+from game.spatial import SpatialGroup
 
 
 class TestPlatform(unittest.TestCase):
@@ -65,6 +67,56 @@ class TestPlatform(unittest.TestCase):
         mock_player_rect.bottom = surface_y
         self.assertTrue(triangle.check_collision(mock_player_rect))
 
+    def test_surface_y_at(self):
+        """Высота поверхности для склона, полутайла и обычной платформы"""
+        triangle = Platform(0, 400, 128, 128, "triangle")
+        semi = Platform(128, 400, 128, 128, "semitype1")
+        ground = Platform(256, 400, 128, 128, "grass1")
+
+        self.assertEqual(triangle.surface_y_at(0), 528)
+        self.assertEqual(triangle.surface_y_at(64), 464)
+        self.assertEqual(triangle.surface_y_at(500), 400)
+        self.assertEqual(semi.surface_y_at(150), 400)
+        self.assertEqual(ground.surface_y_at(300), 400)
+
+    def test_link_slopes_builds_chains(self):
+        """Склоны связываются с соседями в том же ряду и с продолжением выше"""
+        first = Platform(0, 400, 128, 128, "triangle")
+        same_row = Platform(128, 400, 128, 128, "triangle")
+        ramp_up = Platform(256, 272, 128, 128, "triangle")
+        far_away = Platform(1024, 400, 128, 128, "triangle")
+        ground = Platform(128, 528, 128, 128, "grass1")
+
+        linked = link_slopes([ramp_up, ground, far_away, same_row, first])
+
+        self.assertEqual(linked, 4)
+        self.assertIs(first.slope_right, same_row)
+        self.assertIs(same_row.slope_left, first)
+        self.assertIs(same_row.slope_right, ramp_up)
+        self.assertIs(ramp_up.slope_left, same_row)
+        self.assertIsNone(ramp_up.slope_right)
+        self.assertIsNone(far_away.slope_left)
+        self.assertTrue(first.slopes_linked)
+        self.assertFalse(ground.slopes_linked)
+        # Перебор без связки даёт того же соседа
+        self.assertIs(find_adjacent_slope(first, [ground, ramp_up, same_row]), same_row)
+
+    def test_level_surface_query(self):
+        """Level.get_surface_y возвращает ближайшую опору под точкой"""
+        level = Level.__new__(Level)
+        level.height = 1280
+        level.platforms = SpatialGroup(
+            Platform(0, 896, 128, 128, "grass1"),
+            Platform(0, 400, 128, 128, "triangle"),
+            Platform(256, 1024, 128, 128, "grass1"),
+        )
+
+        self.assertEqual(level.get_surface_y(64), 464)
+        self.assertEqual(level.get_surface_y(64, top=600), 896)
+        self.assertEqual(level.get_surface_y(300, top=0, max_depth=512), None)
+        self.assertEqual(level.get_surface_y(300), 1024)
+        self.assertIsNone(level.get_surface_y(200))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,6 +1,8 @@
 import unittest
 import sys
 import os
+import contextlib
+import io
 from collections import defaultdict
 import pygame
 
@@ -8,6 +10,7 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 
 from game.player import Player
 from game.platform import Platform
+from game.spatial import SpatialGroup
 
 
 class TestPlayer(unittest.TestCase):
@@ -112,6 +115,142 @@ class TestPlayer(unittest.TestCase):
         self.assertGreater(self.player.rect.x, previous_x)
         self.assertFalse(self.player.blocked_right)
 
+    def test_spatial_platforms_match_list(self):
+        """Платформы из пространственного индекса дают тот же результат, что и список"""
+        def build_platforms():
+            floor = [Platform(x, 512, 128, 128) for x in range(0, 128 * 40, 128)]
+            wall = [Platform(640, 384, 128, 128)]
+            return floor + wall
+
+        trajectories = []
+        for platforms in (build_platforms(), SpatialGroup(*build_platforms())):
+            player = Player(100, 300)
+            keys = defaultdict(int)
+            keys[pygame.K_RIGHT] = 1
+            positions = []
+            for _ in range(120):
+                player.handle_keys(keys, platforms)
+                player.update(platforms, [], 0)
+                positions.append((player.rect.topleft, player.on_ground))
+            trajectories.append(positions)
+
+        self.assertEqual(trajectories[0], trajectories[1])
+        # Игрок приземлился и не прошёл сквозь стену
+        (final_x, _), on_ground = trajectories[1][-1]
+        self.assertTrue(on_ground)
+        self.assertLess(final_x, 640)
+
+    def test_nearby_platforms_query(self):
+        """Выборка платформ возвращает только соседние тайлы"""
+        platforms = SpatialGroup(
+            *(Platform(x, 512, 128, 128) for x in range(0, 128 * 100, 128))
+        )
+        self.player.rect.topleft = (1000, 400)
+
+        nearby = self.player.get_nearby_platforms(platforms)
+
+        self.assertLess(len(nearby), 10)
+        self.assertTrue(all(abs(p.rect.centerx - 1000) < 500 for p in nearby))
+        self.assertEqual(self.player.get_nearby_platforms([1, 2]), [1, 2])
+
+    def test_trap_and_enemy_queries_match_list(self):
+        """Ловушки и враги из индекса задевают игрока так же, как при переборе списка"""
+        from game.activation import ActivationGroup
+        from game.traps.spikes import Spikes
+
+        class _Enemy(pygame.sprite.Sprite):
+            is_dead = False
+            is_hurt = False
+
+            def __init__(self, index, x, y):
+                super().__init__()
+                self.index = index
+                self.rect = pygame.Rect(x, y, 64, 48)
+
+            def take_damage(self, damage):
+                pass
+
+        def build():
+            traps = []
+            for index, x in enumerate(range(256, 128 * 40, 384)):
+                trap = Spikes(x, 512, 128, 128)
+                trap.damage = index + 1  # по урону видно, какая ловушка сработала
+                traps.append(trap)
+            enemies = [
+                _Enemy(index, x, 592) for index, x in enumerate(range(200, 128 * 40, 300))
+            ]
+            return traps, enemies
+
+        results = []
+        for indexed in (False, True):
+            traps, enemies = build()
+            if indexed:
+                traps, enemies = ActivationGroup(*traps), ActivationGroup(*enemies)
+            player = Player(0, 0)
+            hits = []
+            player.take_damage_from_trap = lambda damage: hits.append(("trap", damage))
+            player.take_damage = lambda damage, enemy: hits.append(("enemy", enemy.index))
+            player.kill_enemy = lambda enemy: hits.append(("kill", enemy.index))
+            for y in (380, 450, 520, 600):
+                for x in range(-100, 128 * 41, 23):
+                    player.rect.topleft = (x, y)
+                    player.velocity_y = 5 if x % 2 else 0
+                    player.check_trap_collisions(traps, 0)
+                    player.check_enemy_collisions(enemies, 0)
+                    hits.append(None)
+            results.append(hits)
+
+        self.assertEqual(results[0], results[1])
+        self.assertTrue(any(hit and hit[0] == "trap" for hit in results[0]))
+        self.assertTrue(any(hit and hit[0] != "trap" for hit in results[0]))
+
+
+class TestTickRateIndependence(unittest.TestCase):
+    """Прыжок и бег игрока одинаковы при любой частоте шагов симуляции"""
+
+    def setUp(self):
+        pygame.init()
+
+    def tearDown(self):
+        pygame.quit()
+
+    def _measure(self, tick_rate):
+        """(высота прыжка, пройдено за 1 с бега) при частоте tick_rate"""
+        dt = 1.0 / tick_rate
+        platforms = [Platform(-1000, 400, 10000, 50)]
+        with contextlib.redirect_stdout(io.StringIO()):
+            player = Player(100, 0)
+            for _ in range(tick_rate):  # падение и приземление
+                player.update(platforms, [], 0, dt=dt)
+            self.assertTrue(player.on_ground)
+
+            ground_y = player.rect.y
+            player.jump()
+            apex_y = ground_y
+            for _ in range(3 * tick_rate):
+                player.update(platforms, [], 0, dt=dt)
+                apex_y = min(apex_y, player.rect.y)
+                if player.on_ground:
+                    break
+
+            keys = defaultdict(int)
+            keys[pygame.K_RIGHT] = 1
+            start_x = player.rect.x
+            for _ in range(tick_rate):
+                player.handle_keys(keys, platforms, dt)
+                player.update(platforms, [], 0, dt=dt)
+                self.assertTrue(player.on_ground)
+        return ground_y - apex_y, player.rect.x - start_x
+
+    def test_jump_and_run_match_across_tick_rates(self):
+        apex_60, run_60 = self._measure(60)
+        # speed — пикселей за шаг 60 Гц
+        self.assertEqual(run_60, 5 * 60)
+        for tick_rate in (30, 120):
+            apex, run = self._measure(tick_rate)
+            self.assertLessEqual(abs(apex - apex_60), 2, f"tick_rate={tick_rate}")
+            self.assertLessEqual(abs(run - run_60), 1, f"tick_rate={tick_rate}")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,136 @@
+import unittest
+import sys
+import os
+import csv
+import json
+import tempfile
+import time
+import pygame
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from game.profiler import SECTIONS, FrameProfiler, percentile
+
+
+class TestPercentile(unittest.TestCase):
+    def test_nearest_rank(self):
+        values = list(range(1, 101))
+        self.assertEqual(percentile(values, 50), 51)
+        self.assertEqual(percentile(values, 99), 100)
+        self.assertEqual(percentile([], 95), 0.0)
+
+
+class TestFrameProfiler(unittest.TestCase):
+    def test_sections_accumulate_within_frame(self):
+        profiler = FrameProfiler()
+        profiler.begin_frame()
+        for _ in range(3):
+            with profiler.section("level.update"):
+                pass
+        self.assertGreater(profiler.current["level.update"], 0.0)
+        profiler.end_frame()
+        self.assertEqual(profiler.current["level.update"], 0.0)
+        self.assertEqual(len(profiler.frames), 1)
+        self.assertEqual(len(profiler.frames[0]), len(SECTIONS) + 1)
+
+    def test_window_is_bounded(self):
+        profiler = FrameProfiler(window=10)
+        profiler.begin_frame()
+        for _ in range(25):
+            profiler.end_frame()
+        self.assertEqual(len(profiler.frames), 10)
+        self.assertEqual(profiler.frame_count, 25)
+
+    def test_stats_report_percentiles_in_ms(self):
+        profiler = FrameProfiler()
+        profiler.begin_frame()
+        for value in range(100):
+            profiler.current["player.update"] = value / 1000.0
+            profiler.end_frame()
+        stats = profiler.stats()
+        self.assertAlmostEqual(stats["player.update"]["p50"], 50.0)
+        self.assertAlmostEqual(stats["player.update"]["p99"], 99.0)
+        self.assertIn("frame", stats)
+
+    def test_first_frame_without_begin_is_not_recorded(self):
+        """Без начала кадра строка с нулевым временем не записывается"""
+        profiler = FrameProfiler()
+        profiler.end_frame()
+        self.assertEqual(len(profiler.frames), 0)
+        profiler.end_frame()
+        self.assertEqual(len(profiler.frames), 1)
+        self.assertGreater(profiler.frames[0][-1], 0.0)
+
+    def test_begin_frame_restarts_frame_time(self):
+        """begin_frame сбрасывает отсчёт: пауза до него не попадает в кадр"""
+        profiler = FrameProfiler()
+        profiler.begin_frame()
+        time.sleep(0.05)
+        profiler.begin_frame()
+        profiler.end_frame()
+        self.assertLess(profiler.frames[0][-1], 0.05)
+
+    def test_disabled_profiler_records_nothing(self):
+        profiler = FrameProfiler(enabled=False)
+        with profiler.section("hud.draw"):
+            pass
+        profiler.end_frame()
+        self.assertEqual(profiler.current["hud.draw"], 0.0)
+        self.assertEqual(len(profiler.frames), 0)
+
+    def test_dump_csv_and_json(self):
+        profiler = FrameProfiler(window=2, keep_history=True)
+        profiler.begin_frame()
+        for _ in range(5):
+            with profiler.section("level.draw"):
+                pass
+            profiler.end_frame()
+
+        with tempfile.TemporaryDirectory() as tmp:
+            csv_path = os.path.join(tmp, "profile.csv")
+            json_path = os.path.join(tmp, "profile.json")
+            profiler.dump(csv_path)
+            profiler.dump(json_path)
+
+            with open(csv_path, newline="", encoding="utf-8") as f:
+                rows = list(csv.reader(f))
+            with open(json_path, encoding="utf-8") as f:
+                data = json.load(f)
+
+        # История хранит все кадры, а не только окно
+        self.assertEqual(len(rows), 6)
+        self.assertIn("level.draw_ms", rows[0])
+        self.assertEqual(data["frames"], 5)
+        self.assertEqual(len(data["history_ms"]), 5)
+        self.assertIn("p95", data["summary"]["level.draw"])
+
+
+class TestProfilerOverlay(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+        self.screen = pygame.display.set_mode((800, 600))
+
+    def test_debug_overlay_draws_graph(self):
+        from ui.hud import HUD
+
+        class _Player:
+            rect = pygame.Rect(0, 0, 10, 10)
+
+        profiler = FrameProfiler(window=50)
+        profiler.begin_frame()
+        for _ in range(50):
+            profiler.current["level.draw"] = 0.008
+            profiler.end_frame()
+
+        hud = HUD(_Player(), profiler)
+        self.screen.fill((0, 0, 0))
+        hud._draw_debug_overlay(self.screen)
+        # Столбец последнего кадра внизу графика окрашен цветом level.draw
+        bottom = self.screen.get_height() - 20 - 20 * (len(SECTIONS) + 2)
+        self.assertEqual(
+            self.screen.get_at((10 + 49, bottom - 2))[:3], (255, 170, 0)
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
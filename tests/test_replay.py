@@ -0,0 +1,98 @@
+import unittest
+import sys
+import os
+import tempfile
+import pygame
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from game.asset_loader import asset_loader
+from game.replay import InputLog, InputRecorder, keys_to_mask, mask_to_keys, replay
+from game.simulation import FrameInput, GameSession, KeyState
+
+
+def _scripted_inputs(frames):
+    """Бег вправо, пауза и прыжки — с повторами и без"""
+    inputs = []
+    for i in range(frames):
+        right = (i // 90) % 3 != 2
+        inputs.append(FrameInput(right=right, jump=(i % 50 == 10)))
+    return inputs
+
+
+class TestInputLog(unittest.TestCase):
+    def test_mask_roundtrip(self):
+        keys = KeyState((pygame.K_a, pygame.K_SPACE))
+        restored = mask_to_keys(keys_to_mask(keys))
+        self.assertTrue(restored[pygame.K_a])
+        self.assertTrue(restored[pygame.K_SPACE])
+        self.assertFalse(restored[pygame.K_LEFT])
+
+    def test_identical_ticks_are_run_length_encoded(self):
+        log = InputLog()
+        for _ in range(1000):
+            log.append(1)
+        log.append(1, [(pygame.KEYDOWN, pygame.K_SPACE)])
+        log.append(1)
+        self.assertEqual(log.ticks, 1002)
+        self.assertEqual(len(log.records), 3)
+
+    def test_bytes_roundtrip(self):
+        log = InputLog("level1", 60)
+        log.append(4)
+        log.append(4, [(pygame.KEYDOWN, pygame.K_SPACE), (pygame.KEYUP, pygame.K_d)])
+        log.append(0)
+        restored = InputLog.from_bytes(log.to_bytes())
+        self.assertEqual(restored.level_name, "level1")
+        self.assertEqual(restored.tick_rate, 60)
+        self.assertEqual(restored.records, log.records)
+
+    def test_rejects_unknown_format(self):
+        with self.assertRaises(ValueError):
+            InputLog.from_bytes(b"XXXX" + bytes(8))
+
+    def test_recorder_attaches_events_to_next_tick(self):
+        recorder = InputRecorder()
+        recorder.record_event(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_SPACE))
+        recorder.record_event(pygame.event.Event(pygame.MOUSEMOTION, pos=(0, 0)))
+        recorder.record_tick(KeyState())
+        recorder.record_tick(KeyState())
+        ticks = list(recorder.log.iter_ticks())
+        self.assertEqual(len(ticks), 2)
+        self.assertEqual([event.key for event in ticks[0][1]], [pygame.K_SPACE])
+        self.assertEqual(ticks[1][1], [])
+
+
+class TestReplay(unittest.TestCase):
+    def setUp(self):
+        self._stub_pixels = asset_loader.stub_pixels
+
+    def tearDown(self):
+        asset_loader.set_stub_pixels(self._stub_pixels)
+
+    def test_replay_reproduces_recorded_session(self):
+        session = GameSession()
+        session.recorder = InputRecorder("level1", 60)
+        session.run(_scripted_inputs(600), stop_on_complete=False)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "session.rpgr")
+            session.recorder.save(path)
+            self.assertLess(os.path.getsize(path), 600)
+            log = InputLog.load(path)
+
+        result = replay(log)
+        self.assertEqual(result.ticks, 600)
+        self.assertEqual(len(result.tick_times), 600)
+        self.assertEqual(result.state_hash, session.state_hash())
+
+    def test_different_input_changes_hash(self):
+        first = GameSession()
+        first.run([FrameInput(right=True)] * 60)
+        second = GameSession()
+        second.run([FrameInput()] * 60)
+        self.assertNotEqual(first.state_hash(), second.state_hash())
+
+
+if __name__ == "__main__":
+    unittest.main()
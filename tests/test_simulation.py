@@ -0,0 +1,69 @@
+import unittest
+import sys
+import os
+import pygame
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from game.asset_loader import asset_loader
+from game.simulation import FrameInput, GameSession, KeyState
+
+
+def _scripted_inputs(frames):
+    """Бег вправо с периодическими прыжками"""
+    return [FrameInput(right=True, jump=(i % 45 == 0)) for i in range(frames)]
+
+
+class TestKeyState(unittest.TestCase):
+    def test_from_input_maps_keys(self):
+        keys = KeyState.from_input(FrameInput(left=True, jump=True))
+        self.assertTrue(keys[pygame.K_LEFT])
+        self.assertTrue(keys[pygame.K_SPACE])
+        self.assertFalse(keys[pygame.K_RIGHT])
+        self.assertFalse(keys[pygame.K_a])
+
+
+class TestGameSession(unittest.TestCase):
+    def setUp(self):
+        self._stub_pixels = asset_loader.stub_pixels
+
+    def tearDown(self):
+        asset_loader.set_stub_pixels(self._stub_pixels)
+
+    def test_step_advances_tick_and_time(self):
+        session = GameSession()
+        self.assertEqual(session.tick, 0)
+        session.step()
+        session.step(FrameInput(right=True))
+        self.assertEqual(session.tick, 2)
+        self.assertAlmostEqual(session.time, 2 / 60)
+
+    def test_player_falls_to_ground_without_input(self):
+        session = GameSession()
+        session.run([FrameInput()] * 120)
+        self.assertTrue(session.state()["player"]["on_ground"])
+
+    def test_running_right_moves_player(self):
+        session = GameSession()
+        start_x = session.player.rect.x
+        session.run([FrameInput(right=True)] * 60)
+        self.assertGreater(session.player.rect.x, start_x)
+
+    def test_same_inputs_give_same_state(self):
+        inputs = _scripted_inputs(300)
+        first = GameSession()
+        first.run(inputs)
+        second = GameSession()
+        second.run(inputs)
+        self.assertEqual(first.state(), second.state())
+
+    def test_stub_pixels_keep_image_sizes(self):
+        session = GameSession(stub_pixels=True)
+        stubbed = {p.rect.size for p in session.level.platforms}
+        real = GameSession(stub_pixels=False)
+        self.assertEqual(stubbed, {p.rect.size for p in real.level.platforms})
+        self.assertEqual(session.state(), real.state())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,108 @@
+import unittest
+import sys
+import os
+import pygame
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from game.camera import Camera
+from game.spatial import SpatialGroup, SpatialHash, nearby
+
+
+class _Box(pygame.sprite.Sprite):
+    def __init__(self, x, y, w=64, h=64):
+        super().__init__()
+        self.rect = pygame.Rect(x, y, w, h)
+
+
+class TestSpatialHash(unittest.TestCase):
+    """Тесты пространственного индекса"""
+
+    def test_query_returns_insertion_order(self):
+        """Запрос возвращает объекты в порядке вставки"""
+        index = SpatialHash(cell_size=100)
+        index.insert("c", pygame.Rect(250, 0, 10, 10))
+        index.insert("a", pygame.Rect(0, 0, 10, 10))
+        index.insert("b", pygame.Rect(150, 0, 10, 10))
+
+        self.assertEqual(index.query(pygame.Rect(0, 0, 300, 10)), ["c", "a", "b"])
+        self.assertEqual(index.query(pygame.Rect(120, 0, 50, 10)), ["b"])
+        self.assertEqual(index.query(pygame.Rect(0, 500, 50, 10)), [])
+
+    def test_object_spanning_cells_reported_once(self):
+        """Объект на границе ячеек возвращается один раз"""
+        index = SpatialHash(cell_size=100)
+        index.insert("wide", pygame.Rect(50, 50, 200, 200))
+
+        self.assertEqual(index.query(pygame.Rect(0, 0, 400, 400)), ["wide"])
+
+    def test_move_and_remove(self):
+        """Перемещение и удаление обновляют ячейки"""
+        index = SpatialHash(cell_size=100)
+        index.insert("a", pygame.Rect(0, 0, 10, 10))
+        index.move("a", pygame.Rect(500, 500, 10, 10))
+
+        self.assertEqual(index.query(pygame.Rect(0, 0, 10, 10)), [])
+        self.assertEqual(index.query(pygame.Rect(500, 500, 10, 10)), ["a"])
+
+        index.remove("a")
+        self.assertEqual(len(index), 0)
+        self.assertEqual(index.cells, {})
+
+
+class TestSpatialGroup(unittest.TestCase):
+    """Тесты группы спрайтов с индексом"""
+
+    def test_group_tracks_add_and_kill(self):
+        """add/kill поддерживают индекс в актуальном состоянии"""
+        near, far = _Box(10, 10), _Box(5000, 5000)
+        group = SpatialGroup(near, far)
+        view = pygame.Rect(0, 0, 800, 600)
+
+        self.assertEqual(group.query(view), [near])
+        near.kill()
+        self.assertEqual(group.query(view), [])
+        self.assertEqual(len(group.spatial), 1)
+
+    def test_refresh_after_move(self):
+        """refresh переносит спрайт в новые ячейки"""
+        box = _Box(5000, 5000)
+        group = SpatialGroup(box)
+        box.rect.topleft = (100, 100)
+        group.refresh(box)
+
+        self.assertEqual(group.query(pygame.Rect(0, 0, 800, 600)), [box])
+
+    def test_nearby_matches_full_scan(self):
+        """nearby() находит все пересечения, что и полный перебор, после сдвигов"""
+        import random
+
+        rng = random.Random(7)
+        boxes = [
+            _Box(rng.randrange(0, 5000), rng.randrange(0, 3000), rng.randrange(8, 200), 64)
+            for _ in range(300)
+        ]
+        group = SpatialGroup(*boxes)
+        for box in boxes[::3]:
+            box.rect.move_ip(rng.randrange(-40, 40), rng.randrange(-40, 40))
+            group.refresh(box)
+
+        for _ in range(200):
+            rect = pygame.Rect(rng.randrange(0, 5000), rng.randrange(0, 3000), 80, 100)
+            expected = [box for box in boxes if box.rect.colliderect(rect)]
+            found = [box for box in nearby(group, rect) if box.rect.colliderect(rect)]
+            self.assertEqual(found, expected)
+
+        self.assertEqual(nearby(boxes, pygame.Rect(0, 0, 1, 1)), boxes)
+
+    def test_camera_view_rect(self):
+        """Видимая область камеры с запасом"""
+        camera = Camera(_Box(0, 0), (800, 600))
+        camera.offset.update(100, 200)
+
+        self.assertEqual(camera.get_view_rect(), pygame.Rect(100, 200, 800, 600))
+        self.assertEqual(camera.get_view_rect(50), pygame.Rect(50, 150, 900, 700))
+
+
+if __name__ == "__main__":
+    unittest.main()
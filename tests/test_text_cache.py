@@ -0,0 +1,63 @@
+import unittest
+import sys
+import os
+import pygame
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from ui.text_cache import SHADOW_OFFSET, TextCache
+
+
+class TestTextCache(unittest.TestCase):
+    """Тесты кэша отрисованного текста"""
+
+    def setUp(self):
+        pygame.font.init()
+        self.font = pygame.font.Font(None, 32)
+        self.cache = TextCache(max_entries=4)
+
+    def test_repeated_text_is_not_rasterized(self):
+        first = self.cache.render(self.font, "2D PLATFORMER", (255, 255, 255))
+        second = self.cache.render(self.font, "2D PLATFORMER", (255, 255, 255))
+
+        self.assertIs(first, second)
+        self.assertEqual(self.cache.rasterized, 1)
+        self.assertEqual(self.cache.hits, 1)
+
+    def test_color_and_shadow_are_part_of_key(self):
+        white = self.cache.render(self.font, "x 5", (255, 255, 255))
+        yellow = self.cache.render(self.font, "x 5", (255, 255, 0))
+        shadowed = self.cache.render(self.font, "x 5", (255, 255, 255), (0, 0, 0))
+
+        self.assertIsNot(white, yellow)
+        self.assertIsNot(white, shadowed)
+        self.assertEqual(
+            shadowed.get_size(),
+            (white.get_width() + SHADOW_OFFSET[0], white.get_height() + SHADOW_OFFSET[1]),
+        )
+
+    def test_lru_evicts_oldest(self):
+        for text in ("a", "b", "c", "d"):
+            self.cache.render(self.font, text, (255, 255, 255))
+        self.cache.render(self.font, "a", (255, 255, 255))  # "a" снова свежий
+        self.cache.render(self.font, "e", (255, 255, 255))
+
+        keys = [key[1] for key in self.cache.entries]
+        self.assertEqual(keys, ["c", "d", "a", "e"])
+
+    def test_numbers_composed_from_glyphs(self):
+        """Новое число собирается из уже растеризованных глифов"""
+        cache = TextCache()
+        for coins in range(1, 100):
+            cache.render(self.font, f"x {coins}", (255, 255, 255), glyphs=True)
+
+        # 'x', пробел и десять цифр — каждый глиф растеризован один раз
+        self.assertEqual(cache.rasterized, 12)
+        composed = cache.render(self.font, "x 42", (255, 255, 255), glyphs=True)
+        # Глифы стоят по целым шагам шрифта
+        advance = sum(metrics[4] for metrics in self.font.metrics("x 42"))
+        self.assertEqual(composed.get_size(), (advance, self.font.get_height()))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,88 @@
+import unittest
+import sys
+import os
+import pygame
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from game.levels.tile_chunks import TileChunkRenderer
+
+
+class _Tile(pygame.sprite.Sprite):
+    def __init__(self, x, y, color, size=128):
+        super().__init__()
+        self.image = pygame.Surface((size, size), pygame.SRCALPHA)
+        self.image.fill(color)
+        self.rect = self.image.get_rect(topleft=(x, y))
+
+
+class _Camera:
+    def __init__(self, x, y):
+        self.offset = pygame.math.Vector2(x, y)
+
+    def apply(self, rect):
+        return rect.move(-self.offset.x, -self.offset.y)
+
+
+class TestTileChunks(unittest.TestCase):
+    """Тесты запекания статичных тайлов в чанки"""
+
+    def setUp(self):
+        pygame.init()
+        self.platforms = pygame.sprite.Group(
+            _Tile(0, 0, (255, 0, 0)),
+            _Tile(1024, 0, (0, 255, 0)),
+            _Tile(4096, 2048, (0, 0, 255)),
+        )
+        self.renderer = TileChunkRenderer([self.platforms], chunk_size=1024)
+        self.renderer.build()
+
+    def tearDown(self):
+        pygame.quit()
+
+    def test_only_occupied_chunks_created(self):
+        """Чанки создаются только там, где есть тайлы"""
+        self.assertEqual(set(self.renderer.chunks), {(0, 0), (1, 0), (4, 2)})
+
+    def test_draw_only_visible_chunks(self):
+        """Рисуются только чанки, пересекающие экран"""
+        screen = pygame.Surface((800, 600))
+        drawn = self.renderer.draw(screen, _Camera(600, 0))
+
+        self.assertEqual(drawn, 2)
+        self.assertEqual(screen.get_at((0, 0))[:3], (0, 0, 0))
+        self.assertEqual(screen.get_at((1024 - 600, 10))[:3], (0, 255, 0))
+
+    def test_invalidate_rebuilds_chunk(self):
+        """После удаления тайла и invalidate чанк перерисовывается"""
+        tile = next(sprite for sprite in self.platforms if sprite.rect.x == 0)
+        self.platforms.remove(tile)
+        self.renderer.invalidate(tile.rect)
+
+        screen = pygame.Surface((800, 600))
+        self.renderer.draw(screen, _Camera(0, 0))
+
+        self.assertEqual(screen.get_at((10, 10))[:3], (0, 0, 0))
+        self.assertNotIn((0, 0), self.renderer.chunks)
+
+    def test_large_map_bakes_lazily_and_evicts(self):
+        """Чанков больше лимита: запекаются видимые, старые вытесняются"""
+        renderer = TileChunkRenderer([self.platforms], chunk_size=1024, max_chunks=1)
+        renderer.build()
+        self.assertEqual(renderer.chunks, {})
+
+        screen = pygame.Surface((800, 600))
+        renderer.draw(screen, _Camera(0, 0))
+        self.assertEqual(set(renderer.chunks), {(0, 0)})
+        self.assertEqual(screen.get_at((10, 10))[:3], (255, 0, 0))
+
+        renderer.draw(screen, _Camera(1024, 0))
+        self.assertEqual(set(renderer.chunks), {(1, 0)})
+
+        screen.fill((0, 0, 0))
+        renderer.draw(screen, _Camera(0, 0))
+        self.assertEqual(screen.get_at((10, 10))[:3], (255, 0, 0))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,138 @@
+import unittest
+import contextlib
+import io
+import sys
+import os
+import pygame
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from game.config import GameConfig, SimulationConfig, load_config
+from game.timestep import FixedTimestep, RenderInterpolator, lerp_position
+
+
+class _Body:
+    def __init__(self, x, y):
+        self.rect = pygame.Rect(x, y, 10, 10)
+
+
+class _Camera:
+    def __init__(self):
+        self.offset = pygame.math.Vector2(0, 0)
+
+
+class TestFixedTimestep(unittest.TestCase):
+    """Тесты фиксированного шага симуляции"""
+
+    def test_steps_do_not_depend_on_frame_rate(self):
+        """За одну секунду выполняется tick_rate шагов при любом FPS отрисовки"""
+        for render_fps in (30, 60, 144, 17):
+            timestep = FixedTimestep(tick_rate=60, max_steps=10)
+            total = sum(timestep.advance(1.0 / render_fps) for _ in range(render_fps))
+            self.assertIn(total, (59, 60), f"render_fps={render_fps}")
+
+    def test_accumulator_and_alpha(self):
+        """Остаток кадра копится и даёт alpha для интерполяции"""
+        timestep = FixedTimestep(tick_rate=100)
+
+        self.assertEqual(timestep.advance(0.025), 2)
+        self.assertAlmostEqual(timestep.alpha, 0.5)
+        self.assertEqual(timestep.advance(0.005), 1)
+        self.assertAlmostEqual(timestep.alpha, 0.0, places=6)
+        self.assertAlmostEqual(timestep.sim_time, 0.03)
+
+    def test_long_frame_is_clamped(self):
+        """Длинный кадр не порождает лавину шагов"""
+        timestep = FixedTimestep(tick_rate=60, max_steps=5)
+
+        self.assertEqual(timestep.advance(2.0), 5)
+        self.assertGreater(timestep.dropped_time, 0)
+        self.assertEqual(timestep.accumulator, 0)
+
+
+class TestRenderInterpolator(unittest.TestCase):
+    """Тесты интерполяции позиций при отрисовке"""
+
+    def test_interpolated_positions_are_restored(self):
+        """Внутри контекста позиции интерполированы, после — восстановлены"""
+        body, camera = _Body(0, 0), _Camera()
+        interpolator = RenderInterpolator()
+        interpolator.capture([body], camera)
+
+        body.rect.topleft = (10, 20)
+        camera.offset.update(4, 8)
+        with interpolator.interpolated(0.5, camera):
+            self.assertEqual(body.rect.topleft, (5, 10))
+            self.assertEqual(tuple(camera.offset), (2, 4))
+
+        self.assertEqual(body.rect.topleft, (10, 20))
+        self.assertEqual(tuple(camera.offset), (4, 8))
+
+    def test_teleport_is_not_interpolated(self):
+        """Респавн на другом конце карты не размазывается"""
+        body = _Body(0, 0)
+        interpolator = RenderInterpolator(snap_distance=100)
+        interpolator.capture([body])
+
+        body.rect.topleft = (3000, 0)
+        with interpolator.interpolated(0.5):
+            self.assertEqual(body.rect.topleft, (3000, 0))
+
+    def test_lerp_position(self):
+        self.assertEqual(lerp_position((0, 0), (10, -10), 0.25), (2, -2))
+
+
+class TestTrapInterpolation(unittest.TestCase):
+    """Ловушки сглаживаются вместе с остальными объектами"""
+
+    @classmethod
+    def setUpClass(cls):
+        from game.simulation import init_headless
+
+        init_headless(stub_pixels=True)
+
+    def test_saw_image_follows_interpolated_rect(self):
+        from game.traps.saw import Saw
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            saw = Saw(100, 100)
+        start_x = saw.image_rect.x
+        interpolator = RenderInterpolator()
+        interpolator.capture([saw])
+
+        saw.rect.x += 10
+        screen = pygame.Surface((400, 400))
+        with interpolator.interpolated(0.5):
+            saw.draw(screen, _Camera())
+            self.assertEqual(saw.image_rect.x, start_x + 5)
+
+    def test_game_captures_traps(self):
+        from game.levels.loader import LevelLoader
+        from game.traps.saw import Saw
+        from main import RPGPlatformer
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            game = RPGPlatformer()
+            game.interpolate = True
+            game.finish_start_game(LevelLoader("level1").wait(timeout=30))
+            saw = next(trap for trap in game.level.traps if isinstance(trap, Saw))
+            game.camera.offset.update(saw.rect.x - 100, saw.rect.y - 100)
+            game.capture_interpolation_state()
+
+        self.assertIn(saw, game.interpolator.sprite_positions)
+
+
+class TestSimulationConfig(unittest.TestCase):
+    """Секция simulation в конфигурации"""
+
+    def test_defaults(self):
+        config = load_config()
+        self.assertIsInstance(config.simulation, SimulationConfig)
+        self.assertEqual(config.simulation.tick_rate, 60)
+        self.assertIsInstance(
+            GameConfig(None, None, None, None).simulation, SimulationConfig
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,133 @@
+import unittest
+import sys
+import os
+import base64
+import zlib
+import struct
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from game.path_utils import resource_path
+from game.levels.tmx_loader import (
+    FLIPPED_HORIZONTALLY_FLAG,
+    FLIPPED_VERTICALLY_FLAG,
+    TmxLayer,
+    decode_layer_data,
+    load_tmx,
+    write_tmx,
+)
+
+
+LEVEL1_PATH = resource_path("game", "assets", "levels", "level1.tmx")
+
+
+class TestTmxLoader(unittest.TestCase):
+    """Тесты потокового загрузчика TMX"""
+
+    def test_level1_map_header(self):
+        """Размеры карты и тайлов читаются из файла"""
+        tmx_map = load_tmx(LEVEL1_PATH)
+
+        self.assertEqual((tmx_map.width, tmx_map.height), (30, 20))
+        self.assertEqual((tmx_map.tilewidth, tmx_map.tileheight), (128, 128))
+        self.assertEqual(tmx_map.pixel_width, 3840)
+        self.assertEqual(tmx_map.pixel_height, 2560)
+
+    def test_level1_tilesets(self):
+        """Все tilesets с firstgid и путями изображений"""
+        tmx_map = load_tmx(LEVEL1_PATH)
+
+        firstgids = [tileset.firstgid for tileset in tmx_map.tilesets]
+        self.assertEqual(firstgids, [1, 129, 161, 289, 417, 522])
+        self.assertEqual(
+            tmx_map.tilesets[0].image_source, "Spritesheets/spritesheet_ground.png"
+        )
+        self.assertEqual(tmx_map.tilesets[4].margin, 2)
+
+    def test_level1_layers(self):
+        """Каждый слой декодируется в полную сетку GID"""
+        tmx_map = load_tmx(LEVEL1_PATH)
+
+        names = [layer.name for layer in tmx_map.layers]
+        self.assertEqual(
+            names, ["ground", "triangleleft", "semiground", "traps", "decoration"]
+        )
+        for layer in tmx_map.layers:
+            self.assertEqual(len(layer.data), 30 * 20)
+
+        ground = tmx_map.get_layer("ground")
+        self.assertTrue(any(gid != 0 for gid in ground.data))
+
+    def test_level1_objects(self):
+        """Объекты групп enemy/items/spawn"""
+        tmx_map = load_tmx(LEVEL1_PATH)
+
+        enemies = tmx_map.get_objectgroup("enemy").objects
+        self.assertEqual(
+            [obj.type for obj in enemies], ["slime", "snail", "saw", "fly"]
+        )
+        self.assertEqual(enemies[0].gid, 418)
+        self.assertAlmostEqual(enemies[1].x, 1790.55)
+
+        spawn = tmx_map.get_objectgroup("spawn").objects[0]
+        self.assertEqual((spawn.type, spawn.x, spawn.y), ("player", 0, 1280))
+
+    def test_decode_layer_data_encodings(self):
+        """base64+zlib, base64 без сжатия и csv дают одинаковый результат"""
+        gids = [0, 1, 25, 0, 341, 0]
+        raw = struct.pack("<6I", *gids)
+
+        zlib_text = base64.b64encode(zlib.compress(raw)).decode()
+        plain_text = base64.b64encode(raw).decode()
+        csv_text = "\n" + ",".join(str(gid) for gid in gids) + "\n"
+
+        self.assertEqual(list(decode_layer_data(zlib_text, "base64", "zlib")), gids)
+        self.assertEqual(list(decode_layer_data(plain_text, "base64")), gids)
+        self.assertEqual(list(decode_layer_data(csv_text, "csv")), gids)
+
+    def test_decode_layer_data_masks_flip_flags(self):
+        """Флаги отражения снимаются во всех кодировках"""
+        gids = [
+            5 | FLIPPED_HORIZONTALLY_FLAG,
+            0,
+            341 | FLIPPED_VERTICALLY_FLAG | FLIPPED_HORIZONTALLY_FLAG,
+        ]
+        raw = struct.pack("<3I", *gids)
+
+        zlib_text = base64.b64encode(zlib.compress(raw)).decode()
+        csv_text = ",".join(str(gid) for gid in gids)
+
+        self.assertEqual(list(decode_layer_data(zlib_text, "base64", "zlib")), [5, 0, 341])
+        self.assertEqual(list(decode_layer_data(csv_text, "csv")), [5, 0, 341])
+
+    def test_layer_grid_and_nonzero_tiles(self):
+        """Двумерный вид слоя и обход только непустых клеток"""
+        raw = struct.pack("<6I", 0, 7, 0, 0, 0, 9)
+        data = decode_layer_data(base64.b64encode(raw).decode(), "base64")
+        layer = TmxLayer("ground", width=3, height=2, data=data)
+
+        self.assertEqual(layer.grid.shape, (2, 3))
+        self.assertEqual(layer.grid[0, 1], 7)
+        self.assertEqual(layer.grid[1, 2], 9)
+        self.assertEqual(list(layer.iter_tiles()), [(1, 0, 7), (2, 1, 9)])
+
+    def test_write_tmx_roundtrip(self):
+        """Сохранённая карта читается обратно без потерь"""
+        tmx_map = load_tmx(LEVEL1_PATH)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "copy.tmx")
+            write_tmx(tmx_map, path)
+            copy = load_tmx(path)
+
+        self.assertEqual((copy.width, copy.height), (tmx_map.width, tmx_map.height))
+        self.assertEqual(copy.tilesets, tmx_map.tilesets)
+        self.assertEqual(
+            [(layer.name, list(layer.data)) for layer in copy.layers],
+            [(layer.name, list(layer.data)) for layer in tmx_map.layers],
+        )
+        self.assertEqual(copy.objectgroups, tmx_map.objectgroups)
+
+
+if __name__ == "__main__":
+    unittest.main()
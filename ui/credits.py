@@ -1,5 +1,8 @@
 import pygame
 
+from ui.frame_cache import FrameCache
+from ui.text_cache import text_cache
+
 
 class Credits:
     """Simple credits screen implementation."""
@@ -17,6 +20,8 @@ class Credits:
             "",
             "Нажмите ESC для возврата в меню",
         ]
+        # Экран титров целиком статичен: рисуется один раз
+        self.frames = FrameCache()
 
     def handle_event(self, event):
         if event.type == pygame.KEYDOWN:
@@ -24,6 +29,12 @@ class Credits:
                 self.app.go_to_menu()
 
     def draw(self, screen):
+        background = getattr(self.app.menu, "background", None)
+        self.frames.blit(
+            screen, "credits", (background, tuple(self.credits_text)), self._draw_static
+        )
+
+    def _draw_static(self, screen):
         # Draw background
         if hasattr(self.app.menu, "background") and self.app.menu.background:
             screen.blit(self.app.menu.background, (0, 0))
@@ -41,9 +52,9 @@ class Credits:
         y_offset = 150
         for line in self.credits_text:
             if line == "2D PLATFORMER":
-                text = self.title_font.render(line, True, (255, 255, 255))
+                text = text_cache.render(self.title_font, line, (255, 255, 255))
             else:
-                text = self.font.render(line, True, (255, 255, 255))
+                text = text_cache.render(self.font, line, (255, 255, 255))
 
             text_rect = text.get_rect(center=(screen.get_width() // 2, y_offset))
             screen.blit(text, text_rect)
@@ -0,0 +1,33 @@
+# ui/frame_cache.py
+"""
+Готовые статичные кадры экранов меню.
+
+Фон, затемнение, заголовок и неизменные надписи экрана рисуются один раз в
+поверхность размером с экран; каждый кадр она выводится одним blit, а поверх
+рисуется только то, что меняется (выделенный пункт, слайдеры).
+"""
+
+import pygame
+
+
+class FrameCache:
+    def __init__(self):
+        self.frames = {}  # имя экрана -> (ключ, поверхность)
+
+    def clear(self):
+        """Сбрасывает все кадры (например, после смены фона или языка)"""
+        self.frames.clear()
+
+    def blit(self, screen, name, key, build):
+        """
+        Выводит кадр name на screen. Кадр строится вызовом build(surface) и
+        перестраивается, когда меняется key или размер экрана.
+        """
+        key = (screen.get_size(), key)
+        cached = self.frames.get(name)
+        if cached is None or cached[0] != key:
+            # Тот же формат пикселей, что у экрана: blit без преобразования
+            frame = pygame.Surface(screen.get_size(), 0, screen)
+            build(frame)
+            cached = self.frames[name] = (key, frame)
+        screen.blit(cached[1], (0, 0))
@@ -4,22 +4,52 @@ import sys
 
 sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
 
+from game.asset_manifest import (
+    HUD_COIN,
+    HUD_HEART_EMPTY,
+    HUD_HEART_FULL,
+    HUD_HEART_HALF,
+    HUD_KEY,
+    preload_manifest,
+)
 from game.config import load_config
+from game.profiler import SECTIONS
+from ui.text_cache import text_cache
+
+
+# Цвета секций профилировщика в графике отладочного оверлея
+PROFILER_COLORS = {
+    "handle_events": (180, 180, 180),
+    "player.update": (80, 200, 255),
+    "level.update": (0, 120, 255),
+    "camera.update": (160, 100, 255),
+    "level.draw": (255, 170, 0),
+    "player.draw": (255, 100, 60),
+    "hud.draw": (255, 60, 160),
+}
+PROFILER_GRAPH_HEIGHT = 100
+PROFILER_BUDGET_MS = 1000.0 / 60
 
 
 class HUD:
-    def __init__(self, player):
+    def __init__(self, player, profiler=None):
         self.player = player
+        # FrameProfiler (game/profiler.py) для графика в отладочном оверлее
+        self.profiler = profiler
+        self._debug_font = None
+        # Полупрозрачная подложка графика профилировщика (создаётся один раз)
+        self._profiler_background = None
         self.font = pygame.font.Font(None, 36)
         self.ui_config = load_config().ui
 
         # 🔧 СНАЧАЛА объявляем heart_size
         self.heart_size = 30  # Размер сердечек
 
-        # 🔧 ПОТОМ загружаем спрайты сердец
-        self.heart_full = self.load_heart_image("hud/hudHeart_full.png")
-        self.heart_half = self.load_heart_image("hud/hudHeart_half.png")
-        self.heart_empty = self.load_heart_image("hud/hudHeart_empty.png")
+        # 🔧 ПОТОМ загружаем спрайты сердец (все изображения HUD — одним пакетом)
+        preload_manifest("hud")
+        self.heart_full = self.load_heart_image(HUD_HEART_FULL)
+        self.heart_half = self.load_heart_image(HUD_HEART_HALF)
+        self.heart_empty = self.load_heart_image(HUD_HEART_EMPTY)
 
         # 🏆 ЗАГРУЖАЕМ СПРАЙТЫ ДЛЯ НОВЫХ UI ЭЛЕМЕНТОВ
         self.key_size = 30  # Размер иконки ключа
@@ -31,6 +61,17 @@ class HUD:
         # Шрифт для счетчика монет
         self.coin_font = pygame.font.Font(None, 32)
 
+        # Слой с сердцами, ключами и монетами (см. draw): области элементов
+        # на слое, значения, по которым он построен, и области экрана,
+        # изменившиеся при последней перерисовке (для частичного обновления)
+        self.layer = None
+        self.layer_rects = []
+        self.layer_state = None
+        self.dirty_rects = []
+        # Шрифты надписи смерти (создаются один раз, а не в каждом кадре)
+        self.death_font_large = pygame.font.Font(None, 72)
+        self.death_font_small = pygame.font.Font(None, 36)
+
         print("🎯 HUD с сердцами, ключами и монетами инициализирован")
 
     def load_heart_image(self, path):
@@ -56,7 +97,7 @@ class HUD:
             from game.asset_loader import asset_loader
 
             # 🗝️ Загружаем спрайты ключей (используем желтый как основной)
-            self.key_sprite = asset_loader.load_image("Hud/hudKey_yellow.png", 1.0)
+            self.key_sprite = asset_loader.load_image(HUD_KEY, 1.0)
             if self.key_sprite:
                 self.key_sprite = pygame.transform.scale(
                     self.key_sprite, (self.key_size, self.key_size)
@@ -72,7 +113,7 @@ class HUD:
                 )
 
             # 🪙 Загружаем спрайт монеты
-            self.coin_sprite = asset_loader.load_image("Hud/hudCoin.png", 1.0)
+            self.coin_sprite = asset_loader.load_image(HUD_COIN, 1.0)
             if self.coin_sprite:
                 self.coin_sprite = pygame.transform.scale(
                     self.coin_sprite, (self.coin_size, self.coin_size)
@@ -103,44 +144,75 @@ class HUD:
             self.coin_sprite = pygame.Surface((self.coin_size, self.coin_size))
             self.coin_sprite.fill((255, 215, 0))
 
+    def _layer_state(self, screen):
+        """Значения, от которых зависит слой HUD: пока они те же, слой не перерисовывается"""
+        health = getattr(self.player, "health_component", None)
+        return (
+            screen.get_size(),
+            health and (health.current_health, health.max_health),
+            getattr(self.player, "keys", 0),
+            getattr(self.player, "coins", 0),
+            getattr(self.player, "is_alive", True),
+        )
+
+    def _rebuild_layer(self, screen_size, state):
+        """Перерисовывает сердца, ключи и монеты в прозрачный слой"""
+        # 🔥 ИСПРАВЛЕНИЕ: Получаем здоровье напрямую из health_component игрока
+        if hasattr(self.player, "health_component"):
+            # Предполагаем, что health_component имеет current_health и max_health
+            current_health = self.player.health_component.current_health
+            max_health = self.player.health_component.max_health
+        else:
+            # 🔥 РЕЗЕРВНАЯ ЛОГИКА: если health_component нет, используем значения по умолчанию
+            current_health = 100
+            max_health = 100
+            print("⚠️ HealthComponent не найден, используем значения по умолчанию")
+
+        layer = pygame.Surface(screen_size, pygame.SRCALPHA)
+        # 🔧 ОТРИСОВКА СЕРДЕЦ
+        rects = [self.draw_hearts(layer, current_health, max_health)]
+        # 🏆 ОТРИСОВКА КЛЮЧЕЙ И МОНЕТ
+        rects.extend(self.draw_collectibles(layer))
+
+        # Изменившиеся области экрана: где HUD был и где он теперь
+        self.dirty_rects = self.layer_rects + rects
+        self.layer_rects = rects
+        # Слой хранится с предумноженной альфой: наложение на экран даёт
+        # те же пиксели, что и прямая отрисовка элементов
+        self.layer = layer.premul_alpha()
+        self.layer_state = state
+
     def draw(self, screen):
         """Отрисовка HUD с сердцами, ключами и монетами"""
         try:
-            # 🔥 ИСПРАВЛЕНИЕ: Получаем здоровье напрямую из health_component игрока
-            if hasattr(self.player, "health_component"):
-                # Предполагаем, что health_component имеет current_health и max_health
-                current_health = self.player.health_component.current_health
-                max_health = self.player.health_component.max_health
+            # Сердца, ключи и монеты меняются редко: они лежат в готовом слое,
+            # который перерисовывается только при смене здоровья, ключей или монет
+            state = self._layer_state(screen)
+            if state != self.layer_state:
+                self._rebuild_layer(screen.get_size(), state)
             else:
-                # 🔥 РЕЗЕРВНАЯ ЛОГИКА: если health_component нет, используем значения по умолчанию
-                current_health = 100
-                max_health = 100
-                print("⚠️ HealthComponent не найден, используем значения по умолчанию")
-
-            # 🔧 ОТРИСОВКА СЕРДЕЦ
-            self.draw_hearts(screen, current_health, max_health)
-
-            # 🏆 ОТРИСОВКА КЛЮЧЕЙ И МОНЕТ
-            self.draw_collectibles(screen)
+                self.dirty_rects = []
+            for rect in self.layer_rects:
+                screen.blit(
+                    self.layer, rect, rect, special_flags=pygame.BLEND_PREMULTIPLIED
+                )
 
             # 🔥 ОТОБРАЖЕНИЕ СОСТОЯНИЯ ИГРОКА (жив/мертв)
             if hasattr(self.player, "is_alive") and not self.player.is_alive:
                 # 🔥 КРАСИВАЯ НАДПИСЬ СМЕРТИ ПО ЦЕНТРУ
                 screen_width, screen_height = screen.get_size()
 
-                # Создаем большой шрифт для основной надписи
-                death_font_large = pygame.font.Font(None, 72)  # Большой шрифт
-                death_font_small = pygame.font.Font(None, 36)  # Меньший шрифт
-
                 # Основная надпись "ВЫ УМЕРЛИ"
-                death_text = death_font_large.render("ВЫ УМЕРЛИ", True, (255, 0, 0))
+                death_text = text_cache.render(
+                    self.death_font_large, "ВЫ УМЕРЛИ", (255, 0, 0)
+                )
                 death_rect = death_text.get_rect(
                     center=(screen_width // 2, screen_height // 2 - 30)
                 )
 
                 # Вторая надпись "Возрождение..."
-                respawn_text = death_font_small.render(
-                    "Возрождение...", True, (255, 255, 255)
+                respawn_text = text_cache.render(
+                    self.death_font_small, "Возрождение...", (255, 255, 255)
                 )
                 respawn_rect = respawn_text.get_rect(
                     center=(screen_width // 2, screen_height // 2 + 30)
@@ -179,11 +251,11 @@ class HUD:
         except Exception as e:
             print(f"❌ HUD error: {e}")
             # Минимальный HUD при ошибках
-            error_text = self.font.render("HUD ERROR", True, (255, 0, 0))
+            error_text = text_cache.render(self.font, "HUD ERROR", (255, 0, 0))
             screen.blit(error_text, (10, 10))
 
     def draw_hearts(self, screen, current_health, max_health):
-        """Отрисовка системы сердец"""
+        """Отрисовка системы сердец; возвращает занятую область"""
         hearts_count = 3  # 3 сердца
         health_per_heart = 20  # Каждое сердце = 20 HP
 
@@ -208,8 +280,11 @@ class HUD:
 
             x_position += self.heart_size + 5  # Расстояние между сердцами
 
+        return pygame.Rect(10, y_position, x_position - 5 - 10, self.heart_size)
+
     def draw_collectibles(self, screen):
-        """Отрисовка собранных ключей и монет"""
+        """Отрисовка собранных ключей и монет; возвращает занятые области"""
+        rects = []
         # 🏆 Позиционирование - под сердцами, чтобы не было перекрытия
         start_y = 50  # Начинаем ниже сердец
 
@@ -218,48 +293,109 @@ class HUD:
             key_x = 10
             key_y = start_y
 
-            for i in range(min(self.player.keys, 3)):  # Показываем максимум 3 ключа
+            shown = min(self.player.keys, 3)  # Показываем максимум 3 ключа
+            for i in range(shown):
                 screen.blit(self.key_sprite, (key_x, key_y + i * (self.key_size + 5)))
+            rects.append(
+                pygame.Rect(
+                    key_x, key_y, self.key_size, shown * (self.key_size + 5) - 5
+                )
+            )
 
         # 🪙 ОТРИСОВКА СЧЕТЧИКА МОНЕТ (справа вверху)
         if hasattr(self.player, "coins") and self.player.coins > 0:
-            self.draw_coin_counter(screen)
+            rects.append(self.draw_coin_counter(screen))
+        return rects
 
     def draw_coin_counter(self, screen):
-        """Отрисовка счетчика монет с иконкой и количеством"""
+        """Отрисовка счетчика монет с иконкой и количеством; возвращает занятую область"""
         # Позиция в правом верхнем углу
         screen_width = screen.get_width()
         coin_x = screen_width - 100  # Отступ от правого края
         coin_y = 15  # На одном уровне с сердцами
 
         # 🪙 Рисуем иконку монеты
-        screen.blit(self.coin_sprite, (coin_x, coin_y))
+        icon_rect = screen.blit(self.coin_sprite, (coin_x, coin_y))
 
-        # 💰 Рисуем количество монет
+        # 💰 Рисуем количество монет (с тенью для лучшей читаемости);
+        # новый счёт собирается из готовых глифов цифр
         coin_text = f"x {self.player.coins}"
-        text_surface = self.coin_font.render(coin_text, True, (255, 255, 255))
+        text_surface = text_cache.render(
+            self.coin_font, coin_text, (255, 255, 255), shadow=(0, 0, 0), glyphs=True
+        )
         text_x = coin_x + self.coin_size + 5  # Справа от иконки
         text_y = (
-            coin_y + (self.coin_size - text_surface.get_height()) // 2
-        )  # Центрируем по вертикали
-
-        # Добавляем тень для лучшей читаемости
-        shadow_surface = self.coin_font.render(coin_text, True, (0, 0, 0))
-        screen.blit(shadow_surface, (text_x + 1, text_y + 1))
-        screen.blit(text_surface, (text_x, text_y))
+            coin_y + (self.coin_size - self.coin_font.get_height()) // 2
+        )  # Центрируем по вертикали (по высоте текста без тени)
+        return icon_rect.union(screen.blit(text_surface, (text_x, text_y)))
 
     def _draw_debug_overlay(self, screen):
-        """Отрисовка простой отладочной информации (координаты игрока)."""
+        """Отрисовка отладочной информации: координаты игрока и профиль кадра."""
         try:
-            small_font = pygame.font.Font(None, 24)
+            if self._debug_font is None:
+                self._debug_font = pygame.font.Font(None, 24)
+            small_font = self._debug_font
             x, y = self.player.rect.center
             lines = [
-                f"Player: ({x}, {y})",
+                (f"Player: ({x}, {y})", (0, 255, 0)),
             ]
+            profiler = self.profiler
+            if profiler is not None and profiler.enabled and profiler.frames:
+                stats = profiler.stats()
+                for name in SECTIONS + ("frame",):
+                    entry = stats[name]
+                    lines.append(
+                        (
+                            f"{name}: {entry['p50']:.2f} / {entry['p95']:.2f} / "
+                            f"{entry['p99']:.2f} ms",
+                            PROFILER_COLORS.get(name, (255, 255, 255)),
+                        )
+                    )
+                graph_bottom = screen.get_height() - 20 - 20 * len(lines)
+                self._draw_profiler_graph(screen, 10, graph_bottom)
+
             y_pos = screen.get_height() - 10 - 20 * len(lines)
-            for line in lines:
-                text = small_font.render(line, True, (0, 255, 0))
+            for line, color in lines:
+                # Числа меняются каждый кадр: строки собираются из глифов
+                text = text_cache.render(small_font, line, color, glyphs=True)
                 screen.blit(text, (10, y_pos))
                 y_pos += 20
         except Exception as e:
             print(f"HUD debug overlay error: {e}")
+
+    def _draw_profiler_graph(self, screen, left, bottom):
+        """
+        График последних кадров: столбец на кадр, секции сложены снизу вверх.
+        Линия — бюджет кадра 60 FPS, верх графика — два бюджета.
+        """
+        frames = self.profiler.frames
+        width = frames.maxlen or len(frames)
+        height = PROFILER_GRAPH_HEIGHT
+        top = bottom - height
+        background = self._profiler_background
+        if background is None or background.get_size() != (width, height):
+            background = pygame.Surface((width, height), pygame.SRCALPHA)
+            background.fill((0, 0, 0, 140))
+            self._profiler_background = background
+        screen.blit(background, (left, top))
+
+        scale = height / (2 * PROFILER_BUDGET_MS)  # пикселей на миллисекунду
+        colors = [PROFILER_COLORS[name] for name in SECTIONS]
+        x = left + width - len(frames)
+        for row in frames:
+            y = bottom
+            for color, seconds in zip(colors, row):
+                bar = int(seconds * 1000.0 * scale)
+                if bar <= 0:
+                    continue
+                bar = min(bar, y - top)
+                if bar <= 0:
+                    break
+                pygame.draw.line(screen, color, (x, y - 1), (x, y - bar))
+                y -= bar
+            x += 1
+
+        budget_y = bottom - int(PROFILER_BUDGET_MS * scale)
+        pygame.draw.line(
+            screen, (255, 255, 255), (left, budget_y), (left + width - 1, budget_y)
+        )
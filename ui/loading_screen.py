@@ -0,0 +1,34 @@
+import pygame
+
+from ui.text_cache import text_cache
+
+
+class LoadingScreen:
+    """Экран загрузки уровня: заголовок, этап и полоса прогресса"""
+
+    BAR_SIZE = (400, 24)
+
+    def __init__(self, app):
+        self.app = app
+        self.font = pygame.font.Font(None, 36)
+        self.title_font = pygame.font.Font(None, 72)
+
+    def draw(self, screen, progress, stage):
+        screen.fill((30, 30, 60))
+        center_x = screen.get_width() // 2
+        center_y = screen.get_height() // 2
+
+        title = text_cache.render(self.title_font, "Загрузка...", (255, 255, 255))
+        screen.blit(title, title.get_rect(center=(center_x, center_y - 80)))
+
+        # Полоса прогресса
+        bar = pygame.Rect((0, 0), self.BAR_SIZE)
+        bar.center = (center_x, center_y)
+        pygame.draw.rect(screen, (60, 60, 90), bar)
+        filled = bar.copy()
+        filled.width = int(bar.width * max(0.0, min(1.0, progress)))
+        pygame.draw.rect(screen, (255, 215, 0), filled)
+        pygame.draw.rect(screen, (255, 255, 255), bar, 2)
+
+        label = text_cache.render(self.font, stage, (200, 200, 200))
+        screen.blit(label, label.get_rect(center=(center_x, center_y + 50)))
@@ -1,7 +1,10 @@
 import pygame
 import os
 from typing import Optional
-from game.path_utils import resource_path
+from game.asset_loader import asset_loader
+from game.asset_manifest import MENU_BACKGROUND, resolve
+from ui.frame_cache import FrameCache
+from ui.text_cache import text_cache
 
 
 class MainMenu:
@@ -32,6 +35,8 @@ class MainMenu:
 
         # Load background image
         self.background = self.load_background_image()
+        # Готовые статичные кадры экранов меню (фон, затемнение, надписи)
+        self.frames = FrameCache()
 
         # Menu options for standard mode
         self.standard_menu_options = [
@@ -347,17 +352,34 @@ class MainMenu:
         pass
 
     def draw(self, screen):
+        # Если включен режим настроек аудио — рисуем его отдельно
+        if self.settings_mode:
+            self.draw_settings(screen)
+            return
+
+        # Фон, заголовок и невыделенные кнопки берутся из готового кадра
+        options = self.options
+        self.frames.blit(
+            screen,
+            "main",
+            (self.level_completed_mode, self.completed_level_name, tuple(options)),
+            self._draw_main_static,
+        )
+
+        # Поверх рисуется только выделенная кнопка
+        if self.selected_index < len(options):
+            self._draw_main_button(
+                screen, self.selected_index, options[self.selected_index], True
+            )
+
+    def _draw_main_static(self, screen):
+        """Статичная часть главного меню: фон, заголовок и все кнопки без выделения"""
         # Draw the background image if available, otherwise use fallback color
         if self.background:
             screen.blit(self.background, (0, 0))
         else:
             screen.fill((30, 30, 60))
 
-        # Если включен режим настроек аудио — рисуем его отдельно
-        if self.settings_mode:
-            self.draw_settings(screen)
-            return
-
         # Create a semi-transparent overlay for better text visibility
         overlay = pygame.Surface(
             (screen.get_width(), screen.get_height()), pygame.SRCALPHA
@@ -370,52 +392,47 @@ class MainMenu:
             title_text = "УРОВЕНЬ ПРОЙДЕН"
             if self.completed_level_name:
                 title_text += f" ({self.completed_level_name})"
-            title = self.title_font.render(title_text, True, (255, 255, 0))
+            title = text_cache.render(self.title_font, title_text, (255, 255, 0))
         else:
-            title = self.title_font.render("2D PLATFORMER", True, (255, 255, 255))
+            title = text_cache.render(self.title_font, "2D PLATFORMER", (255, 255, 255))
 
         screen.blit(title, (screen.get_width() // 2 - title.get_width() // 2, 100))
 
         # Опции меню
+        for i, option in enumerate(self.options):
+            self._draw_main_button(screen, i, option, False)
+
+    def _draw_main_button(self, screen, i, option, selected):
+        """Кнопка пункта меню; выделенная целиком закрывает невыделенную"""
         button_width, button_height, base_y, spacing = self._get_main_menu_layout(
             screen
         )
 
-        for i, option in enumerate(self.options):
-            # Button background rectangle
-            button_x = screen.get_width() // 2 - button_width // 2
-            button_y = base_y + i * spacing
-            button_rect = pygame.Rect(button_x, button_y, button_width, button_height)
+        # Button background rectangle
+        button_x = screen.get_width() // 2 - button_width // 2
+        button_y = base_y + i * spacing
+        button_rect = pygame.Rect(button_x, button_y, button_width, button_height)
 
-            # Draw button background with highlight for selected item
-            if i == self.selected_index:
-                pygame.draw.rect(
-                    screen, (100, 100, 100, 180), button_rect, border_radius=10
-                )
-                pygame.draw.rect(
-                    screen, (255, 255, 255), button_rect, 3, border_radius=10
-                )
-            else:
-                pygame.draw.rect(
-                    screen, (50, 50, 50, 180), button_rect, border_radius=10
-                )
-                pygame.draw.rect(
-                    screen, (200, 200, 200), button_rect, 2, border_radius=10
-                )
+        # Draw button background with highlight for selected item
+        if selected:
+            pygame.draw.rect(screen, (100, 100, 100, 180), button_rect, border_radius=10)
+            pygame.draw.rect(screen, (255, 255, 255), button_rect, 3, border_radius=10)
+        else:
+            pygame.draw.rect(screen, (50, 50, 50, 180), button_rect, border_radius=10)
+            pygame.draw.rect(screen, (200, 200, 200), button_rect, 2, border_radius=10)
 
-            # Draw text
-            color = (255, 255, 0) if i == self.selected_index else (255, 255, 255)
-            text = self.font.render(option, True, color)
-            text_rect = text.get_rect(center=button_rect.center)
-            screen.blit(text, text_rect)
+        # Draw text
+        color = (255, 255, 0) if selected else (255, 255, 255)
+        text = text_cache.render(self.font, option, color)
+        text_rect = text.get_rect(center=button_rect.center)
+        screen.blit(text, text_rect)
 
     def load_background_image(self):
         """Загрузка фонового изображения для меню."""
         try:
-            # Get the path to the background image using resource_path
-            background_path = resource_path(
-                "game", "assets", "Backgrounds", "colored_land.png"
-            )
+            # Путь из манифеста экрана меню (с проверкой регистра)
+            ((name, _scale),) = resolve((MENU_BACKGROUND,))
+            background_path = os.path.join(asset_loader.base_path, name)
 
             # Load and scale the image to fit the screen
             background = pygame.image.load(background_path).convert()
@@ -578,8 +595,8 @@ class MainMenu:
         except Exception as e:
             print(f"[Audio] WARNING: cannot save settings from menu: {e}")
 
-    def draw_settings(self, screen):
-        """Отрисовка простого меню аудио-настроек."""
+    def _draw_settings_static(self, screen, audio_missing):
+        """Статичная часть настроек: фон, заголовок и панель"""
         # Draw the background image if available, otherwise use fallback color
         if self.background:
             screen.blit(self.background, (0, 0))
@@ -593,7 +610,7 @@ class MainMenu:
         overlay.fill((0, 0, 0, 80))  # Semi-transparent black overlay
         screen.blit(overlay, (0, 0))
 
-        title = self.title_font.render("НАСТРОЙКИ ЗВУКА", True, (255, 255, 255))
+        title = text_cache.render(self.title_font, "НАСТРОЙКИ ЗВУКА", (255, 255, 255))
         screen.blit(title, (screen.get_width() // 2 - title.get_width() // 2, 60))
 
         # Добавляем фон для настроек (панель достаточно большая, чтобы все слайдеры и кнопки были внутри)
@@ -620,17 +637,29 @@ class MainMenu:
         # Обводка панели
         pygame.draw.rect(screen, (100, 100, 120), panel_rect, 2, border_radius=15)
 
-        panel_center_x = panel_x + panel_width // 2
-
-        audio = getattr(self.app, "audio", None)
-        if audio is None:
-            info = self.font.render("Аудиосистема недоступна", True, (255, 100, 100))
+        if audio_missing:
+            info = text_cache.render(
+                self.font, "Аудиосистема недоступна", (255, 100, 100)
+            )
             screen.blit(
                 info,
                 (screen.get_width() // 2 - info.get_width() // 2, 200),
             )
+
+    def draw_settings(self, screen):
+        """Отрисовка простого меню аудио-настроек."""
+        audio = getattr(self.app, "audio", None)
+        # Фон, заголовок и панель берутся из готового кадра
+        self.frames.blit(
+            screen,
+            "settings",
+            audio is None,
+            lambda frame: self._draw_settings_static(frame, audio is None),
+        )
+        if audio is None:
             return
 
+        panel_center_x = screen.get_width() // 2
         base_y = 200
         slider_x = panel_center_x - self.slider_width // 2
 
@@ -652,8 +681,8 @@ class MainMenu:
                 # Рисуем название опции над слайдером
                 label_text = opt.replace("Громкость ", "")
                 label_y = base_y + i * self.option_spacing - 22
-                text = self.font.render(
-                    f"{label_text}: {int(volume_value * 100)}%", True, color
+                text = text_cache.render(
+                    self.font, f"{label_text}: {int(volume_value * 100)}%", color
                 )
                 # Центрируем текст, но размещаем его выше слайдера
                 text_rect = text.get_rect(center=(panel_center_x, label_y))
@@ -763,7 +792,7 @@ class MainMenu:
                 label = opt
                 if opt == "Mute / Unmute":
                     label = f"{opt}: {'ON' if audio.settings.muted else 'OFF'}"
-                text = self.settings_font.render(label, True, color)
+                text = text_cache.render(self.settings_font, label, color)
                 text_rect = text.get_rect(
                     center=(panel_center_x, base_y + i * self.option_spacing)
                 )
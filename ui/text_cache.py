@@ -0,0 +1,95 @@
+# ui/text_cache.py
+"""
+Кэш отрисованного текста для HUD, меню и титров.
+
+font.render растеризует строку заново при каждом вызове, хотя почти весь
+текст интерфейса от кадра к кадру не меняется. TextCache хранит готовые
+поверхности по ключу (шрифт, строка, цвет, цвет тени) в LRU ограниченного
+размера, так что в установившемся кадре шрифт не растеризуется вовсе.
+
+Для часто меняющихся чисел (счётчик монет, отладочный оверлей) строка
+собирается из закэшированных глифов: новый счёт — это несколько blit, а не
+растеризация всей строки.
+"""
+
+from collections import OrderedDict
+
+import pygame
+
+# Сколько готовых строк хранится одновременно
+MAX_ENTRIES = 256
+# Смещение тени относительно текста
+SHADOW_OFFSET = (1, 1)
+
+
+class TextCache:
+    def __init__(self, max_entries=MAX_ENTRIES):
+        self.max_entries = max_entries
+        self.entries = OrderedDict()  # (font, text, color, shadow, glyphs) -> Surface
+        self.glyphs = {}  # (font, символ, цвет) -> Surface
+        # Статистика: попадания в кэш и вызовы font.render
+        self.hits = 0
+        self.rasterized = 0
+
+    def clear(self):
+        self.entries.clear()
+        self.glyphs.clear()
+
+    def render(self, font, text, color, shadow=None, glyphs=False):
+        """
+        Поверхность строки text цветом color. shadow — цвет тени, смещённой
+        на SHADOW_OFFSET (тень и текст на одной поверхности). glyphs=True —
+        строка собирается из отдельных глифов, для меняющихся чисел.
+        """
+        key = (font, text, tuple(color), shadow and tuple(shadow), glyphs)
+        surface = self.entries.get(key)
+        if surface is not None:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        draw = self._compose_glyphs if glyphs else self._rasterize
+        if shadow is None:
+            surface = draw(font, text, color)
+        else:
+            text_surface = draw(font, text, color)
+            shadow_surface = draw(font, text, shadow)
+            width, height = text_surface.get_size()
+            surface = pygame.Surface(
+                (width + SHADOW_OFFSET[0], height + SHADOW_OFFSET[1]), pygame.SRCALPHA
+            )
+            surface.blit(shadow_surface, SHADOW_OFFSET)
+            surface.blit(text_surface, (0, 0))
+
+        self.entries[key] = surface
+        if len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+        return surface
+
+    def _rasterize(self, font, text, color):
+        self.rasterized += 1
+        return font.render(text, True, color)
+
+    def _glyph(self, font, char, color):
+        key = (font, char, tuple(color))
+        glyph = self.glyphs.get(key)
+        if glyph is None:
+            if len(self.glyphs) >= self.max_entries:
+                self.glyphs.clear()
+            glyph = self.glyphs[key] = self._rasterize(font, char, color)
+        return glyph
+
+    def _compose_glyphs(self, font, text, color):
+        """Строка из закэшированных глифов, по ширине каждого глифа"""
+        glyphs = [self._glyph(font, char, color) for char in text]
+        width = sum(glyph.get_width() for glyph in glyphs)
+        surface = pygame.Surface((width, font.get_height()), pygame.SRCALPHA)
+        x = 0
+        for glyph in glyphs:
+            surface.blit(glyph, (x, 0))
+            x += glyph.get_width()
+        return surface
+
+
+# Общий кэш интерфейса (шрифты у HUD, меню и титров свои, ключи не пересекаются)
+text_cache = TextCache()